@@ -0,0 +1,387 @@
+"""
+Session Index Module
+
+Derived SQLite indexes used by the API's list/search endpoints:
+- SessionIndex: sessions and findings from ~/.agent-core/sessions/<id>/*.json
+- KnowledgeIndex: FTS5 over the ~/.claude/memory knowledge base for keyword search
+
+The JSON files remain the source of truth. Each session row stores a
+signature (max mtime of the session's metadata files), so a refresh only
+re-reads sessions that changed on disk and list/search become one indexed
+query instead of re-parsing every session per request.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, List, Dict, Any
+
+# Index locations
+INDEX_PATH = Path.home() / ".agent-core" / "sessions.sqlite"
+KNOWLEDGE_INDEX_PATH = Path.home() / ".claude" / "memory" / "knowledge.sqlite"
+
+KNOWLEDGE_CATEGORIES = ("facts", "decisions", "patterns")
+
+# Files whose changes invalidate a session's row
+SESSION_FILES = (
+    "session.json",
+    "urls_captured.json",
+    "findings_captured.json",
+    "findings_evidenced.json",
+    "findings.jsonl.folding",
+    "findings.jsonl",
+)
+
+# Minimum seconds between two directory scans
+REFRESH_INTERVAL_SECONDS = 2.0
+
+SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    topic TEXT,
+    status TEXT,
+    project TEXT,
+    url_count INTEGER DEFAULT 0,
+    finding_count INTEGER DEFAULT 0,
+    created_at TEXT,
+    signature INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS findings (
+    session_id TEXT NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    id TEXT,
+    content TEXT,
+    type TEXT,
+    confidence REAL,
+    sources TEXT,  -- JSON array
+    needs_review INTEGER,
+    PRIMARY KEY (session_id, position)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sessions_project_status ON sessions(project, status, id);
+CREATE INDEX IF NOT EXISTS idx_findings_type ON findings(type);
+"""
+
+
+class SessionIndex:
+    """SQLite index of session metadata and findings."""
+
+    def __init__(self, sessions_dir: Path, db_path: Path = INDEX_PATH):
+        self.sessions_dir = sessions_dir
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._last_refresh = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(SCHEMA)
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._conn = conn
+        return self._conn
+
+    def _signature(self, entry: os.DirEntry) -> int:
+        """Max mtime_ns over the session directory and its metadata files.
+
+        The directory's own mtime moves when a file is deleted or renamed
+        over, which the files' mtimes alone would miss.
+        """
+        try:
+            signature = entry.stat().st_mtime_ns
+        except OSError:
+            signature = 0
+        for name in SESSION_FILES:
+            try:
+                signature = max(signature, os.stat(os.path.join(entry.path, name)).st_mtime_ns)
+            except OSError:
+                continue
+        return signature
+
+    def refresh(
+        self,
+        load_metadata: Callable[[str], Dict[str, Any]],
+        load_findings: Callable[[str], List[Dict[str, Any]]],
+        force: bool = False,
+    ) -> None:
+        """Bring the index in line with the session directories on disk.
+
+        Args:
+            load_metadata: Returns the SessionSummary-shaped dict for an ID
+            load_findings: Returns the evidenced findings list for an ID
+            force: Scan even if the last scan was very recent
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < REFRESH_INTERVAL_SECONDS:
+            return
+
+        with self._lock:
+            conn = self._connect()
+            known = {
+                row["id"]: row["signature"]
+                for row in conn.execute("SELECT id, signature FROM sessions")
+            }
+
+            seen = set()
+            if self.sessions_dir.exists():
+                with os.scandir(self.sessions_dir) as it:
+                    for entry in it:
+                        if not entry.is_dir():
+                            continue
+                        seen.add(entry.name)
+                        signature = self._signature(entry)
+                        if known.get(entry.name) != signature:
+                            self._upsert(conn, entry.name, signature, load_metadata, load_findings)
+
+            stale = [(session_id,) for session_id in known if session_id not in seen]
+            if stale:
+                conn.executemany("DELETE FROM sessions WHERE id = ?", stale)
+
+            conn.commit()
+            self._last_refresh = now
+
+    def _upsert(
+        self,
+        conn: sqlite3.Connection,
+        session_id: str,
+        signature: int,
+        load_metadata: Callable[[str], Dict[str, Any]],
+        load_findings: Callable[[str], List[Dict[str, Any]]],
+    ) -> None:
+        metadata = load_metadata(session_id)
+        conn.execute(
+            """INSERT OR REPLACE INTO sessions
+               (id, topic, status, project, url_count, finding_count, created_at, signature, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                session_id,
+                metadata.get("topic"),
+                metadata.get("status", "archived"),
+                metadata.get("project"),
+                metadata.get("url_count", 0),
+                metadata.get("finding_count", 0),
+                metadata.get("created_at"),
+                signature,
+                time.time_ns(),
+            ),
+        )
+
+        conn.execute("DELETE FROM findings WHERE session_id = ?", (session_id,))
+        findings = load_findings(session_id)
+        if not isinstance(findings, list):
+            return
+        conn.executemany(
+            """INSERT INTO findings
+               (session_id, position, id, content, type, confidence, sources, needs_review)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    session_id,
+                    position,
+                    f.get("id", "unknown"),
+                    f.get("content", ""),
+                    f.get("type", "finding"),
+                    f.get("evidence", {}).get("confidence", 0.0),
+                    json.dumps(f.get("evidence", {}).get("sources", [])),
+                    int(bool(f.get("needs_review", False))),
+                )
+                for position, f in enumerate(findings)
+                if isinstance(f, dict)
+            ],
+        )
+
+    def version(self) -> str:
+        """Cheap fingerprint of the index contents (changes on any upsert/delete)."""
+        with self._lock:
+            max_updated, count = self._connect().execute(
+                "SELECT MAX(updated_at), COUNT(*) FROM sessions"
+            ).fetchone()
+        return f"{max_updated or 0}:{count}"
+
+    def list_sessions(
+        self,
+        limit: int,
+        project: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Sessions newest-first (by ID, matching the directory ordering)."""
+        sql = "SELECT id, topic, status, project, url_count, finding_count, created_at FROM sessions"
+        clauses, params = [], []
+        if project:
+            clauses.append("project = ?")
+            params.append(project)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def search_findings(
+        self,
+        limit: int,
+        type: Optional[str] = None,
+        project: Optional[str] = None,
+        needs_review: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """Findings across all sessions, filtered in SQL."""
+        sql = """SELECT f.id, f.session_id, f.content, f.type, f.confidence, f.sources, f.needs_review
+                 FROM findings f"""
+        clauses, params = [], []
+        if project:
+            sql += " JOIN sessions s ON s.id = f.session_id"
+            clauses.append("s.project = ?")
+            params.append(project)
+        if type:
+            clauses.append("f.type = ?")
+            params.append(type)
+        if needs_review is not None:
+            clauses.append("f.needs_review = ?")
+            params.append(int(needs_review))
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY f.session_id, f.position LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [
+            {
+                **dict(row),
+                "sources": json.loads(row["sources"] or "[]"),
+                "needs_review": bool(row["needs_review"]),
+            }
+            for row in rows
+        ]
+
+
+KNOWLEDGE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS knowledge_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5(
+    content,
+    category UNINDEXED,
+    tags UNINDEXED  -- JSON array
+);
+"""
+
+
+class KnowledgeIndex:
+    """FTS5 index over the knowledge base, rebuilt when its source changes."""
+
+    def __init__(self, db_path: Path = KNOWLEDGE_INDEX_PATH):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.available = True
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.available:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                conn.executescript(KNOWLEDGE_SCHEMA)
+                self._conn = conn
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5
+                self.available = False
+        return self._conn
+
+    def _sync(
+        self,
+        conn: sqlite3.Connection,
+        signature: str,
+        load_knowledge: Callable[[], Any],
+    ) -> None:
+        """Rebuild the FTS table if the source signature changed since the last build."""
+        row = conn.execute("SELECT value FROM knowledge_meta WHERE key = 'signature'").fetchone()
+        if row and row[0] == signature:
+            return
+
+        knowledge = load_knowledge()
+        if not isinstance(knowledge, dict):
+            knowledge = {}
+
+        conn.execute("DELETE FROM knowledge_fts")
+        conn.executemany(
+            "INSERT INTO knowledge_fts (content, category, tags) VALUES (?, ?, ?)",
+            [
+                (item.get("content", ""), category, json.dumps(item.get("tags", [])))
+                for category in KNOWLEDGE_CATEGORIES
+                for item in knowledge.get(category, [])
+                if isinstance(item, dict)
+            ],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO knowledge_meta (key, value) VALUES ('signature', ?)",
+            (signature,),
+        )
+        conn.commit()
+
+    def search(
+        self,
+        query: str,
+        categories: List[str],
+        limit: int,
+        signature: str,
+        load_knowledge: Callable[[], Any],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """BM25-ranked keyword search.
+
+        Args:
+            signature: Opaque fingerprint of the source files (e.g. mtimes)
+            load_knowledge: Returns the knowledge dict, called on rebuild only
+
+        Returns None when FTS5 is unavailable so callers can fall back.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            self._sync(conn, signature, load_knowledge)
+
+            # Quote every term so user input is never parsed as FTS syntax
+            match = " OR ".join('"' + t.replace('"', '""') + '"' for t in terms)
+            placeholders = ",".join("?" * len(categories))
+            rows = conn.execute(
+                f"""SELECT content, category, tags, bm25(knowledge_fts) AS score
+                    FROM knowledge_fts
+                    WHERE knowledge_fts MATCH ? AND category IN ({placeholders})
+                    ORDER BY score LIMIT ?""",
+                [match, *categories, limit],
+            ).fetchall()
+
+        # bm25() is negative (more negative = better); rescale so the best
+        # hit scores 1.0 and the rest are relative to it
+        best = -rows[0][3] if rows else 0.0
+        return [
+            {
+                "content": content,
+                "category": category,
+                "tags": json.loads(tags or "[]"),
+                "similarity": (-score / best) if best > 0 else 0.0,
+            }
+            for content, category, tags, score in rows
+        ]
@@ -14,9 +14,13 @@ Components:
 
 import os
 import re
+import time
+import string
+import hashlib
 import secrets
 import logging
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -27,6 +31,7 @@ logger = logging.getLogger("researchgravity.security")
 try:
     from fastapi import HTTPException, Security, Depends, Request
     from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
+    from fastapi.concurrency import run_in_threadpool
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
@@ -38,6 +43,12 @@ except ImportError:
     JWT_AVAILABLE = False
     logger.warning("PyJWT not installed. Run: pip install PyJWT")
 
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
 try:
     from slowapi import Limiter
     from slowapi.util import get_remote_address
@@ -58,14 +69,32 @@ SECRET_KEY = os.environ.get("RG_SECRET_KEY", secrets.token_hex(32))
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 
+# One reusable PyJWT instance (no per-call option dicts or algorithm lists):
+# a single verified pass that also enforces the claims create_access_token
+# always sets.
+_ALLOWED_ALGORITHMS = (ALGORITHM,)
+_JWT = (
+    jwt.PyJWT(options={"require": ["exp", "iat"], "verify_signature": True})
+    if JWT_AVAILABLE else None
+)
+
+# Decoded token payloads are reused for at most this long (never past "exp")
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 10000
+
 # API key for service-to-service auth
 API_KEY = os.environ.get("RG_API_KEY", None)
+_API_KEY_BYTES = API_KEY.encode() if API_KEY else None
 
 # Rate limits
 RATE_LIMIT_DEFAULT = "60/minute"
 RATE_LIMIT_SEARCH = "10/minute"
 RATE_LIMIT_WRITE = "30/minute"
 
+# Rate-limit storage. In-memory limits are per worker process; point this at
+# Redis (e.g. "redis://localhost:6379/0") to share limits across uvicorn workers.
+RATE_LIMIT_STORAGE_URI = os.environ.get("RG_RATELIMIT_REDIS", "memory://")
+
 
 # =============================================================================
 # Input Validation
@@ -76,6 +105,13 @@ SAFE_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_\-\.]+$')
 SAFE_SESSION_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]+$')
 SAFE_PROJECT_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]+$')
 
+# Character whitelists equivalent to the patterns above. A single C-level
+# issuperset() pass replaces the regex match plus the separate "..", "/" and
+# "\\" scans, and rejects all of them implicitly.
+_ALLOWED_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-.")
+_ALLOWED_SESSION_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_ALLOWED_PROJECT_CHARS = _ALLOWED_SESSION_CHARS
+
 
 def validate_session_id(session_id: str) -> str:
     """Validate session ID to prevent path traversal attacks.
@@ -95,17 +131,13 @@ def validate_session_id(session_id: str) -> str:
     if len(session_id) > 100:
         raise HTTPException(status_code=400, detail="Session ID too long")
 
-    if not SAFE_SESSION_ID_PATTERN.match(session_id):
+    # Whitelist excludes ".", "/" and "\\", so traversal attempts fail here too
+    if not _ALLOWED_SESSION_CHARS.issuperset(session_id):
         raise HTTPException(
             status_code=400,
             detail="Invalid session ID format. Only alphanumeric, underscore, and hyphen allowed."
         )
 
-    # Additional check for path traversal attempts
-    if ".." in session_id or "/" in session_id or "\\" in session_id:
-        logger.warning(f"Path traversal attempt detected: {session_id}")
-        raise HTTPException(status_code=400, detail="Invalid session ID")
-
     return session_id
 
 
@@ -117,7 +149,7 @@ def validate_project_id(project_id: str) -> str:
     if len(project_id) > 50:
         raise HTTPException(status_code=400, detail="Project ID too long")
 
-    if not SAFE_PROJECT_PATTERN.match(project_id):
+    if not _ALLOWED_PROJECT_CHARS.issuperset(project_id):
         raise HTTPException(
             status_code=400,
             detail="Invalid project ID format"
@@ -134,7 +166,7 @@ def validate_id(id_value: str, id_type: str = "ID") -> str:
     if len(id_value) > 200:
         raise HTTPException(status_code=400, detail=f"{id_type} too long")
 
-    if not SAFE_ID_PATTERN.match(id_value):
+    if not _ALLOWED_ID_CHARS.issuperset(id_value):
         raise HTTPException(status_code=400, detail=f"Invalid {id_type} format")
 
     return id_value
@@ -148,6 +180,56 @@ if FASTAPI_AVAILABLE:
     security = HTTPBearer(auto_error=False)
     api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Verified payloads keyed by a truncated SHA-256 of the raw token.
+# Values are (payload, expires_at) so entries never outlive the token itself.
+_token_cache = (
+    TTLCache(maxsize=TOKEN_CACHE_MAX_SIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
+    if CACHETOOLS_AVAILABLE else None
+)
+# TTLCache isn't thread-safe and decode_token() fills it from threadpool workers
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash a token for use as a cache key (raw tokens are never stored)."""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _get_cached_token(token: str) -> Optional[Dict[str, Any]]:
+    """Return a previously verified payload for this token, if still valid."""
+    if _token_cache is None:
+        return None
+
+    key = _token_cache_key(token)
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is None:
+            return None
+
+        payload, expires_at = cached
+        if time.time() >= expires_at:
+            _token_cache.pop(key, None)
+            return None
+
+    return dict(payload)
+
+
+def _cache_token(token: str, payload: Dict[str, Any]) -> None:
+    """Remember a verified payload, clamped to the token's own expiry."""
+    if _token_cache is None:
+        return
+
+    now = time.time()
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+
+    if expires_at > now:
+        key = _token_cache_key(token)
+        with _token_cache_lock:
+            _token_cache[key] = (payload, expires_at)
+
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token.
@@ -162,11 +244,13 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     if not JWT_AVAILABLE:
         raise HTTPException(status_code=500, detail="JWT not available")
 
+    # Integer epochs, read from the clock once (PyJWT stores ints anyway)
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+    now_ts = int(time.time())
+    expires_seconds = int((expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)).total_seconds())
+    to_encode.update({"exp": now_ts + expires_seconds, "iat": now_ts})
 
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return _JWT.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
 def decode_token(token: str) -> Dict[str, Any]:
@@ -184,15 +268,23 @@ def decode_token(token: str) -> Dict[str, Any]:
     if not JWT_AVAILABLE:
         raise HTTPException(status_code=500, detail="JWT not available")
 
+    cached = _get_cached_token(token)
+    if cached is not None:
+        return cached
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = _JWT.decode(token, SECRET_KEY, algorithms=_ALLOWED_ALGORITHMS)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except jwt.InvalidTokenError as e:
+        # Also covers MissingRequiredClaimError for tokens without exp/iat
         logger.warning(f"Invalid token: {e}")
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    # Only successfully verified tokens reach the cache
+    _cache_token(token, payload)
+    return dict(payload)
+
 
 if FASTAPI_AVAILABLE:
     async def get_current_user(
@@ -215,13 +307,16 @@ if FASTAPI_AVAILABLE:
         """
         # Check API key first
         if api_key:
-            if API_KEY and api_key == API_KEY:
+            if _API_KEY_BYTES and secrets.compare_digest(api_key.encode(), _API_KEY_BYTES):
                 return {"type": "api_key", "scope": "full"}
             raise HTTPException(status_code=401, detail="Invalid API key")
 
-        # Check JWT
+        # Check JWT (cache hits stay on the event loop; HMAC verify runs in a thread)
         if credentials:
-            return decode_token(credentials.credentials)
+            cached = _get_cached_token(credentials.credentials)
+            if cached is not None:
+                return cached
+            return await run_in_threadpool(decode_token, credentials.credentials)
 
         raise HTTPException(
             status_code=401,
@@ -245,7 +340,13 @@ if FASTAPI_AVAILABLE:
 # =============================================================================
 
 if RATELIMIT_AVAILABLE:
-    limiter = Limiter(key_func=get_remote_address)
+    # moving-window on Redis runs as an atomic Lua script in the limits backend
+    # (trim expired entries + count + add in one round-trip)
+    limiter = Limiter(
+        key_func=get_remote_address,
+        storage_uri=RATE_LIMIT_STORAGE_URI,
+        strategy="moving-window",
+    )
 
     def get_limiter() -> Limiter:
         """Get the rate limiter instance."""
@@ -261,22 +362,20 @@ else:
 # Request Logging Middleware
 # =============================================================================
 
-import uuid
 from contextvars import ContextVar
 
 request_id_var: ContextVar[str] = ContextVar('request_id', default='')
 
 
 def generate_request_id() -> str:
-    """Generate a unique request ID."""
-    return str(uuid.uuid4())[:8]
+    """Generate a unique request ID (8 hex chars, no UUID object)."""
+    return secrets.token_hex(4)
 
 
 if FASTAPI_AVAILABLE:
     from starlette.middleware.base import BaseHTTPMiddleware
     from starlette.requests import Request
     from starlette.responses import Response
-    import time
 
     class RequestLoggingMiddleware(BaseHTTPMiddleware):
         """Middleware to log all requests with timing and request ID."""
@@ -288,22 +387,23 @@ if FASTAPI_AVAILABLE:
             # Add request ID to request state
             request.state.request_id = request_id
 
-            # Log request
-            start_time = time.time()
-            logger.info(f"[{request_id}] {request.method} {request.url.path}")
+            # Log request (skip message formatting when INFO is disabled)
+            start_ns = time.perf_counter_ns()
+            log_info = logger.isEnabledFor(logging.INFO)
+            if log_info:
+                logger.info(f"[{request_id}] {request.method} {request.url.path}")
 
             # Process request
             try:
                 response = await call_next(request)
 
-                # Calculate duration
-                duration = (time.time() - start_time) * 1000
-
                 # Log response
-                logger.info(
-                    f"[{request_id}] {request.method} {request.url.path} "
-                    f"-> {response.status_code} ({duration:.1f}ms)"
-                )
+                if log_info:
+                    duration = (time.perf_counter_ns() - start_ns) / 1e6
+                    logger.info(
+                        f"[{request_id}] {request.method} {request.url.path} "
+                        f"-> {response.status_code} ({duration:.1f}ms)"
+                    )
 
                 # Add request ID to response headers
                 response.headers["X-Request-ID"] = request_id
@@ -311,7 +411,7 @@ if FASTAPI_AVAILABLE:
                 return response
 
             except Exception as e:
-                duration = (time.time() - start_time) * 1000
+                duration = (time.perf_counter_ns() - start_ns) / 1e6
                 logger.error(
                     f"[{request_id}] {request.method} {request.url.path} "
                     f"-> ERROR: {str(e)} ({duration:.1f}ms)"
@@ -323,10 +423,18 @@ if FASTAPI_AVAILABLE:
 # Error Response Standardization
 # =============================================================================
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List
 
 
+def _utc_timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _current_request_id() -> Optional[str]:
+    return request_id_var.get() or None
+
+
 class ErrorDetail(BaseModel):
     """Standardized error detail."""
     code: str
@@ -340,15 +448,8 @@ class ErrorResponse(BaseModel):
     error_code: str
     message: str
     details: Optional[List[ErrorDetail]] = None
-    request_id: Optional[str] = None
-    timestamp: str = None
-
-    def __init__(self, **data):
-        if 'timestamp' not in data or data['timestamp'] is None:
-            data['timestamp'] = datetime.utcnow().isoformat()
-        if 'request_id' not in data or data['request_id'] is None:
-            data['request_id'] = request_id_var.get() or None
-        super().__init__(**data)
+    request_id: Optional[str] = Field(default_factory=_current_request_id)
+    timestamp: str = Field(default_factory=_utc_timestamp)
 
 
 def create_error_response(
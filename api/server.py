@@ -20,7 +20,12 @@ Usage:
 """
 
 import json
+import os
 import sys
+import hashlib
+import functools
+import threading
+import contextlib
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
@@ -37,8 +42,29 @@ try:
 except ImportError:
     pass
 
+# Fast JSON (optional, falls back to stdlib json)
 try:
-    from fastapi import FastAPI, HTTPException, Query
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Cross-process file locking (POSIX only)
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Native path sandboxing (optional)
+try:
+    from path_jail import Jail
+    PATH_JAIL_AVAILABLE = True
+except ImportError:
+    PATH_JAIL_AVAILABLE = False
+
+try:
+    from fastapi import FastAPI, HTTPException, Query, Response
     from fastapi.middleware.cors import CORSMiddleware
     from pydantic import BaseModel
     FASTAPI_AVAILABLE = True
@@ -111,16 +137,20 @@ if FASTAPI_AVAILABLE:
         app.state.limiter = limiter
         app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-    # CORS for local development
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["http://localhost:3000", "http://localhost:5173", "http://localhost:5174", "http://localhost:5175", "http://localhost:8080"],
-        allow_credentials=True,
-        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],  # Explicit methods instead of "*"
-        allow_headers=["*"],
-        expose_headers=["X-Request-ID"],  # Expose request ID header
-        max_age=3600,
-    )
+    # CORS for browser clients: opt-in via RG_CORS_ORIGINS (comma-separated),
+    # e.g. "http://localhost:3000,http://localhost:5173" for local development.
+    # Unset means no CORS layer at all, one less middleware per request.
+    CORS_ORIGINS = [o.strip() for o in os.environ.get("RG_CORS_ORIGINS", "").split(",") if o.strip()]
+    if CORS_ORIGINS:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=CORS_ORIGINS,
+            allow_credentials=True,
+            allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],  # Explicit methods instead of "*"
+            allow_headers=["*"],
+            expose_headers=["X-Request-ID"],  # Expose request ID header
+            max_age=3600,
+        )
 
     # Include intelligence routes (V2)
     try:
@@ -134,6 +164,27 @@ AGENT_CORE_DIR = Path.home() / ".agent-core"
 SESSIONS_DIR = AGENT_CORE_DIR / "sessions"
 MEMORY_DIR = Path.home() / ".claude" / "memory"
 
+# Derived index over SESSIONS_DIR for list/search endpoints
+from api.index import SessionIndex, KnowledgeIndex
+_session_index = SessionIndex(SESSIONS_DIR)
+_knowledge_index = KnowledgeIndex()
+
+# Knowledge base: knowledge.json is the compacted snapshot, knowledge.jsonl an
+# append-only log of entries written since the last compaction. Compaction
+# renames the log aside (knowledge.jsonl.compacting) before folding it in.
+KNOWLEDGE_FILE = MEMORY_DIR / "knowledge.json"
+KNOWLEDGE_LOG_FILE = MEMORY_DIR / "knowledge.jsonl"
+KNOWLEDGE_COMPACTING_FILE = MEMORY_DIR / "knowledge.jsonl.compacting"
+KNOWLEDGE_LOCK_FILE = MEMORY_DIR / "knowledge.lock"
+KNOWLEDGE_COMPACT_EVERY = 50
+KNOWLEDGE_READ_ATTEMPTS = 3
+_knowledge_write_lock = threading.Lock()
+_knowledge_writes = {"pending": 0}
+
+# Context packs, parsed once per change of the packs directory
+PACKS_DIR = AGENT_CORE_DIR / "packs"
+_packs_cache: dict = {"dir_mtime": None, "entries": []}
+
 
 # ============================================================
 # Pydantic Models (only if FastAPI available)
@@ -236,6 +287,18 @@ async def get_storage():
     return _storage_engine
 
 
+_meta_engine = None
+
+
+async def get_meta_learning():
+    """Get the shared meta-learning engine (keeps its caches across requests)."""
+    global _meta_engine
+    if _meta_engine is None:
+        from storage.meta_learning import get_meta_engine
+        _meta_engine = await get_meta_engine()
+    return _meta_engine
+
+
 if FASTAPI_AVAILABLE:
     @app.on_event("startup")
     async def startup_event():
@@ -253,6 +316,9 @@ if FASTAPI_AVAILABLE:
     @app.on_event("shutdown")
     async def shutdown_event():
         """Clean up storage engine."""
+        compact_knowledge()
+        if _meta_engine:
+            await _meta_engine.close()
         if _storage_engine:
             await _storage_engine.close()
 
@@ -261,19 +327,249 @@ if FASTAPI_AVAILABLE:
 # Helper Functions
 # ============================================================
 
+_sessions_jail = None
+
+
+def get_session_dir(session_id: str) -> Path:
+    """Resolve a session directory inside SESSIONS_DIR.
+
+    With path-jail installed, joining and canonicalizing happen in one native
+    call that also rejects symlink escapes. Without it, the ID validators are
+    the only guard.
+    """
+    global _sessions_jail
+    if not PATH_JAIL_AVAILABLE or not SESSIONS_DIR.exists():
+        return SESSIONS_DIR / session_id
+
+    if _sessions_jail is None:
+        _sessions_jail = Jail(str(SESSIONS_DIR))
+
+    try:
+        return Path(_sessions_jail.join(session_id))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid session ID")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_json_file(path_str: str, mtime_ns: int, size: int) -> dict | list:
+    """Parse a JSON file; cached per (path, mtime, size) so edits invalidate."""
+    raw = Path(path_str).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json_bytes(data) -> bytes:
+    """Serialize to indented JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
 def load_json_file(path: Path) -> dict | list:
-    """Safely load JSON file."""
-    if not path.exists():
+    """Safely load JSON file.
+
+    Unchanged files are served from an in-memory parse cache. Callers get a
+    shallow copy, so they must copy nested containers before mutating them.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
         return {} if path.suffix == ".json" else []
     try:
-        return json.loads(path.read_text())
+        data = _parse_json_file(str(path), st.st_mtime_ns, st.st_size)
     except json.JSONDecodeError:
         return {} if path.suffix == ".json" else []
+    return data.copy()
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def knowledge_signature() -> str:
+    """Fingerprint of the knowledge snapshot and its append logs."""
+    parts = []
+    for path in (KNOWLEDGE_FILE, KNOWLEDGE_COMPACTING_FILE, KNOWLEDGE_LOG_FILE):
+        try:
+            st = os.stat(path)
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_knowledge_log(path_str: str, mtime_ns: int, size: int) -> list:
+    """Parse the JSONL knowledge log into (category, entry) pairs."""
+    records = []
+    with open(path_str, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn final line from an interrupted append
+            records.append((record.get("category", "facts"), record.get("entry", {})))
+    return records
+
+
+def _log_marker(st: os.stat_result) -> str:
+    """Identity of a renamed-aside log, recorded in the snapshot that absorbed it."""
+    return f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_knowledge(include_log: bool = True) -> dict:
+    """Snapshot plus pending log entries, without any consistency check."""
+    knowledge = load_json_file(KNOWLEDGE_FILE)
+    if not isinstance(knowledge, dict):
+        knowledge = {"facts": [], "decisions": [], "patterns": []}
+    # Marker of the aside log this snapshot already contains
+    compacted = knowledge.pop("_compacted", None)
+
+    logs = [KNOWLEDGE_COMPACTING_FILE]
+    if include_log:
+        logs.append(KNOWLEDGE_LOG_FILE)
+    touched = set()
+    for path in logs:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if path == KNOWLEDGE_COMPACTING_FILE and _log_marker(st) == compacted:
+            continue
+        for category, entry in _parse_knowledge_log(str(path), st.st_mtime_ns, st.st_size):
+            if category not in touched:
+                # Copy before extending: nested lists are shared with the parse cache
+                knowledge[category] = list(knowledge.get(category, []))
+                touched.add(category)
+            knowledge[category].append(entry)
+    return knowledge
+
+
+def load_knowledge() -> dict:
+    """Load knowledge.json with any not-yet-compacted log entries merged in.
+
+    Readers take no lock: if an append or compaction lands mid-read (the
+    file signature changes), the read is retried.
+    """
+    for _ in range(KNOWLEDGE_READ_ATTEMPTS):
+        before = knowledge_signature()
+        knowledge = _read_knowledge()
+        if knowledge_signature() == before:
+            break
+    return knowledge
+
+
+@contextlib.contextmanager
+def knowledge_write_lock():
+    """Serialize knowledge writers across threads and, via flock, across workers."""
+    with _knowledge_write_lock:
+        if not FCNTL_AVAILABLE:
+            yield
+            return
+        MEMORY_DIR.mkdir(parents=True, exist_ok=True)
+        with open(KNOWLEDGE_LOCK_FILE, "ab") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def compact_knowledge() -> None:
+    """Fold the append log into knowledge.json and truncate the log."""
+    with knowledge_write_lock():
+        _compact_knowledge_locked()
+
+
+def _compact_knowledge_locked() -> None:
+    """compact_knowledge() body; caller must hold knowledge_write_lock().
+
+    The log is renamed aside first and the new snapshot records which aside
+    file it absorbed, so an unlocked reader never counts entries twice.
+    """
+    if KNOWLEDGE_COMPACTING_FILE.exists():
+        _fold_compacting_log()  # Left over from an interrupted compaction
+    if not KNOWLEDGE_LOG_FILE.exists():
+        return
+    os.replace(KNOWLEDGE_LOG_FILE, KNOWLEDGE_COMPACTING_FILE)
+    _fold_compacting_log()
+
+
+def _fold_compacting_log() -> None:
+    """Write a snapshot that includes the aside log, then delete the log."""
+    knowledge = _read_knowledge(include_log=False)
+    knowledge["_compacted"] = _log_marker(os.stat(KNOWLEDGE_COMPACTING_FILE))
+    write_bytes_atomic(KNOWLEDGE_FILE, dump_json_bytes(knowledge))
+    KNOWLEDGE_COMPACTING_FILE.unlink()
+
+
+_lowercased_knowledge: dict = {"signature": None, "categories": {}}
+
+
+def get_lowercased_knowledge() -> dict:
+    """Knowledge items paired with their lowercased content, per category.
+
+    Rebuilt only when the knowledge files change, so keyword scans don't
+    lowercase every item on every query.
+    """
+    signature = knowledge_signature()
+
+    if signature != _lowercased_knowledge["signature"]:
+        knowledge = load_knowledge()
+        _lowercased_knowledge["categories"] = {
+            cat: [(item, item.get("content", "").lower()) for item in items if isinstance(item, dict)]
+            for cat, items in knowledge.items()
+            if isinstance(items, list)
+        }
+        _lowercased_knowledge["signature"] = signature
+
+    return _lowercased_knowledge["categories"]
+
+
+# Findings logged through the MCP server wait in these JSONL files until a
+# session_tracker capture folds them into findings_captured.json
+PENDING_FINDINGS_FILES = ("findings.jsonl.folding", "findings.jsonl")
+
+
+def load_session_findings(session_dir: Path) -> list:
+    """findings_captured.json plus pending MCP findings not yet folded in."""
+    findings_file = session_dir / "findings_captured.json"
+    findings = load_json_file(findings_file) if findings_file.exists() else []
+    if not isinstance(findings, list):
+        findings = []
+
+    seen = {(f.get("text"), f.get("timestamp")) for f in findings if isinstance(f, dict)}
+    merged = None
+    for name in PENDING_FINDINGS_FILES:
+        try:
+            with open(session_dir / name, "rb") as f:
+                lines = f.readlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                finding = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+            except ValueError:
+                continue  # Partial trailing line from an interrupted write
+            key = (finding.get("text"), finding.get("timestamp"))
+            if key in seen:
+                continue  # Already folded; the capture hasn't deleted the log yet
+            seen.add(key)
+            if merged is None:
+                merged = list(findings)  # Don't mutate the parse cache's list
+            merged.append(finding)
+    return findings if merged is None else merged
 
 
 def get_session_metadata(session_id: str) -> dict:
     """Get session metadata from session.json."""
-    session_dir = SESSIONS_DIR / session_id
+    session_dir = get_session_dir(session_id)
     session_file = session_dir / "session.json"
 
     if not session_file.exists():
@@ -283,10 +579,9 @@ def get_session_metadata(session_id: str) -> dict:
 
     # Count URLs and findings
     urls_file = session_dir / "urls_captured.json"
-    findings_file = session_dir / "findings_captured.json"
 
     urls = load_json_file(urls_file) if urls_file.exists() else []
-    findings = load_json_file(findings_file) if findings_file.exists() else []
+    findings = load_session_findings(session_dir)
 
     return {
         "id": session_id,
@@ -301,17 +596,16 @@ def get_session_metadata(session_id: str) -> dict:
 
 def get_evidenced_findings(session_id: str) -> list:
     """Get findings with evidence for a session."""
-    session_dir = SESSIONS_DIR / session_id
+    session_dir = get_session_dir(session_id)
 
     # Prefer evidenced findings
     evidenced_file = session_dir / "findings_evidenced.json"
     if evidenced_file.exists():
         return load_json_file(evidenced_file)
 
-    # Fall back to regular findings
-    findings_file = session_dir / "findings_captured.json"
-    if findings_file.exists():
-        findings = load_json_file(findings_file)
+    # Fall back to regular findings (including ones still pending a capture)
+    findings = load_session_findings(session_dir)
+    if findings:
         # Convert to standard format
         return [
             {
@@ -328,6 +622,71 @@ def get_evidenced_findings(session_id: str) -> list:
     return []
 
 
+def make_etag(fingerprint: str) -> str:
+    """Short quoted ETag derived from a change fingerprint."""
+    return '"' + hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value covers the given ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def session_fingerprint(session_dir: Path) -> str:
+    """mtime/size of every file get_session reads, without reading them."""
+    parts = []
+    for name in ("session.json", "urls_captured.json", "findings_captured.json",
+                 "findings_evidenced.json", "lineage.json", *PENDING_FINDINGS_FILES):
+        try:
+            st = os.stat(session_dir / name)
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def load_packs() -> list:
+    """Parsed context packs as [{"id": ..., "data": {...}, "preview": ...}].
+
+    Re-read only when the packs directory's mtime changes (packs are added,
+    removed or atomically replaced); otherwise served from memory.
+    """
+    try:
+        dir_mtime = PACKS_DIR.stat().st_mtime_ns
+    except OSError:
+        return []
+
+    if dir_mtime != _packs_cache["dir_mtime"]:
+        entries = []
+        for pack_file in PACKS_DIR.glob("*.json"):
+            try:
+                raw = pack_file.read_bytes()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if isinstance(data, dict):
+                content = data.get("content", "")
+                entries.append({
+                    "id": pack_file.stem,
+                    "data": data,
+                    "preview": content[:500] + "...",
+                })
+        _packs_cache["entries"] = entries
+        _packs_cache["dir_mtime"] = dir_mtime
+
+    return _packs_cache["entries"]
+
+
+def get_session_index() -> SessionIndex:
+    """Get the session index, re-reading only sessions changed on disk."""
+    _session_index.refresh(get_session_metadata, get_evidenced_findings)
+    return _session_index
+
+
 # ============================================================
 # API Endpoints
 # ============================================================
@@ -399,54 +758,56 @@ if FASTAPI_AVAILABLE:
                 "user": user
             }
 
+    def _list_sessions(limit: int, project: Optional[str], status: Optional[str]) -> list:
+        rows = get_session_index().list_sessions(limit=limit, project=project, status=status)
+        return [SessionSummary(**row) for row in rows]
+
     @app.get("/api/sessions", response_model=list[SessionSummary])
     async def list_sessions(
+        request: Request,
+        response: Response,
         limit: int = Query(20, ge=1, le=100),
         project: Optional[str] = None,
         status: Optional[str] = None
     ):
-        """List all sessions with metadata."""
+        """List all sessions with metadata.
+
+        Supports conditional GET: the ETag tracks the session index version,
+        so polling clients get 304 until a session changes.
+        """
         if not SESSIONS_DIR.exists():
             return []
 
-        sessions = []
-        for session_dir in sorted(SESSIONS_DIR.iterdir(), reverse=True):
-            if not session_dir.is_dir():
-                continue
-
-            metadata = get_session_metadata(session_dir.name)
-
-            # Filter by project
-            if project and metadata.get("project") != project:
-                continue
-
-            # Filter by status
-            if status and metadata.get("status") != status:
-                continue
-
-            sessions.append(SessionSummary(**metadata))
-
-            if len(sessions) >= limit:
-                break
+        etag = make_etag(get_session_index().version())
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
 
-        return sessions
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+        return _list_sessions(limit, project, status)
 
     @app.get("/api/sessions/{session_id}")
-    async def get_session(session_id: str):
-        """Get detailed session information."""
+    async def get_session(session_id: str, request: Request, response: Response):
+        """Get detailed session information (supports conditional GET)."""
         # Validate session ID to prevent path traversal
         if SECURITY_AVAILABLE:
             session_id = validate_session_id(session_id)
 
-        session_dir = SESSIONS_DIR / session_id
+        session_dir = get_session_dir(session_id)
         if not session_dir.exists():
             raise HTTPException(status_code=404, detail="Session not found")
 
+        etag = make_etag(session_fingerprint(session_dir))
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
         metadata = get_session_metadata(session_id)
         findings = get_evidenced_findings(session_id)
         urls = load_json_file(session_dir / "urls_captured.json")
         lineage = load_json_file(session_dir / "lineage.json")
 
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
         return {
             **metadata,
             "findings": findings,
@@ -462,44 +823,16 @@ if FASTAPI_AVAILABLE:
         limit: int = Query(50, ge=1, le=200)
     ):
         """Search findings across all sessions."""
-        all_findings = []
-
         if not SESSIONS_DIR.exists():
             return []
 
-        for session_dir in SESSIONS_DIR.iterdir():
-            if not session_dir.is_dir():
-                continue
-
-            # Check project filter
-            if project:
-                session_data = load_json_file(session_dir / "session.json")
-                if session_data.get("implementation_project") != project:
-                    continue
-
-            findings = get_evidenced_findings(session_dir.name)
-
-            for f in findings:
-                # Apply filters
-                if type and f.get("type") != type:
-                    continue
-                if needs_review is not None and f.get("needs_review") != needs_review:
-                    continue
-
-                all_findings.append(FindingResponse(
-                    id=f.get("id", "unknown"),
-                    session_id=f.get("session_id", session_dir.name),
-                    content=f.get("content", ""),
-                    type=f.get("type", "finding"),
-                    confidence=f.get("evidence", {}).get("confidence", 0.0),
-                    sources=f.get("evidence", {}).get("sources", []),
-                    needs_review=f.get("needs_review", False)
-                ))
-
-                if len(all_findings) >= limit:
-                    return all_findings
-
-        return all_findings
+        rows = get_session_index().search_findings(
+            limit=limit,
+            type=type,
+            project=project,
+            needs_review=needs_review
+        )
+        return [FindingResponse(**row) for row in rows]
 
     @app.post("/api/findings")
     async def create_finding(finding: NewFinding):
@@ -507,13 +840,6 @@ if FASTAPI_AVAILABLE:
         # Get current session or create ad-hoc entry
         now = datetime.now()
 
-        # Store in memory knowledge.json
-        knowledge_file = MEMORY_DIR / "knowledge.json"
-        knowledge = load_json_file(knowledge_file)
-
-        if not isinstance(knowledge, dict):
-            knowledge = {"facts": [], "decisions": [], "patterns": []}
-
         # Determine category
         category = "facts"
         if finding.type in ["decision", "choice"]:
@@ -521,21 +847,30 @@ if FASTAPI_AVAILABLE:
         elif finding.type in ["pattern", "observation"]:
             category = "patterns"
 
-        entry = {
-            "id": len(knowledge.get(category, [])),
-            "content": finding.content,
-            "type": finding.type,
-            "tags": finding.tags,
-            "source": finding.source_url,
-            "project": finding.project,
-            "timestamp": now.isoformat() + "Z"
-        }
-
-        if category not in knowledge:
-            knowledge[category] = []
-        knowledge[category].append(entry)
+        # O(entry) append instead of rewriting the whole knowledge.json;
+        # the log is folded back in every KNOWLEDGE_COMPACT_EVERY writes.
+        # The ID is taken under the lock so concurrent workers can't share one.
+        with knowledge_write_lock():
+            knowledge = load_knowledge()
+            entry = {
+                "id": len(knowledge.get(category, [])),
+                "content": finding.content,
+                "type": finding.type,
+                "tags": finding.tags,
+                "source": finding.source_url,
+                "project": finding.project,
+                "timestamp": now.isoformat() + "Z"
+            }
+            record = {"category": category, "entry": entry}
+            line = orjson.dumps(record) if ORJSON_AVAILABLE else json.dumps(record).encode()
+            MEMORY_DIR.mkdir(parents=True, exist_ok=True)
+            with open(KNOWLEDGE_LOG_FILE, "ab") as f:
+                f.write(line + b"\n")
 
-        knowledge_file.write_text(json.dumps(knowledge, indent=2))
+            _knowledge_writes["pending"] += 1
+            if _knowledge_writes["pending"] >= KNOWLEDGE_COMPACT_EVERY:
+                _compact_knowledge_locked()
+                _knowledge_writes["pending"] = 0
 
         return {
             "status": "created",
@@ -571,21 +906,30 @@ if FASTAPI_AVAILABLE:
                 for r in results
             ]
         except Exception:
-            # Fallback to simple keyword search
-            knowledge_file = MEMORY_DIR / "knowledge.json"
-            knowledge = load_json_file(knowledge_file)
+            # Fallback to keyword search
+            categories = [search.category] if search.category != "all" else ["facts", "decisions", "patterns"]
+
+            # FTS5 index first (BM25-ranked), plain scan if SQLite lacks FTS5
+            indexed = _knowledge_index.search(
+                search.query,
+                categories,
+                search.limit,
+                knowledge_signature(),
+                load_knowledge
+            )
+            if indexed is not None:
+                return [SearchResult(**r) for r in indexed]
+
+            lowered = get_lowercased_knowledge()
 
             results = []
             query_lower = search.query.lower()
-
-            categories = [search.category] if search.category != "all" else ["facts", "decisions", "patterns"]
+            kws = query_lower.split()
 
             for cat in categories:
-                items = knowledge.get(cat, [])
-                for item in items:
-                    content = item.get("content", "").lower()
+                for item, content in lowered.get(cat, ()):
                     # Simple keyword matching
-                    if query_lower in content or any(kw in content for kw in query_lower.split()):
+                    if query_lower in content or any(kw in content for kw in kws):
                         results.append(SearchResult(
                             content=item.get("content", ""),
                             category=cat,
@@ -601,65 +945,49 @@ if FASTAPI_AVAILABLE:
     @app.get("/api/packs")
     async def list_packs():
         """List available context packs."""
-        packs_dir = AGENT_CORE_DIR / "packs"
-        if not packs_dir.exists():
-            return []
-
-        packs = []
-        for pack_file in packs_dir.glob("*.json"):
-            try:
-                data = json.loads(pack_file.read_text())
-                packs.append({
-                    "id": pack_file.stem,
-                    "type": data.get("type", "unknown"),
-                    "tokens": data.get("tokens", 0),
-                    "sessions": len(data.get("sessions", [])),
-                    "created_at": data.get("created_at")
-                })
-            except:
-                continue
-
-        return packs
+        return [
+            {
+                "id": entry["id"],
+                "type": entry["data"].get("type", "unknown"),
+                "tokens": entry["data"].get("tokens", 0),
+                "sessions": len(entry["data"].get("sessions", [])),
+                "created_at": entry["data"].get("created_at")
+            }
+            for entry in load_packs()
+        ]
 
     @app.post("/api/packs/select")
     async def select_packs(selection: PackSelection):
         """Select relevant context packs for a session."""
-        packs_dir = AGENT_CORE_DIR / "packs"
-        if not packs_dir.exists():
-            return {"packs": [], "total_tokens": 0}
-
         selected = []
         total_tokens = 0
 
-        for pack_file in packs_dir.glob("*.json"):
-            try:
-                data = json.loads(pack_file.read_text())
-
-                # Filter by project
-                if selection.project:
-                    pack_projects = data.get("projects", [])
-                    if selection.project not in pack_projects and data.get("project") != selection.project:
-                        continue
-
-                # Filter by pattern
-                if selection.pattern:
-                    pack_patterns = data.get("patterns", [])
-                    if selection.pattern not in pack_patterns and data.get("pattern") != selection.pattern:
-                        continue
-
-                tokens = data.get("tokens", 0)
-                selected.append({
-                    "id": pack_file.stem,
-                    "type": data.get("type"),
-                    "tokens": tokens,
-                    "content": data.get("content", "")[:500] + "..."  # Preview
-                })
-                total_tokens += tokens
+        for entry in load_packs():
+            data = entry["data"]
 
-                if len(selected) >= selection.limit:
-                    break
-            except:
-                continue
+            # Filter by project
+            if selection.project:
+                pack_projects = data.get("projects", [])
+                if selection.project not in pack_projects and data.get("project") != selection.project:
+                    continue
+
+            # Filter by pattern
+            if selection.pattern:
+                pack_patterns = data.get("patterns", [])
+                if selection.pattern not in pack_patterns and data.get("pattern") != selection.pattern:
+                    continue
+
+            tokens = data.get("tokens", 0)
+            selected.append({
+                "id": entry["id"],
+                "type": data.get("type"),
+                "tokens": tokens,
+                "content": entry["preview"]
+            })
+            total_tokens += tokens
+
+            if len(selected) >= selection.limit:
+                break
 
         return {
             "packs": selected,
@@ -840,7 +1168,9 @@ if FASTAPI_AVAILABLE:
         storage = await get_storage()
         if not storage:
             # Fall back to file-based
-            return await list_sessions(limit=limit, project=project)
+            if not SESSIONS_DIR.exists():
+                return []
+            return _list_sessions(limit, project, None)
 
         try:
             sessions = await storage.list_sessions(
@@ -997,12 +1327,7 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=503, detail="Storage engine not available")
 
         try:
-            # Import meta-learning engine
-            from storage.meta_learning import MetaLearningEngine
-
-            # Initialize engine
-            engine = MetaLearningEngine()
-            await engine.initialize()
+            engine = await get_meta_learning()
 
             # Make prediction
             prediction = await engine.predict_session_outcome(
@@ -1021,7 +1346,6 @@ if FASTAPI_AVAILABLE:
                 )
                 prediction["prediction_id"] = prediction_id
 
-            await engine.close()
             return prediction
 
         except Exception as e:
@@ -1051,17 +1375,13 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=503, detail="Storage engine not available")
 
         try:
-            from storage.meta_learning import MetaLearningEngine
-
-            engine = MetaLearningEngine()
-            await engine.initialize()
+            engine = await get_meta_learning()
 
             errors = await engine.predict_errors(
                 intent=request.intent,
                 include_preventable_only=request.include_preventable_only
             )
 
-            await engine.close()
             return {"errors": errors, "count": len(errors)}
 
         except Exception as e:
@@ -1088,17 +1408,13 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=503, detail="Storage engine not available")
 
         try:
-            from storage.meta_learning import MetaLearningEngine
-
-            engine = MetaLearningEngine()
-            await engine.initialize()
+            engine = await get_meta_learning()
 
             result = await engine.predict_optimal_time(
                 intent=request.intent,
                 current_hour=request.current_hour
             )
 
-            await engine.close()
             return result
 
         except Exception as e:
@@ -1127,14 +1443,10 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=503, detail="Storage engine not available")
 
         try:
-            from storage.meta_learning import MetaLearningEngine
-
-            engine = MetaLearningEngine()
-            await engine.initialize()
+            engine = await get_meta_learning()
 
             accuracy = await engine.get_prediction_accuracy(days=days)
 
-            await engine.close()
             return accuracy
 
         except Exception as e:
@@ -1156,10 +1468,7 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=503, detail="Storage engine not available")
 
         try:
-            from storage.meta_learning import MetaLearningEngine
-
-            engine = MetaLearningEngine()
-            await engine.initialize()
+            engine = await get_meta_learning()
 
             await engine.update_prediction_with_outcome(
                 prediction_id=request.prediction_id,
@@ -1168,7 +1477,6 @@ if FASTAPI_AVAILABLE:
                 session_id=request.session_id
             )
 
-            await engine.close()
             return {"status": "updated", "prediction_id": request.prediction_id}
 
         except Exception as e:
@@ -1199,14 +1507,10 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=503, detail="Storage engine not available")
 
         try:
-            from storage.meta_learning import MetaLearningEngine
-
-            engine = MetaLearningEngine()
-            await engine.initialize()
+            engine = await get_meta_learning()
 
             results = await engine.multi_vector_search(query=query, limit=limit)
 
-            await engine.close()
             return results
 
         except Exception as e:
@@ -1237,14 +1541,10 @@ if FASTAPI_AVAILABLE:
             raise HTTPException(status_code=503, detail="Storage engine not available")
 
         try:
-            from storage.meta_learning import MetaLearningEngine
-
-            engine = MetaLearningEngine()
-            await engine.initialize()
+            engine = await get_meta_learning()
 
             weights = await engine.calibrate_weights()
 
-            await engine.close()
             return weights
 
         except Exception as e:
@@ -1261,7 +1561,7 @@ if FASTAPI_AVAILABLE:
         if SECURITY_AVAILABLE:
             session_id = validate_session_id(session_id)
 
-        session_dir = SESSIONS_DIR / session_id
+        session_dir = get_session_dir(session_id)
         if not session_dir.exists():
             raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1275,9 +1575,15 @@ if FASTAPI_AVAILABLE:
         transcript_file = session_dir / "full_transcript.txt"
         transcript_excerpt = ""
         if transcript_file.exists():
-            content = transcript_file.read_text()
+            # Only the tail is needed. 5000 UTF-8 chars take at most 4 bytes
+            # each; 3 extra bytes absorb a character cut by the seek.
+            excerpt_chars = 5000
+            size = transcript_file.stat().st_size
+            with transcript_file.open("rb") as fh:
+                fh.seek(max(0, size - (4 * excerpt_chars + 3)))
+                tail = fh.read().decode("utf-8", errors="replace")
             # Get last 5000 chars as recent context
-            transcript_excerpt = content[-5000:] if len(content) > 5000 else content
+            transcript_excerpt = tail[-excerpt_chars:]
 
         # Build reinvigoration context
         context = f"""## SESSION REINVIGORATION: {session_id}
@@ -1455,7 +1761,7 @@ if FASTAPI_AVAILABLE:
         Returns nodes (session, findings, papers, concepts) and edges
         showing relationships between them.
         """
-        session_dir = SESSIONS_DIR / session_id
+        session_dir = get_session_dir(session_id)
         if not session_dir.exists():
             raise HTTPException(status_code=404, detail="Session not found")
 
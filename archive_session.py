@@ -15,8 +15,13 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
+import itertools
 import json
-import re
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -37,51 +42,112 @@ try:
         EvidenceCritic,
         ValidationResult,
     )
-    from critic.base import OracleConsensus
     CRITIC_SYSTEM_AVAILABLE = True
 except ImportError:
     CRITIC_SYSTEM_AVAILABLE = False
 
 
+# Fast JSON (optional, stdlib fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(raw: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data) -> bytes:
+    """Serialize to indented JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+@functools.lru_cache(maxsize=1)
 def get_agent_core_dir() -> Path:
     return Path.home() / ".agent-core"
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_agent_dir() -> Path:
+    # Resolved once per process; call get_local_agent_dir.cache_clear() after os.chdir()
     return Path.cwd() / ".agent"
 
 
+def file_digest(path: str) -> bytes:
+    """BLAKE2b digest of a file's contents."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "blake2b").digest()
+        digest = hashlib.blake2b()
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+        return digest.digest()
+
+
+def copy_if_changed(src: str, dest: str) -> bool:
+    """Copy src to dest unless dest already has identical contents.
+
+    Returns True if the file was copied.
+    """
+    try:
+        if os.stat(src).st_size == os.stat(dest).st_size and file_digest(src) == file_digest(dest):
+            return False
+    except FileNotFoundError:
+        pass
+    shutil.copyfile(src, dest)
+    return True
+
+
 def get_current_session() -> Optional[dict]:
     local_dir = get_local_agent_dir() / "research"
     session_file = local_dir / "session.json"
     if session_file.exists():
-        return json.loads(session_file.read_text())
+        return loads_json(session_file.read_bytes())
     return None
 
 
+URL_TABLE_HEADER = "| Time | Source | URL"
+# Threads used to copy session files into the global archive
+COPY_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+SESSION_INDEX_HEADER = (
+    "| Date | Session ID | Topic | Workflow | Duration | Key Finding |\n"
+    "|------|------------|-------|----------|----------|-------------|\n"
+)
+USED_MARK = "✓"
+SKIPPED_MARK = "✗"
+URL_TABLE_COLUMNS = ("time", "source", "url", "filter", "used", "relevance", "notes")
+
+
 def parse_url_table(session_log_path: Path) -> list:
-    """Parse URLs from session log markdown table."""
-    urls = []
-    content = session_log_path.read_text()
+    """Parse URLs from session log markdown table.
 
-    # Find the URLs table
-    table_pattern = r'\| Time \| Source \| URL.*?\n\|[-\s|]+\n((?:\|.*\n)*)'
-    match = re.search(table_pattern, content)
+    Streams the log line by line, so only the table rows are held in memory.
+    """
+    urls = []
 
-    if match:
-        rows = match.group(1).strip().split('\n')
-        for row in rows:
-            cols = [c.strip() for c in row.split('|')[1:-1]]
+    with session_log_path.open('r', encoding='utf-8', buffering=1 << 16) as f:
+        # Find the URLs table header, then skip its separator row
+        for line in f:
+            if line.startswith(URL_TABLE_HEADER):
+                next(f, None)
+                break
+        else:
+            return urls
+
+        for row in f:
+            if not row.startswith('|'):
+                break
+            cols = [c.strip() for c in row.rstrip('\n').split('|')[1:-1]]
             if len(cols) >= 6:
-                urls.append({
-                    "time": cols[0],
-                    "source": cols[1],
-                    "url": cols[2],
-                    "filter": cols[3] if len(cols) > 3 else "",
-                    "used": cols[4] if len(cols) > 4 else "",
-                    "relevance": cols[5] if len(cols) > 5 else "",
-                    "notes": cols[6] if len(cols) > 6 else ""
-                })
+                urls.append(dict(itertools.zip_longest(URL_TABLE_COLUMNS, cols[:7], fillvalue="")))
 
     return urls
 
@@ -103,16 +169,24 @@ def generate_queries_section(session: dict) -> str:
     return "\n\n".join(sections) if sections else "_No search queries recorded._"
 
 
-def generate_archive_report(session: dict, urls: list) -> str:
-    """Generate the final session archive markdown."""
-    now = datetime.now()
-    started = datetime.fromisoformat(session["started"])
-    duration = (now - started).total_seconds() / 60
+def generate_archive_report(session: dict, urls: list, now: datetime, duration: float) -> str:
+    """Generate the final session archive markdown.
+
+    Args:
+        now: Completion time (shared with the rest of the archive step)
+        duration: Session length in minutes
+    """
 
-    used_urls = [u for u in urls if '✓' in u.get("used", "")]
-    unused_urls = [u for u in urls if '✗' in u.get("used", "")]
+    # Partition in one pass; URLs with neither mark are counted in the total only
+    used_urls, unused_urls = [], []
+    for u in urls:
+        mark = u.get("used", "")
+        if USED_MARK in mark:
+            used_urls.append(u)
+        elif SKIPPED_MARK in mark:
+            unused_urls.append(u)
 
-    report = f"""# Session Archive: {session['topic']}
+    parts = [f"""# Session Archive: {session['topic']}
 
 **Session ID:** `{session['session_id']}`
 **Workflow:** {session['workflow']}
@@ -139,24 +213,22 @@ Total URLs visited: {len(urls)}
 
 | Source | URL | Relevance | Contribution |
 |--------|-----|-----------|--------------|
-"""
+"""]
 
-    for u in used_urls:
-        report += f"| {u['source']} | {u['url']} | {u['relevance']} | {u['notes']} |\n"
+    parts.extend(f"| {u['source']} | {u['url']} | {u['relevance']} | {u['notes']} |\n" for u in used_urls)
 
-    report += """
+    parts.append("""
 ---
 
 ## URLs Visited But Not Used
 
 | Source | URL | Why Skipped |
 |--------|-----|-------------|
-"""
+""")
 
-    for u in unused_urls:
-        report += f"| {u['source']} | {u['url']} | {u['notes']} |\n"
+    parts.extend(f"| {u['source']} | {u['url']} | {u['notes']} |\n" for u in unused_urls)
 
-    report += f"""
+    parts.append(f"""
 ---
 
 ## Files in Archive
@@ -184,9 +256,17 @@ python3 ~/.agent-core/scripts/init_session.py "{session['topic']}" --continue {s
 ---
 
 *Archived: {now.strftime("%Y-%m-%d %H:%M")}*
-"""
+""")
+
+    return "".join(parts)
+
 
-    return report
+# Scratchpad list -> (learning type, name key, insight key, insight prefix, insight default)
+LEARNING_SOURCES = (
+    ("viral_candidates", "tool", "name", "why", "High-adoption tool: ", "well-maintained"),
+    ("groundbreaker_candidates", "innovation", "name", "novel", "Novel approach: ", "emerging"),
+    ("arxiv_papers", "paper", "title", "insight", "", "Research finding"),
+)
 
 
 def extract_learnings(session: dict, scratchpad_path: Path) -> list:
@@ -194,79 +274,66 @@ def extract_learnings(session: dict, scratchpad_path: Path) -> list:
     learnings = []
 
     if scratchpad_path.exists():
-        data = json.loads(scratchpad_path.read_text())
-
-        # Extract from viral candidates
-        for item in data.get("viral_candidates", []):
-            learnings.append({
-                "type": "tool",
-                "name": item.get("name", "Unknown"),
-                "url": item.get("url", ""),
-                "insight": f"High-adoption tool: {item.get('why', 'well-maintained')}"
-            })
-
-        # Extract from groundbreaker candidates
-        for item in data.get("groundbreaker_candidates", []):
-            learnings.append({
-                "type": "innovation",
-                "name": item.get("name", "Unknown"),
-                "url": item.get("url", ""),
-                "insight": f"Novel approach: {item.get('novel', 'emerging')}"
-            })
-
-        # Extract from arxiv papers
-        for item in data.get("arxiv_papers", []):
-            learnings.append({
-                "type": "paper",
-                "name": item.get("title", "Unknown"),
-                "url": item.get("url", ""),
-                "insight": item.get("insight", "Research finding")
-            })
+        data = loads_json(scratchpad_path.read_bytes())
+
+        for list_key, learning_type, name_key, insight_key, prefix, default in LEARNING_SOURCES:
+            for item in data.get(list_key, []):
+                learnings.append({
+                    "type": learning_type,
+                    "name": item.get(name_key, "Unknown"),
+                    "url": item.get("url", ""),
+                    "insight": f"{prefix}{item.get(insight_key, default)}"
+                })
 
     return learnings
 
 
-def update_learnings_memory(session: dict, learnings: list):
+def update_learnings_memory(session: dict, learnings: list, now: Optional[datetime] = None):
     """Append learnings to global memory."""
     memory_file = get_agent_core_dir() / "memory" / "learnings.md"
     memory_file.parent.mkdir(parents=True, exist_ok=True)
 
-    now = datetime.now().strftime("%Y-%m-%d")
-
-    entry = f"\n\n## {now} - {session['topic']} (`{session['session_id']}`)\n\n"
+    date = (now or datetime.now()).strftime("%Y-%m-%d")
 
-    for l in learnings:
-        entry += f"- **{l['type'].title()}**: [{l['name']}]({l['url']}) — {l['insight']}\n"
+    parts = [f"\n\n## {date} - {session['topic']} (`{session['session_id']}`)\n\n"]
+    parts.extend(
+        f"- **{l['type'].title()}**: [{l['name']}]({l['url']}) — {l['insight']}\n"
+        for l in learnings
+    )
 
     with open(memory_file, "a") as f:
-        f.write(entry)
+        f.write("".join(parts))
 
     return len(learnings)
 
 
-def update_session_index(session: dict, duration: float):
+def update_session_index(session: dict, duration: float, now: Optional[datetime] = None):
     """Update the global session index."""
     index_file = get_agent_core_dir() / "sessions" / "index.md"
     index_file.parent.mkdir(parents=True, exist_ok=True)
 
-    if not index_file.exists():
-        index_file.write_text("| Date | Session ID | Topic | Workflow | Duration | Key Finding |\n")
-        index_file.write_text(index_file.read_text() + "|------|------------|-------|----------|----------|-------------|\n")
+    # Create with header + separator in one write; "x" avoids racing another archiver
+    try:
+        with open(index_file, "x") as f:
+            f.write(SESSION_INDEX_HEADER)
+    except FileExistsError:
+        pass
 
-    date = datetime.now().strftime("%Y-%m-%d")
+    date = (now or datetime.now()).strftime("%Y-%m-%d")
 
     # Get key finding from scratchpad
     key_finding = "See report"
     scratchpad = get_local_agent_dir() / "research" / "scratchpad.json"
     if scratchpad.exists():
-        data = json.loads(scratchpad.read_text())
+        data = loads_json(scratchpad.read_bytes())
         if data.get("viral_candidates"):
             key_finding = data["viral_candidates"][0].get("name", "See report")
 
     entry = f"| {date} | {session['session_id']} | {session['topic']} | {session['workflow']} | {duration:.0f}m | {key_finding} |\n"
 
-    with open(index_file, "a") as f:
-        f.write(entry)
+    # Small entry, unbuffered: one write() straight to the file
+    with open(index_file, "ab", buffering=0) as f:
+        f.write(entry.encode("utf-8"))
 
 
 def archive_session(
@@ -297,29 +364,33 @@ def archive_session(
     session_log = local_dir / "session_log.md"
     urls = parse_url_table(session_log) if session_log.exists() else []
 
+    # One completion timestamp for the report, metadata and index
+    now = datetime.now()
+    started = datetime.fromisoformat(session["started"])
+    duration = (now - started).total_seconds() / 60
+
     # Generate archive report
-    archive_report = generate_archive_report(session, urls)
+    archive_report = generate_archive_report(session, urls, now, duration)
     archive_path = local_dir / "session_archive.md"
     archive_path.write_text(archive_report)
 
     # Update session status
     session["status"] = "archived"
-    session["completed"] = datetime.now().isoformat()
+    session["completed"] = now.isoformat()
 
-    # Calculate duration
-    started = datetime.fromisoformat(session["started"])
-    duration = (datetime.now() - started).total_seconds() / 60
-
-    # Copy all files to global
-    import shutil
-    for file in local_dir.iterdir():
-        if file.is_file():
-            shutil.copy2(file, global_dir / file.name)
-        elif file.is_dir():
-            dest = global_dir / file.name
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(file, dest)
+    # Copy all files to global (files on a small thread pool, directories inline);
+    # unchanged files from an earlier archive of this session are skipped
+    with os.scandir(local_dir) as it:
+        entries = list(it)
+
+    files = [e for e in entries if e.is_file(follow_symlinks=False)]
+    with ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(files) or 1)) as pool:
+        # list() surfaces the first copy error, as the sequential loop did
+        list(pool.map(lambda e: copy_if_changed(e.path, os.path.join(global_dir, e.name)), files))
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.copytree(entry.path, os.path.join(global_dir, entry.name), dirs_exist_ok=True)
 
     # ═══════════════════════════════════════════════════════════════
     # EVIDENCE LAYER: Extract, Score, and Validate
@@ -428,7 +499,7 @@ def archive_session(
 
             # Save critic result to archive
             critic_result_path = global_dir / "critic_validation.json"
-            critic_result_path.write_text(json.dumps(critic_result.to_dict(), indent=2))
+            critic_result_path.write_bytes(dumps_json(critic_result.to_dict()))
 
         except Exception as e:
             print(f"   ⚠ Critic validation failed: {e}")
@@ -441,16 +512,16 @@ def archive_session(
         scratchpad = local_dir / "scratchpad.json"
         learnings = extract_learnings(session, scratchpad)
         if learnings:
-            learnings_count = update_learnings_memory(session, learnings)
+            learnings_count = update_learnings_memory(session, learnings, now)
 
     # Update session index
-    update_session_index(session, duration)
+    update_session_index(session, duration, now)
 
     # Save evidence stats and critic result to session metadata
     session_meta_path = global_dir / "session.json"
     if session_meta_path.exists():
         try:
-            session_meta = json.loads(session_meta_path.read_text())
+            session_meta = loads_json(session_meta_path.read_bytes())
             session_meta["evidence_stats"] = evidence_stats
 
             # Add critic validation summary
@@ -464,7 +535,7 @@ def archive_session(
                     "validated_at": critic_result.timestamp
                 }
 
-            session_meta_path.write_text(json.dumps(session_meta, indent=2))
+            session_meta_path.write_bytes(dumps_json(session_meta))
         except (json.JSONDecodeError, IOError):
             pass
 
@@ -9,7 +9,6 @@ Cohere free tier: 100,000 tokens/minute
 
 import asyncio
 import sys
-import time
 from pathlib import Path
 from storage.engine import StorageEngine
 
@@ -67,7 +66,7 @@ async def backfill_findings(engine: StorageEngine, dry_run: bool = False):
             except Exception as e:
                 if "429" in str(e) or "rate limit" in str(e).lower():
                     print(f"  ⚠️  Rate limit hit. Waiting 120 seconds...")
-                    time.sleep(120)
+                    await asyncio.sleep(120)
                     # Retry this batch
                     try:
                         count = await engine.qdrant.upsert_findings_batch(findings)
@@ -84,7 +83,7 @@ async def backfill_findings(engine: StorageEngine, dry_run: bool = False):
             # Rate limit pause
             if offset < total:
                 print(f"  Waiting {DELAY_BETWEEN_BATCHES}s before next batch...")
-                time.sleep(DELAY_BETWEEN_BATCHES)
+                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
 
     print(f"\n✓ Finished backfilling findings")
 
@@ -107,7 +106,7 @@ async def backfill_sessions(engine: StorageEngine, dry_run: bool = False):
     except Exception as e:
         if "429" in str(e) or "rate limit" in str(e).lower():
             print(f"⚠️  Rate limit hit. Waiting 120 seconds...")
-            time.sleep(120)
+            await asyncio.sleep(120)
             try:
                 count = await engine.qdrant.upsert_sessions_batch(sessions)
                 print(f"✓ Retry successful: {count} session vectors")
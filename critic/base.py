@@ -8,7 +8,9 @@ Provides the foundation for all critic validators:
 - Oracle multi-stream integration
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from enum import Enum
@@ -23,7 +25,14 @@ class Severity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Severities counted by ValidationResult.error_count
+ERROR_SEVERITIES = frozenset({Severity.ERROR, Severity.CRITICAL})
+
+# Serialized form of each severity, used by Issue.to_dict
+SEVERITY_VALUES: Dict[Severity, str] = {s: s.value for s in Severity}
+
+
+@dataclass(slots=True)
 class Issue:
     """Represents a validation issue found by a critic."""
     code: str
@@ -32,19 +41,23 @@ class Issue:
     location: Optional[str] = None
     suggestion: Optional[str] = None
     context: Dict[str, Any] = field(default_factory=dict)
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "code": self.code,
-            "message": self.message,
-            "severity": self.severity.value,
-            "location": self.location,
-            "suggestion": self.suggestion,
-            "context": self.context,
-        }
+        """Serialize once; issues are not modified after construction."""
+        if self._dict is None:
+            self._dict = {
+                "code": self.code,
+                "message": self.message,
+                "severity": SEVERITY_VALUES[self.severity],
+                "location": self.location,
+                "suggestion": self.suggestion,
+                "context": self.context,
+            }
+        return self._dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a critic validation pass."""
     valid: bool
@@ -54,6 +67,7 @@ class ValidationResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     critic_name: str = ""
     target_id: str = ""
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def passes_threshold(self) -> bool:
@@ -63,7 +77,7 @@ class ValidationResult:
     @property
     def error_count(self) -> int:
         """Count of error-level issues."""
-        return sum(1 for i in self.issues if i.severity in (Severity.ERROR, Severity.CRITICAL))
+        return sum(1 for i in self.issues if i.severity in ERROR_SEVERITIES)
 
     @property
     def warning_count(self) -> int:
@@ -71,18 +85,21 @@ class ValidationResult:
         return sum(1 for i in self.issues if i.severity == Severity.WARNING)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "valid": self.valid,
-            "confidence": self.confidence,
-            "passes_threshold": self.passes_threshold,
-            "issues": [i.to_dict() for i in self.issues],
-            "metrics": self.metrics,
-            "timestamp": self.timestamp,
-            "critic_name": self.critic_name,
-            "target_id": self.target_id,
-            "error_count": self.error_count,
-            "warning_count": self.warning_count,
-        }
+        """Serialize once; results are single-shot and not modified after construction."""
+        if self._dict is None:
+            self._dict = {
+                "valid": self.valid,
+                "confidence": self.confidence,
+                "passes_threshold": self.passes_threshold,
+                "issues": [i.to_dict() for i in self.issues],
+                "metrics": self.metrics,
+                "timestamp": self.timestamp,
+                "critic_name": self.critic_name,
+                "target_id": self.target_id,
+                "error_count": self.error_count,
+                "warning_count": self.warning_count,
+            }
+        return self._dict
 
 
 class CriticBase(ABC):
@@ -172,12 +189,10 @@ class CriticBase(ABC):
         return self._validation_history[-limit:]
 
     async def validate_batch(self, target_ids: List[str], **kwargs) -> List[ValidationResult]:
-        """Validate multiple targets."""
-        results = []
-        for target_id in target_ids:
-            result = await self.validate(target_id, **kwargs)
-            results.append(result)
-        return results
+        """Validate multiple targets concurrently (results keep input order)."""
+        return list(await asyncio.gather(
+            *(self.validate(target_id, **kwargs) for target_id in target_ids)
+        ))
 
 
 class OracleConsensus:
@@ -224,17 +239,17 @@ class OracleConsensus:
                 self.critics[2].name: 0.25,
             }
 
-        # Run all critics
-        results = []
-        for critic in self.critics:
-            result = await critic.validate(target_id, **kwargs)
-            results.append(result)
+        # Run all critics concurrently
+        results = await asyncio.gather(
+            *(critic.validate(target_id, **kwargs) for critic in self.critics)
+        )
 
-        # Compute weighted confidence
-        total_weight = sum(weights.get(c.name, 1/3) for c in self.critics)
+        # Compute weighted confidence (one weight lookup per critic)
+        critic_weights = [weights.get(c.name, 1/3) for c in self.critics]
+        total_weight = sum(critic_weights)
         weighted_confidence = sum(
-            r.confidence * weights.get(c.name, 1/3)
-            for r, c in zip(results, self.critics)
+            r.confidence * w
+            for r, w in zip(results, critic_weights)
         ) / total_weight
 
         # Collect all issues
@@ -242,21 +257,13 @@ class OracleConsensus:
         for result in results:
             all_issues.extend(result.issues)
 
-        # Find consensus issues (appeared in 2+ critics)
-        issue_codes = {}
-        for issue in all_issues:
-            issue_codes[issue.code] = issue_codes.get(issue.code, 0) + 1
-
-        consensus_issues = [
-            i for i in all_issues
-            if issue_codes[i.code] >= 2
-        ]
+        # Find consensus issues (appeared in 2+ critics), deduplicated by code
+        issue_codes = Counter(issue.code for issue in all_issues)
 
-        # Deduplicate
         seen_codes = set()
         unique_issues = []
-        for issue in consensus_issues:
-            if issue.code not in seen_codes:
+        for issue in all_issues:
+            if issue_codes[issue.code] >= 2 and issue.code not in seen_codes:
                 seen_codes.add(issue.code)
                 unique_issues.append(issue)
 
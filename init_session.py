@@ -11,13 +11,47 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
 import hashlib
+import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
 
 
+# Fast JSON (optional, stdlib fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(raw: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data) -> bytes:
+    """Serialize to indented JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+SOURCES_CSV_HEADER = b"name,url,tier,category,signal,relevance,used,notes,timestamp\n"
+
+
+def write_file(path: Path, data: bytes):
+    """Write bytes with one open/write/close."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+@functools.lru_cache(maxsize=1)
 def get_agent_core_dir() -> Path:
     """Get the global agent-core directory."""
     return Path.home() / ".agent-core"
@@ -29,7 +63,7 @@ def register_with_tracker(session_id: str, topic: str, impl_project: str = None)
 
     # Load or create tracker state
     if tracker_file.exists():
-        state = json.loads(tracker_file.read_text())
+        state = loads_json(tracker_file.read_bytes())
     else:
         state = {
             "version": "2.0",
@@ -70,7 +104,7 @@ def register_with_tracker(session_id: str, topic: str, impl_project: str = None)
 
     # Save tracker state
     tracker_file.parent.mkdir(parents=True, exist_ok=True)
-    tracker_file.write_text(json.dumps(state, indent=2))
+    tracker_file.write_bytes(dumps_json(state))
 
     return claude_session
 
@@ -95,8 +129,12 @@ def find_claude_session_file() -> Path:
     return latest
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_agent_dir() -> Path:
-    """Get the local .agent directory."""
+    """Get the local .agent directory.
+
+    Resolved once per process; call get_local_agent_dir.cache_clear() after os.chdir().
+    """
     return Path.cwd() / ".agent"
 
 
@@ -110,11 +148,30 @@ def detect_environment() -> str:
 def generate_session_id(topic: str) -> str:
     """Generate unique session ID."""
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    topic_hash = hashlib.md5(topic.encode()).hexdigest()[:6]
+    topic_hash = hashlib.blake2b(topic.encode("utf-8"), digest_size=3).hexdigest()
     safe_topic = topic.lower().replace(" ", "-")[:20]
     return f"{safe_topic}-{timestamp}-{topic_hash}"
 
 
+def claim_session_dir(session_id: str) -> tuple:
+    """Create the global session directory, suffixing the ID if it is taken.
+
+    Returns (session_id, global_dir).
+    """
+    sessions_dir = get_agent_core_dir() / "sessions"
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    candidate = session_id
+    attempt = 1
+    while True:
+        global_dir = sessions_dir / candidate
+        try:
+            global_dir.mkdir()
+            return candidate, global_dir
+        except FileExistsError:
+            attempt += 1
+            candidate = f"{session_id}-{attempt}"
+
+
 def create_search_queries(topic: str) -> dict:
     """Generate multi-tier search queries for Metaventions-grade research."""
     today = datetime.now()
@@ -239,7 +296,9 @@ def init_session(
     if continue_session:
         return load_session(continue_session)
 
-    session_id = generate_session_id(topic)
+    # Claim the global session directory before writing anything else, so a
+    # same-second re-init gets a suffixed ID instead of failing half-done
+    session_id, global_dir = claim_session_dir(generate_session_id(topic))
 
     # AUTO-REGISTER with tracker for lineage tracking
     claude_session = register_with_tracker(session_id, topic, impl_project)
@@ -247,10 +306,7 @@ def init_session(
 
     # Create directories
     local_dir = get_local_agent_dir() / "research"
-    global_dir = get_agent_core_dir() / "sessions" / session_id
-
     local_dir.mkdir(parents=True, exist_ok=True)
-    global_dir.mkdir(parents=True, exist_ok=True)
 
     # Session metadata
     session = {
@@ -289,16 +345,12 @@ def init_session(
     create_scratchpad(session)
 
     # Create sources CSV header (updated schema)
-    sources_path = Path(session["paths"]["sources"])
-    sources_path.write_text("name,url,tier,category,signal,relevance,used,notes,timestamp\n")
-
-    # Save session metadata
-    metadata_path = local_dir / "session.json"
-    metadata_path.write_text(json.dumps(session, indent=2))
+    write_file(Path(session["paths"]["sources"]), SOURCES_CSV_HEADER)
 
-    # Also save to global
-    global_metadata = global_dir / "session.json"
-    global_metadata.write_text(json.dumps(session, indent=2))
+    # Save session metadata (serialized once; the global dir is ours alone)
+    metadata = dumps_json(session)
+    write_file(local_dir / "session.json", metadata)
+    write_file(global_dir / "session.json", metadata)
 
     return session
 
@@ -431,7 +483,7 @@ _Concrete next step_
 |------|-------------|----------|-------|
 
 """
-    Path(session["paths"]["session_log"]).write_text(content)
+    write_file(Path(session["paths"]["session_log"]), content.encode("utf-8"))
 
 
 def create_scratchpad(session: dict):
@@ -488,7 +540,7 @@ def create_scratchpad(session: dict):
 
         "last_updated": session["started"]
     }
-    Path(session["paths"]["scratchpad"]).write_text(json.dumps(scratchpad, indent=2))
+    write_file(Path(session["paths"]["scratchpad"]), dumps_json(scratchpad))
 
 
 def load_session(session_id: str) -> dict:
@@ -499,18 +551,18 @@ def load_session(session_id: str) -> dict:
     if not metadata_path.exists():
         raise FileNotFoundError(f"Session not found: {session_id}")
 
-    session = json.loads(metadata_path.read_text())
+    session = loads_json(metadata_path.read_bytes())
     session["status"] = "resumed"
 
     # Restore to local directory
     local_dir = get_local_agent_dir() / "research"
     local_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy files from global to local
-    for file in global_dir.iterdir():
-        if file.is_file():
-            dest = local_dir / file.name
-            dest.write_text(file.read_text())
+    # Copy files from global to local (bytes as-is, no decode/encode)
+    with os.scandir(global_dir) as it:
+        for entry in it:
+            if entry.is_file():
+                shutil.copyfile(entry.path, local_dir / entry.name)
 
     session["paths"]["local"] = str(local_dir)
     return session
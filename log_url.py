@@ -8,98 +8,299 @@ Usage:
 """
 
 import argparse
+import atexit
 import csv
 import json
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(raw: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data) -> bytes:
+    """Serialize to indented JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+# Header row as csv.writer would write it (\r\n, matching the data rows)
+SOURCES_CSV_HEADER = b"name,url,tier,category,signal,relevance,used,notes,timestamp\r\n"
+
+# Characters (besides the delimiter) that make csv.writer quote a field
+CSV_QUOTE_CHARS = re.compile(r'["\r\n]')
+
+
+class LogWriters:
+    """Buffered append handles kept open across log_url calls.
+
+    Rows accumulate in a 64 KiB buffer per file and reach disk on flush(),
+    which runs at interpreter exit. Session log rows are inserted mid-file
+    (see add_url_row), so they are batched as text and placed with one
+    table scan and write per flush rather than per row.
+    """
+
+    BUFFER_SIZE = 1 << 16
+
+    def __init__(self):
+        self._sources = {}  # path -> (file, csv.writer)
+        self._url_rows = {}  # session log path -> [pending rows]
+        self._url_rows_size = 0
+        atexit.register(self.close)
+
+    def sources(self, path: Path):
+        """(file, csv.writer) appending to sources.csv, writing the header on creation."""
+        key = str(path)
+        entry = self._sources.get(key)
+        if entry is None:
+            if not (path.exists() and path.stat().st_size > 0):
+                with open(path, "ab") as header_file:
+                    header_file.write(SOURCES_CSV_HEADER)
+            f = open(path, "a", newline="", encoding="utf-8", buffering=self.BUFFER_SIZE)
+            writer = csv.writer(f)
+            entry = self._sources[key] = (f, writer)
+        return entry
+
+    def source_row(self, path: Path, row: list):
+        """Append a row to sources.csv.
+
+        Rows with no field needing quotes are joined directly; csv.writer is
+        only used when a field contains a comma, quote or newline.
+        """
+        f, writer = self.sources(path)
+        fields = ["" if v is None else str(v) for v in row]
+        line = ",".join(fields)
+        if line.count(",") == len(fields) - 1 and not CSV_QUOTE_CHARS.search(line):
+            f.write(line + "\r\n")  # csv.writer's default line terminator
+        else:
+            writer.writerow(fields)
+
+    def url_row(self, session_log: Path, row: str):
+        """Queue a row for the session log's URLs Visited table."""
+        self._url_rows.setdefault(str(session_log), []).append(row)
+        self._url_rows_size += len(row)
+        if self._url_rows_size >= self.BUFFER_SIZE:
+            self.flush_url_rows()
+
+    def flush_url_rows(self):
+        for path, rows in self._url_rows.items():
+            add_url_row(Path(path), "".join(rows))
+        self._url_rows.clear()
+        self._url_rows_size = 0
+
+    def flush(self):
+        self.flush_url_rows()
+        for f, _ in self._sources.values():
+            f.flush()
+
+    def close(self):
+        self.flush_url_rows()
+        for f, _ in self._sources.values():
+            f.close()
+        self._sources.clear()
+
+
+_writers = LogWriters()
 
 
 def get_local_agent_dir() -> Path:
     return Path.cwd() / ".agent"
 
 
-def get_current_session() -> Optional[dict]:
-    local_dir = get_local_agent_dir() / "research"
-    session_file = local_dir / "session.json"
-    if session_file.exists():
-        return json.loads(session_file.read_text())
-    return None
+URLS_VISITED_HEADING = b"## URLs Visited"
+URLS_TABLE_HEADER = (
+    b"| Time | Tier | Category | URL | Signal | Relevance | Used | Notes |\n"
+    b"|------|------|----------|-----|--------|-----------|------|-------|\n"
+)
 
 
-def detect_source_and_category(url: str) -> Tuple[str, int, str]:
+def find_url_table_end(f) -> Tuple[int, str]:
+    """Scan an open binary session log for where the next URL row belongs.
+
+    Returns (offset, state). With state "table" the offset is just past the
+    last row of the "## URLs Visited" table; "before_table" means the heading
+    exists without a table, "heading" that there is no heading (offset = EOF).
+    Only the part of the file up to the end of that table is read.
     """
-    Detect the source name, tier, and category from URL.
-    Returns (source_name, tier, category)
+    offset = 0
+    state = "heading"
+    for line in f:
+        if state == "heading":
+            if line.startswith(URLS_VISITED_HEADING):
+                state = "before_table"
+        elif state == "before_table":
+            if line.startswith(b"|"):
+                state = "table"
+            elif line.startswith(b"#"):
+                return offset, state
+        elif not line.startswith(b"|"):
+            return offset, state
+        offset += len(line)
+    return offset, state
+
+
+def write_vectored(fd: int, offset: int, buffers) -> None:
+    """Write buffers back-to-back at offset with one writev() where available."""
+    buffers = [b for b in buffers if b]
+    os.lseek(fd, offset, os.SEEK_SET)
+    if hasattr(os, "writev"):
+        written = os.writev(fd, buffers)
+        if written == sum(len(b) for b in buffers):
+            return
+        # Short write (rare for regular files): finish the remainder below
+        remaining = memoryview(b"".join(buffers))[written:]
+    else:
+        remaining = memoryview(b"".join(buffers))
+    while remaining:
+        remaining = remaining[os.write(fd, remaining):]
+
+
+def add_url_row(session_log: Path, rows: str):
+    """Add rows (newline-terminated) at the end of the session log's URLs Visited table.
+
+    Rows after the table are shifted down by rewriting only the tail of the
+    file; when the table is the last thing in the log this is a plain append.
     """
-    url_lower = url.lower()
+    with open(session_log, "r+b") as f:
+        data = rows.encode("utf-8")
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty log: nothing to scan, start the section at offset 0
+            f.write(URLS_VISITED_HEADING + b"\n\n" + URLS_TABLE_HEADER + data)
+            return
 
-    # Tier 1: Research
-    if "arxiv.org" in url_lower:
-        return ("arXiv", 1, "research")
-    if "huggingface.co/papers" in url_lower:
-        return ("HuggingFace", 1, "research")
-    if "openreview.net" in url_lower:
-        return ("OpenReview", 1, "research")
+        offset, state = find_url_table_end(f)
+        f.seek(offset)
+        tail = f.read()
 
-    # Tier 1: Labs
-    if "openai.com" in url_lower:
-        return ("OpenAI", 1, "labs")
-    if "anthropic.com" in url_lower:
-        return ("Anthropic", 1, "labs")
-    if "blog.google" in url_lower or "deepmind.google" in url_lower:
-        return ("Google AI", 1, "labs")
-    if "ai.meta.com" in url_lower:
-        return ("Meta AI", 1, "labs")
+        if state == "heading":
+            data = b"\n\n" + URLS_VISITED_HEADING + b"\n\n" + URLS_TABLE_HEADER + data
+        elif state == "before_table":
+            data = URLS_TABLE_HEADER + data + (b"\n" if tail else b"")
+        if offset and not tail:
+            f.seek(offset - 1)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
 
-    # Tier 1: Industry
-    if "techcrunch.com" in url_lower:
-        return ("TechCrunch", 1, "industry")
-    if "theverge.com" in url_lower:
-        return ("The Verge", 1, "industry")
-    if "arstechnica.com" in url_lower:
-        return ("Ars Technica", 1, "industry")
-    if "wired.com" in url_lower:
-        return ("Wired", 1, "industry")
+        f.seek(offset)
+        f.flush()
+        write_vectored(f.fileno(), offset, (data, tail))
 
-    # Tier 2: GitHub
-    if "github.com" in url_lower:
-        return ("GitHub", 2, "github")
 
-    # Tier 2: Benchmarks
-    if "metr.org" in url_lower:
-        return ("METR", 2, "benchmarks")
-    if "arcprize.org" in url_lower:
-        return ("ARC Prize", 2, "benchmarks")
-    if "paperswithcode.com" in url_lower:
-        return ("PapersWithCode", 2, "benchmarks")
-    if "lmarena.ai" in url_lower or "lmsys.org" in url_lower:
-        return ("LMSYS Arena", 2, "benchmarks")
+# Parsed session.json, reused until the file's mtime changes
+_session_cache = {"path": None, "mtime": None, "data": None}
 
-    # Tier 2: Social
-    if "twitter.com" in url_lower or "x.com" in url_lower:
-        return ("X/Twitter", 2, "social")
-    if "news.ycombinator.com" in url_lower:
-        return ("Hacker News", 2, "social")
-    if "reddit.com" in url_lower:
-        return ("Reddit", 2, "social")
 
-    # Tier 3: Newsletters
-    if "substack.com" in url_lower:
-        return ("Substack", 3, "newsletters")
-    if "deeplearning.ai" in url_lower:
-        return ("The Batch", 3, "newsletters")
+def get_current_session() -> Optional[dict]:
+    session_file = str(get_local_agent_dir() / "research" / "session.json")
+    try:
+        mtime = os.stat(session_file).st_mtime_ns
+    except OSError:
+        return None
+
+    if _session_cache["path"] != session_file or _session_cache["mtime"] != mtime:
+        with open(session_file, "rb") as f:
+            _session_cache["data"] = loads_json(f.read())
+        _session_cache["path"] = session_file
+        _session_cache["mtime"] = mtime
+
+    return _session_cache["data"]
+
 
+# URL substring -> (source_name, tier, category)
+SOURCE_PATTERNS = {
+    # Tier 1: Research
+    "arxiv.org": ("arXiv", 1, "research"),
+    "huggingface.co/papers": ("HuggingFace", 1, "research"),
+    "openreview.net": ("OpenReview", 1, "research"),
+    # Tier 1: Labs
+    "openai.com": ("OpenAI", 1, "labs"),
+    "anthropic.com": ("Anthropic", 1, "labs"),
+    "blog.google": ("Google AI", 1, "labs"),
+    "deepmind.google": ("Google AI", 1, "labs"),
+    "ai.meta.com": ("Meta AI", 1, "labs"),
+    # Tier 1: Industry
+    "techcrunch.com": ("TechCrunch", 1, "industry"),
+    "theverge.com": ("The Verge", 1, "industry"),
+    "arstechnica.com": ("Ars Technica", 1, "industry"),
+    "wired.com": ("Wired", 1, "industry"),
+    # Tier 2: GitHub
+    "github.com": ("GitHub", 2, "github"),
+    # Tier 2: Benchmarks
+    "metr.org": ("METR", 2, "benchmarks"),
+    "arcprize.org": ("ARC Prize", 2, "benchmarks"),
+    "paperswithcode.com": ("PapersWithCode", 2, "benchmarks"),
+    "lmarena.ai": ("LMSYS Arena", 2, "benchmarks"),
+    "lmsys.org": ("LMSYS Arena", 2, "benchmarks"),
+    # Tier 2: Social
+    "twitter.com": ("X/Twitter", 2, "social"),
+    "x.com": ("X/Twitter", 2, "social"),
+    "news.ycombinator.com": ("Hacker News", 2, "social"),
+    "reddit.com": ("Reddit", 2, "social"),
+    # Tier 3: Newsletters
+    "substack.com": ("Substack", 3, "newsletters"),
+    "deeplearning.ai": ("The Batch", 3, "newsletters"),
     # Tier 3: Forums
-    if "lesswrong.com" in url_lower:
-        return ("LessWrong", 3, "forums")
-    if "alignmentforum.org" in url_lower:
-        return ("Alignment Forum", 3, "forums")
-    if "eaforum.org" in url_lower:
-        return ("EA Forum", 3, "forums")
+    "lesswrong.com": ("LessWrong", 3, "forums"),
+    "alignmentforum.org": ("Alignment Forum", 3, "forums"),
+    "eaforum.org": ("EA Forum", 3, "forums"),
+}
+
+# Host lookup tables derived from SOURCE_PATTERNS. Patterns with a path
+# ("huggingface.co/papers") are checked against the path under their host
+SOURCE_HOSTS = {p: v for p, v in SOURCE_PATTERNS.items() if "/" not in p}
+SOURCE_PATHS = {}
+for _pattern, _value in SOURCE_PATTERNS.items():
+    if "/" in _pattern:
+        _host, _path = _pattern.split("/", 1)
+        SOURCE_PATHS.setdefault(_host, []).append(("/" + _path, _value))
+
+# Substring fallback for scheme-less input like "arxiv.org/abs/...". The
+# leftmost match wins; longer patterns are tried first
+SOURCE_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(SOURCE_PATTERNS, key=len, reverse=True))
+)
+
+DEFAULT_SOURCE = ("Web", 2, "other")
 
-    # Default
-    return ("Web", 2, "other")
+
+def detect_source_and_category(url: str) -> Tuple[str, int, str]:
+    """
+    Detect the source name, tier, and category from URL.
+    Returns (source_name, tier, category)
+    """
+    parts = urlsplit(url)
+    host = parts.hostname
+    if not host:
+        match = SOURCE_RE.search(url.lower())
+        return SOURCE_PATTERNS[match.group(0)] if match else DEFAULT_SOURCE
+
+    # Walk from the full host up through parent domains (www.x.com -> x.com)
+    path = parts.path.lower()
+    while True:
+        for prefix, value in SOURCE_PATHS.get(host, ()):
+            if path.startswith(prefix):
+                return value
+        value = SOURCE_HOSTS.get(host)
+        if value:
+            return value
+        _, dot, host = host.partition(".")
+        if not dot:
+            return DEFAULT_SOURCE
 
 
 def log_url(
@@ -119,8 +320,10 @@ def log_url(
         return False
 
     local_dir = get_local_agent_dir() / "research"
+    # One clock read; both display formats derive from it
     now = datetime.now()
-    time_str = now.strftime("%H:%M")
+    timestamp = now.isoformat()
+    time_str = f"{now.hour:02d}:{now.minute:02d}"
 
     # Auto-detect source, tier, category if not provided
     detected_source, detected_tier, detected_category = detect_source_and_category(url)
@@ -139,72 +342,31 @@ def log_url(
         status_mark = "-"
 
     # Log to sources.csv (new schema)
-    sources_file = local_dir / "sources.csv"
-    file_exists = sources_file.exists() and sources_file.stat().st_size > 0
-
-    with open(sources_file, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow([
-                "name", "url", "tier", "category", "signal",
-                "relevance", "used", "notes", "timestamp"
-            ])
-        writer.writerow([
-            detected_source,
-            url,
-            tier,
-            category,
-            signal,
-            relevance if relevance else "",
-            status,
-            notes,
-            now.isoformat()
-        ])
+    _writers.source_row(local_dir / "sources.csv", [
+        detected_source,
+        url,
+        tier,
+        category,
+        signal,
+        relevance if relevance else "",
+        status,
+        notes,
+        timestamp
+    ])
 
     # Log to session_log.md
     session_log = local_dir / "session_log.md"
 
     if session_log.exists():
-        content = session_log.read_text()
-
-        # Find the URLs Visited table and append
-        if "## URLs Visited" in content:
-            # Append to the table
-            relevance_str = str(relevance) if relevance else "-"
-            signal_str = signal if signal else "-"
-            row = f"| {time_str} | {tier} | {category} | [{detected_source}]({url}) | {signal_str} | {relevance_str} | {status_mark} | {notes} |\n"
-
-            # Find where to insert (after the table header)
-            lines = content.split('\n')
-            insert_idx = None
-            for i, line in enumerate(lines):
-                if line.startswith("|---") and "Tier" not in lines[i-1] if i > 0 else False:
-                    # Skip the first table header we find that's for URLs
-                    if i > 0 and "Category" in lines[i-1]:
-                        insert_idx = i + 1
-                        break
-
-            if insert_idx:
-                lines.insert(insert_idx, row.strip())
-                session_log.write_text('\n'.join(lines))
-            else:
-                # Fallback: append to file
-                with open(session_log, "a") as f:
-                    f.write(row)
-        else:
-            # Create table if missing
-            with open(session_log, "a") as f:
-                f.write("\n\n## URLs Visited\n\n")
-                f.write("| Time | Tier | Category | URL | Signal | Relevance | Used | Notes |\n")
-                f.write("|------|------|----------|-----|--------|-----------|------|-------|\n")
-                relevance_str = str(relevance) if relevance else "-"
-                signal_str = signal if signal else "-"
-                f.write(f"| {time_str} | {tier} | {category} | [{detected_source}]({url}) | {signal_str} | {relevance_str} | {status_mark} | {notes} |\n")
+        relevance_str = str(relevance) if relevance else "-"
+        signal_str = signal if signal else "-"
+        row = f"| {time_str} | {tier} | {category} | [{detected_source}]({url}) | {signal_str} | {relevance_str} | {status_mark} | {notes} |\n"
+        _writers.url_row(session_log, row)
 
     # Update scratchpad
     scratchpad_file = local_dir / "scratchpad.json"
     if scratchpad_file.exists():
-        scratchpad = json.loads(scratchpad_file.read_text())
+        scratchpad = loads_json(scratchpad_file.read_bytes())
 
         # Add to urls_visited
         url_entry = {
@@ -216,12 +378,12 @@ def log_url(
             "relevance": relevance,
             "status": status,
             "notes": notes,
-            "timestamp": now.isoformat()
+            "timestamp": timestamp
         }
         scratchpad["urls_visited"].append(url_entry)
-        scratchpad["last_updated"] = now.isoformat()
+        scratchpad["last_updated"] = timestamp
 
-        scratchpad_file.write_text(json.dumps(scratchpad, indent=2))
+        scratchpad_file.write_bytes(dumps_json(scratchpad))
 
     # Print confirmation
     tier_emoji = {1: "1", 2: "2", 3: "3"}.get(tier, "?")
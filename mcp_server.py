@@ -20,10 +20,15 @@ Resources Provided:
 - project://{name}/research - Project research files
 """
 
+import bisect
+import contextlib
+import functools
+import heapq
 import json
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 
 # MCP SDK imports
@@ -33,14 +38,33 @@ try:
     from mcp.types import (
         Tool,
         TextContent,
-        ImageContent,
-        EmbeddedResource,
         LoggingLevel
     )
 except ImportError:
     print("ERROR: MCP SDK not installed. Install with: pip install mcp", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(raw: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
 # ResearchGravity paths
 AGENT_CORE = Path.home() / ".agent-core"
 SESSION_TRACKER = AGENT_CORE / "session_tracker.json"
@@ -49,18 +73,28 @@ LEARNINGS_FILE = AGENT_CORE / "memory" / "learnings.md"
 RESEARCH_DIR = AGENT_CORE / "research"
 SESSIONS_DIR = AGENT_CORE / "sessions"
 CONTEXT_PACKS_DIR = AGENT_CORE / "context-packs"
+FINDINGS_LOG_NAME = "findings.jsonl"  # Per-session, under SESSIONS_DIR/<id>/
+FINDINGS_FOLDING_NAME = "findings.jsonl.folding"  # Renamed aside by session_tracker capture
 
 # Initialize MCP server
 app = Server("researchgravity")
 
 
+def file_signature(path: Path) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def load_json(path: Path) -> Dict:
     """Load JSON file safely"""
     try:
         if not path.exists():
             return {}
-        with open(path, 'r') as f:
-            return json.load(f)
+        return loads_json(path.read_bytes())
     except Exception as e:
         app.server.request_context.session.send_log_message(
             level=LoggingLevel.ERROR,
@@ -69,13 +103,48 @@ def load_json(path: Path) -> Dict:
         return {}
 
 
-def load_text(path: Path) -> str:
-    """Load text file safely"""
+@functools.lru_cache(maxsize=1)
+def _projects_partition(mtime_ns: int, size: int) -> tuple:
+    """(projects, stats) from projects.json, split once per file version.
+
+    Keys starting with '_' hold metadata (e.g. '_stats') rather than projects.
+    """
+    data = load_json(PROJECTS_FILE)
+    projects = {k: v for k, v in data.items() if not k.startswith('_')}
+    return projects, data.get('_stats', {})
+
+
+def _load_projects() -> tuple:
+    signature = file_signature(PROJECTS_FILE)
+    if signature is None:
+        return {}, {}
+    return _projects_partition(*signature)
+
+
+def get_projects() -> Dict:
+    """Tracked projects from projects.json, without metadata keys. Read-only."""
+    return _load_projects()[0]
+
+
+def get_project_stats() -> Dict:
+    """The '_stats' block of projects.json. Read-only."""
+    return _load_projects()[1]
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text(path_str: str, mtime_ns: int, size: int) -> str:
+    """Decoded file contents, cached per (path, mtime, size) so edits invalidate."""
+    with open(path_str, 'r') as f:
+        return f.read()
+
+
+def load_text(path: Union[Path, str]) -> str:
+    """Load text file safely (unchanged files are served from memory)"""
+    signature = file_signature(path)
+    if signature is None:
+        return ""
     try:
-        if not path.exists():
-            return ""
-        with open(path, 'r') as f:
-            return f.read()
+        return _read_text(str(path), *signature)
     except Exception as e:
         app.server.request_context.session.send_log_message(
             level=LoggingLevel.ERROR,
@@ -84,6 +153,37 @@ def load_text(path: Path) -> str:
         return ""
 
 
+def findings_log_path(session_id: str) -> Path:
+    """Append-only log of findings recorded via log_finding for a session."""
+    return SESSIONS_DIR / session_id / FINDINGS_LOG_NAME
+
+
+def load_pending_findings(session_id: str) -> List[Dict]:
+    """Findings appended to the session's JSONL log and not yet folded into the tracker."""
+    findings = []
+    # A capture in progress has renamed the older entries aside; read those first
+    log_path = findings_log_path(session_id)
+    for path in (log_path.with_name(FINDINGS_FOLDING_NAME), log_path):
+        try:
+            with open(path, 'rb') as f:
+                for line in f:
+                    try:
+                        findings.append(loads_json(line))
+                    except ValueError:
+                        continue  # Partial trailing line from an interrupted write
+        except OSError:
+            pass
+    return findings
+
+
+def with_pending_findings(session_id: str, session: Dict) -> Dict:
+    """Session dict with pending JSONL findings merged into findings_captured."""
+    pending = load_pending_findings(session_id)
+    if not pending:
+        return session
+    return {**session, 'findings_captured': session.get('findings_captured', []) + pending}
+
+
 def get_active_session() -> Optional[Dict]:
     """Get active session data"""
     tracker = load_json(SESSION_TRACKER)
@@ -94,65 +194,120 @@ def get_active_session() -> Optional[Dict]:
     if not session_id or session_id not in tracker.get('sessions', {}):
         return None
 
-    return tracker['sessions'][session_id]
+    return with_pending_findings(session_id, tracker['sessions'][session_id])
 
 
 def get_session_by_id(session_id: str) -> Optional[Dict]:
     """Get session by ID"""
     tracker = load_json(SESSION_TRACKER)
-    return tracker.get('sessions', {}).get(session_id)
+    session = tracker.get('sessions', {}).get(session_id)
+    if session is None:
+        return None
+    return with_pending_findings(session_id, session)
 
 
-def search_learnings_text(query: str, limit: int = 10) -> List[Dict[str, str]]:
-    """Search learnings for query"""
-    learnings_text = load_text(LEARNINGS_FILE)
-    if not learnings_text:
-        return []
+@functools.lru_cache(maxsize=4)
+def _learning_sections(mtime_ns: int, size: int) -> tuple:
+    """Parsed '## ' sections of learnings.md, built once per file signature.
 
-    # Simple search: find sections containing query (case-insensitive)
+    Returns (sections, corpus_lower, starts): (title, content) per section,
+    every lowercased section joined by NUL into one string, and each
+    section's start offset in that string.
+    """
+    learnings_text = load_text(LEARNINGS_FILE)
+    sections, lowered, starts = [], [], []
+    offset = 0
+    for section in learnings_text.split('\n## ')[1:]:  # Skip first (title)
+        lines = section.split('\n', 1)
+        sections.append((lines[0].strip(), lines[1] if len(lines) > 1 else ""))
+        starts.append(offset)
+        section_lower = section.lower()
+        lowered.append(section_lower)
+        # lower() can change the length (e.g. 'İ'), so advance by the lowered text
+        offset += len(section_lower) + 1
+    return tuple(sections), "\0".join(lowered), tuple(starts)
+
+
+@functools.lru_cache(maxsize=128)
+def _search_learnings(query: str, limit: int, mtime_ns: int, size: int) -> tuple:
+    # Simple search: find sections containing query (case-insensitive).
+    # One find() pass over the whole lowercased corpus; hits are bucketed to
+    # sections by offset (NUL separators keep matches inside one section).
     query_lower = query.lower()
+    if not query_lower:
+        return ()
+    sections, corpus_lower, starts = _learning_sections(mtime_ns, size)
+
+    counts = {}
+    pos = corpus_lower.find(query_lower)
+    while pos != -1:
+        index = bisect.bisect_right(starts, pos) - 1
+        counts[index] = counts.get(index, 0) + 1
+        pos = corpus_lower.find(query_lower, pos + len(query_lower))
+
+    # Top `limit` by relevance (earlier sections win ties); previews are only
+    # built for the sections that are returned
+    top = heapq.nlargest(limit, counts, key=lambda i: (counts[i], -i))
+
     results = []
+    for index in top:
+        title, content = sections[index]
+        # Get first 500 chars of content
+        preview = content[:500] + "..." if len(content) > 500 else content
 
-    # Split by ## headers
-    sections = learnings_text.split('\n## ')
-    for section in sections[1:]:  # Skip first (title)
-        if query_lower in section.lower():
-            lines = section.split('\n', 1)
-            title = lines[0].strip()
-            content = lines[1] if len(lines) > 1 else ""
+        results.append({
+            'title': title,
+            'preview': preview,
+            'relevance': counts[index]
+        })
 
-            # Get first 500 chars of content
-            preview = content[:500] + "..." if len(content) > 500 else content
+    return tuple(results)
 
-            results.append({
-                'title': title,
-                'preview': preview,
-                'relevance': section.lower().count(query_lower)
-            })
 
-            if len(results) >= limit:
-                break
+def search_learnings_text(query: str, limit: int = 10) -> List[Dict[str, str]]:
+    """Search learnings for query (repeat queries on an unchanged file hit the cache)"""
+    signature = file_signature(LEARNINGS_FILE)
+    if signature is None:
+        return []
+    return [dict(r) for r in _search_learnings(query, limit, *signature)]
 
-    # Sort by relevance
-    results.sort(key=lambda x: x['relevance'], reverse=True)
-    return results
+
+@functools.lru_cache(maxsize=32)
+def _project_file_paths(project_dir: str, mtime_ns: int) -> tuple:
+    """(name, path) of markdown files in a project research dir, re-listed only when the dir changes."""
+    with os.scandir(project_dir) as entries:
+        return tuple(
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
+        )
 
 
 def get_project_research_files(project_name: str) -> Dict[str, str]:
-    """Get research files for a project"""
+    """Get research files for a project
+
+    The listing is cached by directory mtime and each file's contents by its
+    own signature (load_text), so edits to existing files are still picked up.
+    """
     project_dir = RESEARCH_DIR / project_name
-    if not project_dir.exists():
+    try:
+        mtime_ns = os.stat(project_dir).st_mtime_ns
+    except OSError:
         return {}
 
-    files = {}
-    for file_path in project_dir.glob("*.md"):
-        files[file_path.name] = load_text(file_path)
-
-    return files
+    return {
+        name: load_text(path)
+        for name, path in _project_file_paths(str(project_dir), mtime_ns)
+    }
 
 
 def log_finding_to_session(finding: str, finding_type: str = "general") -> bool:
-    """Log a finding to the active session"""
+    """Log a finding to the active session
+
+    Appends one line to the session's findings.jsonl instead of rewriting
+    session_tracker.json; session_tracker.py folds the log into the tracker
+    on capture, and reads here merge it in.
+    """
     tracker = load_json(SESSION_TRACKER)
     if not tracker or 'active_session' not in tracker:
         return False
@@ -161,21 +316,18 @@ def log_finding_to_session(finding: str, finding_type: str = "general") -> bool:
     if not session_id or session_id not in tracker.get('sessions', {}):
         return False
 
-    # Add finding
-    session = tracker['sessions'][session_id]
-    if 'findings_captured' not in session:
-        session['findings_captured'] = []
-
-    session['findings_captured'].append({
+    entry = {
         'text': finding,
         'type': finding_type,
         'timestamp': datetime.now().isoformat()
-    })
+    }
 
     # Save
     try:
-        with open(SESSION_TRACKER, 'w') as f:
-            json.dump(tracker, f, indent=2)
+        log_path = findings_log_path(session_id)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, 'ab') as f:
+            f.write(dumps_json(entry, indent=False) + b"\n")
         return True
     except Exception as e:
         app.server.request_context.session.send_log_message(
@@ -185,6 +337,21 @@ def log_finding_to_session(finding: str, finding_type: str = "general") -> bool:
         return False
 
 
+_pack_selector = None
+
+
+def load_pack_selector():
+    """The select_packs_v2_integrated module, imported on first use."""
+    global _pack_selector
+    if _pack_selector is None:
+        sys.path.insert(0, str(Path(__file__).parent))
+        # Its optional-dependency warnings print to stdout, the MCP channel
+        with contextlib.redirect_stdout(sys.stderr):
+            import select_packs_v2_integrated
+        _pack_selector = select_packs_v2_integrated
+    return _pack_selector
+
+
 # ============================================================================
 # MCP Tool Handlers
 # ============================================================================
@@ -332,7 +499,7 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
                 )]
 
         # Format session info
-        output = f"""# Session: {session.get('topic', 'Unknown')}
+        parts = [f"""# Session: {session.get('topic', 'Unknown')}
 
 **ID:** {session.get('session_id', 'unknown')}
 **Status:** {session.get('status', 'unknown')}
@@ -344,16 +511,16 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
 
 ## Findings
 {len(session.get('findings_captured', []))} findings recorded
-"""
+"""]
 
         # Add findings if present
         findings = session.get('findings_captured', [])
         if findings:
-            output += "\n### Recent Findings:\n"
+            parts.append("\n### Recent Findings:\n")
             for f in findings[-5:]:  # Last 5
-                output += f"\n- **{f.get('type', 'general')}**: {f.get('text', '')[:200]}...\n"
+                parts.append(f"\n- **{f.get('type', 'general')}**: {f.get('text', '')[:200]}...\n")
 
-        return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text="".join(parts))]
 
     elif name == "search_learnings":
         query = arguments["query"]
@@ -367,14 +534,16 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
                 text=f"No learnings found for query: {query}"
             )]
 
-        output = f"# Search Results for: {query}\n\nFound {len(results)} relevant sections:\n\n"
+        parts = [f"# Search Results for: {query}\n\nFound {len(results)} relevant sections:\n\n"]
 
         for i, result in enumerate(results, 1):
-            output += f"## {i}. {result['title']}\n\n"
-            output += f"{result['preview']}\n\n"
-            output += f"**Relevance Score:** {result['relevance']}\n\n---\n\n"
+            parts.append(
+                f"## {i}. {result['title']}\n\n"
+                f"{result['preview']}\n\n"
+                f"**Relevance Score:** {result['relevance']}\n\n---\n\n"
+            )
 
-        return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text="".join(parts))]
 
     elif name == "get_project_research":
         project_name = arguments["project_name"].lower()
@@ -387,16 +556,14 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
                 text=f"No research files found for project: {project_name}"
             )]
 
-        output = f"# Research Files for: {project_name}\n\n"
-        output += f"Found {len(files)} files:\n\n"
+        parts = [f"# Research Files for: {project_name}\n\nFound {len(files)} files:\n\n"]
 
         for filename, content in files.items():
-            output += f"## {filename}\n\n"
             # Include first 1000 chars of each file
             preview = content[:1000] + "..." if len(content) > 1000 else content
-            output += f"{preview}\n\n---\n\n"
+            parts.append(f"## {filename}\n\n{preview}\n\n---\n\n")
 
-        return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text="".join(parts))]
 
     elif name == "log_finding":
         finding = arguments["finding"]
@@ -420,19 +587,18 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
         budget = arguments.get("budget", 50000)
         use_v1 = arguments.get("use_v1", False)
 
-        # Import and use Context Packs selector
+        # Use Context Packs selector (imported once, normally at startup)
         try:
-            sys.path.insert(0, str(Path(__file__).parent))
-            from select_packs_v2_integrated import PackSelectorV2Integrated, format_output
+            pack_selector = load_pack_selector()
 
-            selector = PackSelectorV2Integrated(force_v1=use_v1)
+            selector = pack_selector.PackSelectorV2Integrated(force_v1=use_v1)
             packs, metadata = selector.select_packs(
                 context=query,
                 token_budget=budget,
                 enable_pruning=True
             )
 
-            output = format_output(packs, metadata, output_format='text')
+            output = pack_selector.format_output(packs, metadata, output_format='text')
 
             return [TextContent(type="text", text=output)]
 
@@ -455,7 +621,7 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
         return [TextContent(type="text", text=content)]
 
     elif name == "list_projects":
-        projects = load_json(PROJECTS_FILE)
+        projects = get_projects()
 
         if not projects:
             return [TextContent(
@@ -463,29 +629,31 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
                 text="No projects found"
             )]
 
-        output = "# Tracked Projects\n\n"
+        parts = ["# Tracked Projects\n\n"]
 
         for name, data in projects.items():
-            output += f"## {name}\n\n"
-            output += f"**Status:** {data.get('status', 'unknown')}\n"
-            output += f"**Tech Stack:** {data.get('tech_stack', 'unknown')}\n"
-            output += f"**Focus:** {', '.join(data.get('focus_areas', []))}\n\n"
+            parts.append(
+                f"## {name}\n\n"
+                f"**Status:** {data.get('status', 'unknown')}\n"
+                f"**Tech Stack:** {data.get('tech_stack', 'unknown')}\n"
+                f"**Focus:** {', '.join(data.get('focus_areas', []))}\n\n"
+            )
 
-        return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text="".join(parts))]
 
     elif name == "get_session_stats":
         tracker = load_json(SESSION_TRACKER)
-        projects = load_json(PROJECTS_FILE)
+        stats = get_project_stats()
 
         # Count stats
         total_sessions = len(tracker.get('sessions', {}))
         archived = sum(1 for s in tracker.get('sessions', {}).values() if s.get('status') == 'archived')
 
         # Count from projects.json if available
-        total_concepts = projects.get('_stats', {}).get('concepts', 0)
-        total_papers = projects.get('_stats', {}).get('papers', 0)
-        total_urls = projects.get('_stats', {}).get('urls', 0)
-        wallet_value = projects.get('_stats', {}).get('cognitive_wallet', 0)
+        total_concepts = stats.get('concepts', 0)
+        total_papers = stats.get('papers', 0)
+        total_urls = stats.get('urls', 0)
+        wallet_value = stats.get('cognitive_wallet', 0)
 
         output = f"""# ResearchGravity Statistics
 
@@ -499,7 +667,7 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
 
 **Cognitive Wallet Value:** ${wallet_value:.2f}
 
-**Projects:** {len([k for k in projects.keys() if not k.startswith('_')])}
+**Projects:** {len(get_projects())}
 """
 
         return [TextContent(type="text", text=output)]
@@ -540,15 +708,13 @@ async def list_resources() -> List[Any]:
     ]
 
     # Add project resources
-    projects = load_json(PROJECTS_FILE)
-    for project_name in projects.keys():
-        if not project_name.startswith('_'):
-            resources.append({
-                "uri": f"project://{project_name}/research",
-                "name": f"{project_name} Research",
-                "description": f"Research files for {project_name} project",
-                "mimeType": "text/markdown"
-            })
+    for project_name in get_projects():
+        resources.append({
+            "uri": f"project://{project_name}/research",
+            "name": f"{project_name} Research",
+            "description": f"Research files for {project_name} project",
+            "mimeType": "text/markdown"
+        })
 
     return resources
 
@@ -561,7 +727,7 @@ async def read_resource(uri: str) -> str:
         session = get_active_session()
         if not session:
             return json.dumps({"error": "No active session"})
-        return json.dumps(session, indent=2)
+        return dumps_json(session).decode()
 
     elif uri == "learnings://all":
         return load_text(LEARNINGS_FILE)
@@ -577,11 +743,11 @@ async def read_resource(uri: str) -> str:
             files = get_project_research_files(project_name)
 
             # Combine all files
-            output = f"# Research Files for {project_name}\n\n"
+            chunks = [f"# Research Files for {project_name}\n\n"]
             for filename, content in files.items():
-                output += f"## {filename}\n\n{content}\n\n---\n\n"
+                chunks.append(f"## {filename}\n\n{content}\n\n---\n\n")
 
-            return output
+            return "".join(chunks)
 
     return f"Resource not found: {uri}"
 
@@ -592,6 +758,13 @@ async def read_resource(uri: str) -> str:
 
 async def main():
     """Run the MCP server"""
+    # Pay the Context Packs import before the first request rather than in it;
+    # on failure select_context_packs retries and reports the error
+    try:
+        load_pack_selector()
+    except Exception:
+        pass
+
     async with stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,
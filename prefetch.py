@@ -17,20 +17,39 @@ Usage:
   python3 prefetch.py --inject                 # Inject into CLAUDE.md
 """
 
-import argparse
+import bisect
+import functools
+import itertools
 import json
 import os
 import re
-import subprocess
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional, List, Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(raw: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 AGENT_CORE_DIR = Path.home() / ".agent-core"
 PROJECTS_FILE = AGENT_CORE_DIR / "projects.json"
 LEARNINGS_FILE = AGENT_CORE_DIR / "memory" / "learnings.md"
 MEMORY_DIR = AGENT_CORE_DIR / "memory" / "projects"
+LEARNINGS_INDEX_PATH = AGENT_CORE_DIR / "memory" / "learnings.sqlite"
 HOME_CLAUDE_MD = Path.home() / "CLAUDE.md"
 
 # Co-evolution integration
@@ -43,6 +62,21 @@ COEVO_CONFIG = CLAUDE_DIR / "kernel" / "coevo-config.json"
 CONTEXT_START = "<!-- PREFETCHED CONTEXT START -->"
 CONTEXT_END = "<!-- PREFETCHED CONTEXT END -->"
 
+# One worker per independent loader in prefetch()
+PREFETCH_WORKERS = 3
+
+# Characters of project memory / each learning shown in the context block
+PROJECT_MEMORY_PREVIEW_CHARS = 1500
+LEARNING_PREVIEW_CHARS = 800
+PAPERS_TABLE_LIMIT = 10  # Rows in the context block's papers table
+
+# Compiled once at import
+SECTION_SPLIT_RE = re.compile(r'\n## ')
+SECTION_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+INJECTED_CONTEXT_RE = re.compile(
+    re.escape(CONTEXT_START) + r'.*?' + re.escape(CONTEXT_END), re.DOTALL
+)
+
 # Pattern-specific research foundations for recursive novelty
 PATTERN_RESEARCH_PAPERS = {
     "debugging": {
@@ -88,9 +122,168 @@ PATTERN_RESEARCH_PAPERS = {
 }
 
 
+@functools.lru_cache(maxsize=4)
+def _split_learnings(mtime_ns: int, size: int) -> tuple:
+    """
+    Every '## '-separated chunk of learnings.md (header first) as
+    (section, section_lower) pairs in file order, split once per file
+    version (mtime, size). The lowercased text is shared by all filters.
+    """
+    content = LEARNINGS_FILE.read_text()
+    return tuple(zip(
+        SECTION_SPLIT_RE.split(content),
+        SECTION_SPLIT_RE.split(content.lower()),
+    ))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_learnings(mtime_ns: int, size: int) -> tuple:
+    """
+    Dated sections of learnings.md as (date_str, section, section_lower),
+    most recent first (file order within a date).
+    """
+    parsed = []
+    for section, section_lower in _split_learnings(mtime_ns, size)[1:]:  # Skip header
+        if not section.strip():
+            continue
+
+        # Extract date from first line
+        first_line = section.split('\n', 1)[0]
+        date_match = SECTION_DATE_RE.match(first_line)
+        if date_match:
+            parsed.append((date_match.group(1), section, section_lower))
+    parsed.sort(key=lambda entry: entry[0], reverse=True)
+    return tuple(parsed)
+
+
+LEARNINGS_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS learnings_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS learnings (
+    id INTEGER PRIMARY KEY,  -- recency order, 0 = most recent
+    date TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS learnings_fts USING fts5(
+    body,
+    content='learnings',
+    content_rowid='id',
+    tokenize='trigram'
+);
+"""
+
+
+class LearningsIndex:
+    """
+    Derived SQLite/FTS5 copy of the parsed learnings.md sections.
+
+    learnings.md stays the source of truth; the index is rebuilt when the
+    file's (mtime, size) changes, so later CLI runs read sections from
+    SQLite instead of re-parsing the markdown. The trigram tokenizer
+    supports substring matching, which lets a topic prefilter candidate
+    sections before the exact checks in load_learnings.
+    """
+
+    def __init__(self, db_path: Path = LEARNINGS_INDEX_PATH):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._synced: Optional[str] = None
+        self.available = True
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.available:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                # Used from prefetch()'s worker threads, one at a time
+                conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                conn.executescript(LEARNINGS_INDEX_SCHEMA)
+                self._conn = conn
+            except (sqlite3.Error, OSError):
+                # SQLite without FTS5/trigram, or an unwritable location
+                self.available = False
+        return self._conn
+
+    def _sync(self, conn: sqlite3.Connection, mtime_ns: int, size: int) -> None:
+        """Rebuild the tables if learnings.md changed since the last build."""
+        signature = f"{mtime_ns}:{size}"
+        if self._synced == signature:
+            return
+        row = conn.execute("SELECT value FROM learnings_meta WHERE key = 'signature'").fetchone()
+        if not (row and row[0] == signature):
+            with conn:
+                conn.execute("DELETE FROM learnings")
+                conn.executemany(
+                    "INSERT INTO learnings (id, date, body) VALUES (?, ?, ?)",
+                    (
+                        (position, date_str, section)
+                        for position, (date_str, section, _) in enumerate(_parse_learnings(mtime_ns, size))
+                    ),
+                )
+                conn.execute("INSERT INTO learnings_fts (learnings_fts) VALUES ('rebuild')")
+                conn.execute(
+                    "INSERT OR REPLACE INTO learnings_meta (key, value) VALUES ('signature', ?)",
+                    (signature,),
+                )
+        self._synced = signature
+
+    def sections(self, mtime_ns: int, size: int, topic: Optional[str] = None):
+        """
+        (date_str, section, section_lower), most recent first, like
+        _parse_learnings.
+
+        With a topic of 3+ characters only sections containing it
+        (case-insensitively) are returned. Returns None when the index is
+        unavailable so callers can fall back to parsing the file.
+        """
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            self._sync(conn, mtime_ns, size)
+            if topic and len(topic) >= 3:
+                # Quoted as a phrase so topic text is never parsed as FTS syntax
+                rows = conn.execute(
+                    """SELECT date, body FROM learnings
+                       WHERE id IN (SELECT rowid FROM learnings_fts WHERE learnings_fts MATCH ?)
+                       ORDER BY id""",
+                    ('"' + topic.replace('"', '""') + '"',),
+                )
+            else:
+                rows = conn.execute("SELECT date, body FROM learnings ORDER BY id")
+        except sqlite3.Error:
+            self.available = False
+            return None
+        return ((date_str, body, body.lower()) for date_str, body in rows)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+# Last-resort cwd substrings for projects that aren't registered by path
+FALLBACK_PROJECT_MARKERS = (
+    ("os-app", "os-app"),
+    ("osapp", "os-app"),
+    ("careercoach", "careercoach"),
+    ("researchgravity", "researchgravity"),
+    ("metaventions", "metaventions"),
+)
+
+
 class ContextPrefetcher:
     def __init__(self):
         self.projects_data = self._load_projects()
+        self._path_index, self._name_tokens = self._index_projects()
+        self._papers = None  # See _paper_columns
+        self._paper_corpus = None  # See _papers_matching_text
+        self.learnings_index = LearningsIndex()
         self.stats_cache = self._load_stats_cache()
         self.detected_patterns = self._load_detected_patterns()
         self.coevo_config = self._load_coevo_config()
@@ -99,7 +292,7 @@ class ContextPrefetcher:
         """Load stats-cache.json for temporal analysis."""
         if STATS_CACHE.exists():
             try:
-                return json.loads(STATS_CACHE.read_text())
+                return loads_json(STATS_CACHE.read_bytes())
             except (json.JSONDecodeError, IOError):
                 pass
         return {}
@@ -108,7 +301,7 @@ class ContextPrefetcher:
         """Load detected-patterns.json."""
         if DETECTED_PATTERNS.exists():
             try:
-                return json.loads(DETECTED_PATTERNS.read_text())
+                return loads_json(DETECTED_PATTERNS.read_bytes())
             except (json.JSONDecodeError, IOError):
                 pass
         return {}
@@ -117,7 +310,7 @@ class ContextPrefetcher:
         """Load co-evolution config."""
         if COEVO_CONFIG.exists():
             try:
-                return json.loads(COEVO_CONFIG.read_text())
+                return loads_json(COEVO_CONFIG.read_bytes())
             except (json.JSONDecodeError, IOError):
                 pass
         return {"proactive": {"predictPatterns": True}}
@@ -226,11 +419,11 @@ class ContextPrefetcher:
 
     def _load_pattern_memories(self, pattern: str) -> str:
         """Load pattern-specific memories from learnings."""
-        if not LEARNINGS_FILE.exists():
+        try:
+            stat = LEARNINGS_FILE.stat()
+        except OSError:
             return ""
 
-        content = LEARNINGS_FILE.read_text()
-
         # Keywords associated with each pattern
         pattern_keywords = {
             "debugging": ["error", "fix", "bug", "debug", "issue"],
@@ -249,10 +442,9 @@ class ContextPrefetcher:
 
         # Find relevant sections
         relevant = []
-        sections = re.split(r'\n## ', content)
+        sections = _split_learnings(stat.st_mtime_ns, stat.st_size)
 
-        for section in sections[:20]:  # Limit scan
-            section_lower = section.lower()
+        for section, section_lower in sections[:20]:  # Limit scan
             if any(kw in section_lower for kw in keywords):
                 # Extract first meaningful line
                 first_lines = section.split('\n')[:3]
@@ -300,43 +492,75 @@ class ContextPrefetcher:
         """Load projects.json registry."""
         if PROJECTS_FILE.exists():
             try:
-                return json.loads(PROJECTS_FILE.read_text())
+                data = loads_json(PROJECTS_FILE.read_bytes())
             except (json.JSONDecodeError, IOError):
                 pass
+            else:
+                self._intern_project_ids(data)
+                return data
         return {"projects": {}, "paper_index": {}, "topic_index": {}}
 
-    def detect_project(self) -> Optional[str]:
+    @staticmethod
+    def _intern_project_ids(data: Dict[str, Any]) -> None:
         """
-        Detect project from current working directory.
-        Uses projects.json path matching and name inference.
+        Intern the project IDs repeated across paper_index entries, so they
+        share one string each and membership tests against an interned
+        project ID hit the identity fast path.
         """
-        cwd = str(Path.cwd()).lower()
+        for info in data.get("paper_index", {}).values():
+            projects = info.get("projects") if isinstance(info, dict) else None
+            if isinstance(projects, list):
+                info["projects"] = [sys.intern(p) if isinstance(p, str) else p for p in projects]
 
-        # Check against registered project paths
+    def _index_projects(self):
+        """
+        Build the lookups detect_project uses, once per registry load:
+        normalized expanded path -> project_id, and (normalized name,
+        project_id) pairs, longest name first.
+        """
+        path_index = {}
+        name_tokens = []
         for project_id, project in self.projects_data.get("projects", {}).items():
             project_path = project.get("path", "")
             if project_path:
                 expanded = str(Path(project_path).expanduser()).lower()
-                if expanded in cwd or cwd in expanded:
-                    return project_id
-
-        # Check by project name in path
-        for project_id, project in self.projects_data.get("projects", {}).items():
+                path_index.setdefault(expanded, project_id)
             name = project.get("name", "").lower().replace(" ", "").replace("-", "")
             if name:
-                cwd_clean = cwd.replace("/", "").replace("-", "").replace("_", "")
-                if name in cwd_clean:
-                    return project_id
+                name_tokens.append((name, project_id))
+        name_tokens.sort(key=lambda token: len(token[0]), reverse=True)
+        return path_index, name_tokens
+
+    def detect_project(self) -> Optional[str]:
+        """
+        Detect project from current working directory.
+        Uses projects.json path matching and name inference.
+        """
+        cwd_path = Path.cwd()
+        cwd = str(cwd_path).lower()
+
+        # Registered project at the cwd or one of its ancestors (deepest wins)
+        for directory in (cwd_path, *cwd_path.parents):
+            project_id = self._path_index.get(str(directory).lower())
+            if project_id:
+                return project_id
+
+        # Registered project somewhere below the cwd
+        prefix = cwd.rstrip("/") + "/"
+        for expanded, project_id in self._path_index.items():
+            if expanded.startswith(prefix):
+                return project_id
+
+        # Check by project name in path
+        cwd_clean = cwd.replace("/", "").replace("-", "").replace("_", "")
+        for name, project_id in self._name_tokens:
+            if name in cwd_clean:
+                return project_id
 
         # Fallback: check common patterns
-        if "os-app" in cwd or "osapp" in cwd:
-            return "os-app"
-        elif "careercoach" in cwd:
-            return "careercoach"
-        elif "researchgravity" in cwd:
-            return "researchgravity"
-        elif "metaventions" in cwd:
-            return "metaventions"
+        for marker, project_id in FALLBACK_PROJECT_MARKERS:
+            if marker in cwd:
+                return project_id
 
         return None
 
@@ -356,101 +580,117 @@ class ContextPrefetcher:
         3. If days specified: filter by date
         4. Always sort by recency
         """
-        if not LEARNINGS_FILE.exists():
+        try:
+            stat = LEARNINGS_FILE.stat()
+        except OSError:
             return []
 
-        content = LEARNINGS_FILE.read_text()
         learnings = []
 
-        # Parse learnings by section (## headers)
-        sections = re.split(r'\n## ', content)
-
-        for section in sections[1:]:  # Skip header
-            if not section.strip():
-                continue
-
-            # Extract date from first line
-            first_line = section.split('\n')[0]
-            date_match = re.match(r'(\d{4}-\d{2}-\d{2})', first_line)
-            if not date_match:
-                continue
+        # Sections by '## ' header, from the SQLite index when available or
+        # the cached parse otherwise. They come newest first, so stop once
+        # `limit` have matched
+        sections = self.learnings_index.sections(stat.st_mtime_ns, stat.st_size, topic)
+        if sections is None:
+            sections = _parse_learnings(stat.st_mtime_ns, stat.st_size)
+
+        project_lower = project.lower() if project else None
+        topic_lower = topic.lower() if topic else None
+
+        # A section dated D (midnight) is kept while D >= now - days, i.e. from
+        # the first whole day at or after the cutoff
+        earliest_date = None
+        if days:
+            cutoff = datetime.now() - timedelta(days=days)
+            earliest_date = ((cutoff - timedelta(microseconds=1)).date() + timedelta(days=1)).isoformat()
+        if project:
+            project_data = self.projects_data.get("projects", {}).get(project, {})
+            # One compiled alternation scans a section once for any of the
+            # project's session IDs (first 30 chars), however many there are
+            session_prefixes = [s[:30] for s in project_data.get("sessions", [])]
+            session_re = (
+                re.compile("|".join(map(re.escape, session_prefixes)))
+                if session_prefixes else None
+            )
 
-            date_str = date_match.group(1)
+        for date_str, section, section_lower in sections:
+            if len(learnings) >= limit:
+                break
 
-            # Apply date filter
-            if days:
-                try:
-                    section_date = datetime.strptime(date_str, "%Y-%m-%d")
-                    cutoff = datetime.now() - timedelta(days=days)
-                    if section_date < cutoff:
-                        continue
-                except ValueError:
-                    pass
+            # Apply date filter (ISO dates compare correctly as strings, and
+            # every later section is older still)
+            if earliest_date and date_str < earliest_date:
+                break
 
-            # Apply project filter
-            if project:
-                project_lower = project.lower()
-                if f"**project:** {project_lower}" not in section.lower() and project_lower not in section.lower():
-                    # Check if project is linked in lineage
-                    project_data = self.projects_data.get("projects", {}).get(project, {})
-                    sessions = project_data.get("sessions", [])
-                    session_in_section = any(s[:30] in section for s in sessions)
-                    if not session_in_section:
-                        continue
+            # Apply project filter (a "**project:** x" line contains x, so
+            # one check covers both forms)
+            if project and project_lower not in section_lower:
+                # Check if project is linked in lineage
+                session_in_section = session_re is not None and session_re.search(section)
+                if not session_in_section:
+                    continue
 
             # Apply topic filter
-            if topic:
-                topic_lower = topic.lower()
-                if topic_lower not in section.lower():
-                    continue
+            if topic and topic_lower not in section_lower:
+                continue
 
+            # Only the preview (plus one char to flag truncation) is rendered
             learnings.append({
                 "date": date_str,
-                "content": "## " + section.strip(),
-                "raw": section
+                "content": ("## " + section.strip())[:LEARNING_PREVIEW_CHARS + 1]
             })
 
-        # Sort by date (most recent first) and limit
-        learnings.sort(key=lambda x: x["date"], reverse=True)
-        return learnings[:limit]
-
-    def load_project_memory(self, project_id: str) -> Optional[str]:
-        """Load project-specific memory from memory/projects/[project].md"""
-        memory_path = MEMORY_DIR / f"{project_id}.md"
-        if memory_path.exists():
-            return memory_path.read_text()
+        return learnings
 
-        # Check if projects.json has a memory path
-        project = self.projects_data.get("projects", {}).get(project_id, {})
-        mem_path = project.get("memory")
-        if mem_path:
-            expanded = Path(mem_path).expanduser()
-            if expanded.exists():
-                return expanded.read_text()
+    def load_project_memory(self, project_id: str, max_chars: Optional[int] = None) -> Optional[str]:
+        """
+        Load project-specific memory from memory/projects/[project].md
 
-        return None
+        With max_chars, at most that many characters are read.
+        """
+        memory_path = MEMORY_DIR / f"{project_id}.md"
+        if not memory_path.exists():
+            # Check if projects.json has a memory path
+            project = self.projects_data.get("projects", {}).get(project_id, {})
+            mem_path = project.get("memory")
+            if not mem_path:
+                return None
+            memory_path = Path(mem_path).expanduser()
+            if not memory_path.exists():
+                return None
+
+        with open(memory_path) as f:
+            return f.read(-1 if max_chars is None else max_chars)
 
     def load_relevant_papers(
         self,
         project: Optional[str] = None,
-        topic: Optional[str] = None
+        topic: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Load relevant arXiv papers from paper_index."""
+        """
+        Load relevant arXiv papers from paper_index, then the project's
+        key_papers. With limit, stop once that many papers are collected.
+        """
         papers = []
-        paper_index = self.projects_data.get("paper_index", {})
+        ids, infos, paper_projects = self._paper_columns()
+        if project:
+            project = sys.intern(project)  # See _intern_project_ids
+        topic_hits = self._papers_matching_text(topic.lower()) if topic else ()
+
+        for index, arxiv_id in enumerate(ids):
+            if limit is not None and len(papers) >= limit:
+                return papers
 
-        for arxiv_id, info in paper_index.items():
             include = False
 
             # Include if matches project
-            if project and project in info.get("projects", []):
+            if project and project in paper_projects[index]:
                 include = True
 
             # Include if matches topic
-            if topic:
-                topic_lower = topic.lower()
-                if topic_lower in str(info).lower():
-                    include = True
+            elif index in topic_hits:
+                include = True
 
             # If no filters, include all
             if not project and not topic:
@@ -459,16 +699,20 @@ class ContextPrefetcher:
             if include:
                 papers.append({
                     "id": arxiv_id,
-                    "projects": info.get("projects", []),
-                    "sessions": info.get("sessions", []),
+                    "projects": paper_projects[index],
+                    "sessions": infos[index].get("sessions", []),
                     "url": f"https://arxiv.org/abs/{arxiv_id}"
                 })
 
         # Also get papers from project's key_papers
         if project:
             project_data = self.projects_data.get("projects", {}).get(project, {})
+            seen_ids = {p["id"] for p in papers}
             for paper in project_data.get("key_papers", []):
-                if paper.get("id") not in [p["id"] for p in papers]:
+                if limit is not None and len(papers) >= limit:
+                    break
+                if paper.get("id") not in seen_ids:
+                    seen_ids.add(paper.get("id", ""))
                     papers.append({
                         "id": paper.get("id", ""),
                         "title": paper.get("title", ""),
@@ -478,6 +722,56 @@ class ContextPrefetcher:
 
         return papers
 
+    @staticmethod
+    def _paper_search_text(info: Dict[str, Any]) -> str:
+        """Lowercased string values of a paper_index entry."""
+        values = []
+        for value in info.values():
+            if isinstance(value, str):
+                values.append(value)
+            elif isinstance(value, (list, tuple)):
+                values.extend(v for v in value if isinstance(v, str))
+        return "\n".join(values).lower()
+
+    def _paper_columns(self):
+        """
+        paper_index as parallel lists (ids, infos, projects), built once per
+        instance so scans iterate flat lists instead of nested dicts.
+        """
+        if self._papers is None:
+            paper_index = self.projects_data.get("paper_index", {})
+            ids = list(paper_index)
+            infos = list(paper_index.values())
+            projects = [info.get("projects", []) for info in infos]
+            self._papers = (ids, infos, projects)
+        return self._papers
+
+    def _papers_matching_text(self, text_lower: str) -> set:
+        """
+        Indexes (into _paper_columns) of papers whose search text contains
+        text_lower, found with str.find over one NUL-joined corpus.
+        """
+        if self._paper_corpus is None:
+            _, infos, _ = self._paper_columns()
+            starts, offset = [], 0
+            texts = []
+            for info in infos:
+                text = self._paper_search_text(info)
+                starts.append(offset)
+                texts.append(text)
+                offset += len(text) + 1
+            self._paper_corpus = ("\0".join(texts), starts)
+
+        corpus, starts = self._paper_corpus
+        hits = set()
+        pos = corpus.find(text_lower)
+        while pos != -1:
+            index = bisect.bisect_right(starts, pos) - 1
+            hits.add(index)
+            # Resume at the next paper; one hit per paper is enough
+            pos = corpus.find(text_lower, starts[index + 1]) if index + 1 < len(starts) else -1
+        return hits
+
     def get_project_lineage(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get lineage data for a project."""
         project = self.projects_data.get("projects", {}).get(project_id, {})
@@ -487,97 +781,109 @@ class ContextPrefetcher:
         """Get basic project info."""
         return self.projects_data.get("projects", {}).get(project_id)
 
-    def format_context_block(
-        self,
-        project: Optional[str],
-        learnings: List[Dict[str, Any]],
-        project_memory: Optional[str],
-        papers: List[Dict[str, Any]],
-        include_papers: bool = True
-    ) -> str:
-        """Format all context as Claude-ready markdown block."""
-        now = datetime.now().strftime("%Y-%m-%dT%H:%M")
-        lines = []
+    def _project_header(self, project: Optional[str]):
+        project_info = self.get_project_info(project) if project else None
+        if not project_info:
+            return
 
-        lines.append(CONTEXT_START)
-        lines.append(f"<!-- Generated: {now} -->")
-        lines.append("")
+        yield f"## Active Project: {project_info.get('name', project)}"
+        yield ""
 
-        # Project header
-        if project:
-            project_info = self.get_project_info(project)
-            if project_info:
-                lines.append(f"## Active Project: {project_info.get('name', project)}")
-                lines.append("")
-
-                if project_info.get("focus"):
-                    lines.append(f"**Focus:** {', '.join(project_info['focus'])}")
-                if project_info.get("tech_stack"):
-                    lines.append(f"**Tech Stack:** {', '.join(project_info['tech_stack'])}")
-                if project_info.get("status"):
-                    lines.append(f"**Status:** {project_info['status']}")
-                lines.append("")
-
-        # Project memory/identity
-        if project_memory:
-            lines.append("### Project Identity")
-            lines.append("")
-            # Truncate if too long
-            if len(project_memory) > 1500:
-                lines.append(project_memory[:1500] + "\n\n*[truncated]*")
-            else:
-                lines.append(project_memory)
-            lines.append("")
+        if project_info.get("focus"):
+            yield f"**Focus:** {', '.join(project_info['focus'])}"
+        if project_info.get("tech_stack"):
+            yield f"**Tech Stack:** {', '.join(project_info['tech_stack'])}"
+        if project_info.get("status"):
+            yield f"**Status:** {project_info['status']}"
+        yield ""
 
-        # Recent learnings
-        if learnings:
-            days_str = f" (Last {len(learnings)} entries)"
-            lines.append(f"### Recent Learnings{days_str}")
-            lines.append("")
+    @staticmethod
+    def _memory_block(project_memory: Optional[str]):
+        if not project_memory:
+            return
 
-            for learning in learnings[:5]:
-                # Extract just the key parts
-                content = learning["content"]
-                # Get first 500 chars of each section
-                lines.append(content[:800] if len(content) <= 800 else content[:800] + "\n\n*[truncated]*")
-                lines.append("")
+        yield "### Project Identity"
+        yield ""
+        # Truncate if too long
+        if len(project_memory) > PROJECT_MEMORY_PREVIEW_CHARS:
+            yield project_memory[:PROJECT_MEMORY_PREVIEW_CHARS] + "\n\n*[truncated]*"
+        else:
+            yield project_memory
+        yield ""
 
-        # Research papers
-        if include_papers and papers:
-            lines.append("### Relevant Research Papers")
-            lines.append("")
-            lines.append("| arXiv ID | Title/Topic | Projects |")
-            lines.append("|----------|-------------|----------|")
+    @staticmethod
+    def _learnings_block(learnings: List[Dict[str, Any]]):
+        if not learnings:
+            return
 
-            for paper in papers[:10]:
-                arxiv_id = paper.get("id", "")
-                title = paper.get("title") or paper.get("topic") or "—"
-                projects = ", ".join(paper.get("projects", [])) or "—"
-                url = paper.get("url", f"https://arxiv.org/abs/{arxiv_id}")
-                lines.append(f"| [{arxiv_id}]({url}) | {title} | {projects} |")
+        yield f"### Recent Learnings (Last {len(learnings)} entries)"
+        yield ""
 
-            lines.append("")
+        for learning in learnings[:5]:
+            # First LEARNING_PREVIEW_CHARS of each section
+            content = learning["content"]
+            if len(content) > LEARNING_PREVIEW_CHARS:
+                content = content[:LEARNING_PREVIEW_CHARS] + "\n\n*[truncated]*"
+            yield content
+            yield ""
 
-        # Lineage
-        if project:
-            lineage = self.get_project_lineage(project)
-            if lineage:
-                lines.append("### Research Lineage")
-                lines.append("")
+    @staticmethod
+    def _papers_table(papers: List[Dict[str, Any]]):
+        if not papers:
+            return
+
+        yield "### Relevant Research Papers"
+        yield ""
+        yield "| arXiv ID | Title/Topic | Projects |"
+        yield "|----------|-------------|----------|"
 
-                if lineage.get("research_sessions"):
-                    sessions = lineage["research_sessions"][:3]
-                    lines.append(f"**Research Sessions:** {', '.join(s[:40] for s in sessions)}")
+        for paper in papers[:PAPERS_TABLE_LIMIT]:
+            arxiv_id = paper.get("id", "")
+            title = paper.get("title") or paper.get("topic") or "—"
+            projects = ", ".join(paper.get("projects", [])) or "—"
+            url = paper.get("url", f"https://arxiv.org/abs/{arxiv_id}")
+            yield f"| [{arxiv_id}]({url}) | {title} | {projects} |"
 
-                if lineage.get("features_implemented"):
-                    features = lineage["features_implemented"]
-                    lines.append(f"**Features Implemented:** {', '.join(features)}")
+        yield ""
 
-                lines.append("")
+    def _lineage_block(self, project: Optional[str]):
+        lineage = self.get_project_lineage(project) if project else None
+        if not lineage:
+            return
+
+        yield "### Research Lineage"
+        yield ""
+
+        if lineage.get("research_sessions"):
+            sessions = lineage["research_sessions"][:3]
+            yield f"**Research Sessions:** {', '.join(s[:40] for s in sessions)}"
 
-        lines.append(CONTEXT_END)
+        if lineage.get("features_implemented"):
+            features = lineage["features_implemented"]
+            yield f"**Features Implemented:** {', '.join(features)}"
 
-        return "\n".join(lines)
+        yield ""
+
+    def format_context_block(
+        self,
+        project: Optional[str],
+        learnings: List[Dict[str, Any]],
+        project_memory: Optional[str],
+        papers: List[Dict[str, Any]],
+        include_papers: bool = True
+    ) -> str:
+        """Format all context as Claude-ready markdown block."""
+        now = datetime.now().strftime("%Y-%m-%dT%H:%M")
+
+        return "\n".join(itertools.chain(
+            (CONTEXT_START, f"<!-- Generated: {now} -->", ""),
+            self._project_header(project),
+            self._memory_block(project_memory),
+            self._learnings_block(learnings),
+            self._papers_table(papers if include_papers else []),
+            self._lineage_block(project),
+            (CONTEXT_END,),
+        ))
 
     def prefetch(
         self,
@@ -600,21 +906,32 @@ class ContextPrefetcher:
         if proactive and not pattern:
             pattern = self.predict_pattern()
 
-        # Load components
-        learnings = self.load_learnings(
-            project=project,
-            topic=topic,
-            days=days,
-            limit=limit
-        )
-
-        project_memory = None
-        if project:
-            project_memory = self.load_project_memory(project)
+        # Load components. They are independent (two file reads and a scan
+        # of the already-loaded registry), so they run concurrently
+        with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as pool:
+            learnings_future = pool.submit(
+                self.load_learnings,
+                project=project,
+                topic=topic,
+                days=days,
+                limit=limit
+            )
+            memory_future = None
+            if project:
+                memory_future = pool.submit(
+                    self.load_project_memory,
+                    project, max_chars=PROJECT_MEMORY_PREVIEW_CHARS + 1
+                )
+            papers_future = None
+            if include_papers:
+                papers_future = pool.submit(
+                    self.load_relevant_papers,
+                    project=project, topic=topic, limit=PAPERS_TABLE_LIMIT
+                )
 
-        papers = []
-        if include_papers:
-            papers = self.load_relevant_papers(project=project, topic=topic)
+        learnings = learnings_future.result()
+        project_memory = memory_future.result() if memory_future else None
+        papers = papers_future.result() if papers_future else []
 
         # Format context
         context = self.format_context_block(
@@ -645,13 +962,13 @@ class ContextPrefetcher:
 
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard (macOS)."""
+        # pbcopy decodes stdin per LANG; only build a new env if it isn't UTF-8
+        lang = os.environ.get('LANG', '').lower().replace('-', '')
+        env = None if lang.endswith('utf8') else {**os.environ, 'LANG': 'en_US.UTF-8'}
+        import subprocess  # Only needed for --clipboard
+
         try:
-            process = subprocess.Popen(
-                ['pbcopy'],
-                stdin=subprocess.PIPE,
-                env={**os.environ, 'LANG': 'en_US.UTF-8'}
-            )
-            process.communicate(text.encode('utf-8'))
+            subprocess.run(['pbcopy'], input=text.encode('utf-8'), env=env, check=False)
         except Exception as e:
             print(f"Warning: Could not copy to clipboard: {e}")
 
@@ -665,18 +982,47 @@ class ContextPrefetcher:
 
         # Check if markers exist
         if CONTEXT_START in content and CONTEXT_END in content:
-            # Replace between markers
-            pattern = re.escape(CONTEXT_START) + r'.*?' + re.escape(CONTEXT_END)
-            new_content = re.sub(pattern, context, content, flags=re.DOTALL)
+            # Replace between markers (callable so backslashes in context stay literal)
+            new_content = INJECTED_CONTEXT_RE.sub(lambda m: context, content)
         else:
             # Add at the end of the file
             new_content = content.rstrip() + "\n\n## Dynamic Context\n\n" + context + "\n"
 
-        HOME_CLAUDE_MD.write_text(new_content)
+        if new_content == content:
+            print(f"✓ Context in {HOME_CLAUDE_MD} already up to date")
+            return
+
+        # Resolve first so a symlinked CLAUDE.md keeps its link
+        write_text_atomic(HOME_CLAUDE_MD.resolve(), new_content)
         print(f"✓ Context injected into {HOME_CLAUDE_MD}")
 
 
-def main():
+# Fast-path table for parse_args: option string -> (dest, kind)
+CLI_OPTIONS = {
+    "--project": ("project", "str"), "-p": ("project", "str"),
+    "--topic": ("topic", "str"), "-t": ("topic", "str"),
+    "--days": ("days", "int"), "-d": ("days", "int"),
+    "--limit": ("limit", "int"), "-l": ("limit", "int"),
+    "--papers": ("papers", "flag"),
+    "--clipboard": ("clipboard", "flag"), "-c": ("clipboard", "flag"),
+    "--inject": ("inject", "flag"), "-i": ("inject", "flag"),
+    "--json": ("json", "flag"),
+    "--quiet": ("quiet", "flag"), "-q": ("quiet", "flag"),
+    "--pattern": ("pattern", "pattern"), "--pat": ("pattern", "pattern"),
+    "--proactive": ("proactive", "flag"),
+    "--suggest": ("suggest", "flag"),
+}
+
+CLI_DEFAULTS = {
+    "project": None, "topic": None, "days": 14, "limit": 5, "papers": False,
+    "clipboard": False, "inject": False, "json": False, "quiet": False,
+    "pattern": None, "proactive": False, "suggest": False,
+}
+
+
+def build_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Context Prefetcher - Memory injection for Claude sessions"
     )
@@ -699,15 +1045,59 @@ def main():
     parser.add_argument("--quiet", "-q", action="store_true",
                         help="Suppress informational output")
     parser.add_argument("--pattern", "--pat",
-                        choices=["debugging", "research", "refactoring", "testing",
-                                "architecture", "performance", "deployment", "learning"],
+                        choices=list(PATTERN_RESEARCH_PAPERS),
                         help="Load pattern-specific context")
     parser.add_argument("--proactive", action="store_true",
                         help="Auto-predict pattern from time/history")
     parser.add_argument("--suggest", action="store_true",
                         help="Show proactive suggestions for current pattern")
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """
+    Parse CLI arguments without argparse for the plain forms
+    (--opt value, --opt=value, -o value, flags). Anything else, including
+    --help, abbreviations and invalid values, is handed to argparse so
+    help text and errors are unchanged.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    values = dict(CLI_DEFAULTS)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        name, eq, value = arg.partition("=") if arg.startswith("--") else (arg, "", "")
+        option = CLI_OPTIONS.get(name)
+        if option is None:
+            return build_parser().parse_args(argv)
+        dest, kind = option
+
+        if kind == "flag":
+            if eq:
+                return build_parser().parse_args(argv)
+            values[dest] = True
+            continue
+
+        if not eq:
+            if i >= len(argv) or argv[i].startswith("-"):
+                return build_parser().parse_args(argv)
+            value = argv[i]
+            i += 1
+        if kind == "int":
+            # isdigit() alone accepts e.g. '²', which int() rejects
+            if not (value.isascii() and value.isdigit()):
+                return build_parser().parse_args(argv)
+            value = int(value)
+        elif kind == "pattern" and value not in PATTERN_RESEARCH_PAPERS:
+            return build_parser().parse_args(argv)
+        values[dest] = value
+
+    return SimpleNamespace(**values)
 
-    args = parser.parse_args()
+
+def main():
+    args = parse_args()
 
     prefetcher = ContextPrefetcher()
 
@@ -18,6 +18,7 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import hashlib
 from datetime import datetime
@@ -30,6 +31,8 @@ CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
 AGENT_CORE_DIR = Path.home() / ".agent-core"
 SESSIONS_DIR = AGENT_CORE_DIR / "sessions"
 TRACKER_FILE = AGENT_CORE_DIR / "session_tracker.json"
+FINDINGS_LOG_NAME = "findings.jsonl"  # Appended by mcp_server.log_finding
+FINDINGS_FOLDING_NAME = "findings.jsonl.folding"  # Log renamed aside while folding
 LOCAL_AGENT_DIR = Path.cwd() / ".agent"
 
 
@@ -46,12 +49,67 @@ def get_tracker_state() -> Dict[str, Any]:
     }
 
 
+def with_pending_findings(session_id: str, session: Dict[str, Any]) -> Dict[str, Any]:
+    """Session dict with MCP findings not yet folded by a capture merged in."""
+    captured = session.get("findings_captured", [])
+    seen = {(f.get("text"), f.get("timestamp")) for f in captured if isinstance(f, dict)}
+    pending = []
+    for name in (FINDINGS_FOLDING_NAME, FINDINGS_LOG_NAME):
+        try:
+            lines = (SESSIONS_DIR / session_id / name).read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                finding = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            key = (finding.get("text"), finding.get("timestamp"))
+            if key not in seen:
+                seen.add(key)
+                pending.append(finding)
+    if not pending:
+        return session
+    return {**session, "findings_captured": captured + pending}
+
+
 def save_tracker_state(state: Dict[str, Any]):
     """Save tracker state."""
     TRACKER_FILE.parent.mkdir(parents=True, exist_ok=True)
     TRACKER_FILE.write_text(json.dumps(state, indent=2))
 
 
+def fold_pending_findings(session_id: str, session: Dict[str, Any]) -> Optional[Path]:
+    """Merge findings appended by the MCP server (findings.jsonl) into the session.
+
+    The log is renamed aside first, so findings appended while folding go to
+    a fresh log instead of being deleted with this one. Entries already
+    present (same text and timestamp) are skipped, so folding is safe to
+    repeat. Returns the renamed path so the caller can remove it once the
+    tracker has been saved, or None if there was nothing to fold.
+    """
+    session_dir = SESSIONS_DIR / session_id
+    folding_path = session_dir / FINDINGS_FOLDING_NAME
+    if not folding_path.exists():  # else: leftover from an interrupted capture
+        try:
+            os.replace(session_dir / FINDINGS_LOG_NAME, folding_path)
+        except FileNotFoundError:
+            return None
+
+    captured = session.setdefault("findings_captured", [])
+    seen = {(f.get("text"), f.get("timestamp")) for f in captured if isinstance(f, dict)}
+    for line in folding_path.read_text().splitlines():
+        try:
+            finding = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        key = (finding.get("text"), finding.get("timestamp"))
+        if key not in seen:
+            seen.add(key)
+            captured.append(finding)
+    return folding_path
+
+
 def find_claude_session_file() -> Optional[Path]:
     """Find the most recent Claude Code session file for current directory."""
     cwd = str(Path.cwd())
@@ -294,6 +352,9 @@ def capture_session(session_id: Optional[str] = None) -> Dict[str, Any]:
     session = state["sessions"][session_id]
     session_dir = SESSIONS_DIR / session_id
 
+    # Fold findings logged through MCP since the last capture
+    pending_log = fold_pending_findings(session_id, session)
+
     # Find Claude session file
     claude_file = session.get("claude_session_file")
     if claude_file:
@@ -354,6 +415,8 @@ def capture_session(session_id: Optional[str] = None) -> Dict[str, Any]:
     state["sessions"][session_id] = session
     (session_dir / "session.json").write_text(json.dumps(session, indent=2))
     save_tracker_state(state)
+    if pending_log:
+        pending_log.unlink(missing_ok=True)
 
     print(f"Captured session: {session_id}")
     print(f"  URLs extracted: {len(urls)} (total: {len(session['urls_captured'])})")
@@ -414,7 +477,7 @@ def show_status():
     # Active session
     active = state.get("active_session")
     if active and active in state["sessions"]:
-        session = state["sessions"][active]
+        session = with_pending_findings(active, state["sessions"][active])
         print("ACTIVE SESSION")
         print(f"  ID: {active}")
         print(f"  Topic: {session.get('topic', 'N/A')}")
@@ -440,7 +503,7 @@ def show_status():
     for sid, sess in sessions:
         status = "" if sid == active else ""
         urls = len(sess.get("urls_captured", []))
-        findings = len(sess.get("findings_captured", []))
+        findings = len(with_pending_findings(sid, sess).get("findings_captured", []))
         print(f"  {status} {sid[:40]}")
         print(f"      Topic: {sess.get('topic', 'N/A')[:50]}")
         print(f"      URLs: {urls} | Findings: {findings}")
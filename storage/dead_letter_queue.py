@@ -28,16 +28,224 @@ Usage:
 
 import asyncio
 import aiosqlite
+import contextlib
 import json
 import logging
+import os
+import sqlite3
+import time
+import zlib
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable, Awaitable
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Tuple, Union
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger("researchgravity.dlq")
 
+# Connection tuning; RG_DLQ_JOURNAL / RG_DLQ_SYNC override the defaults
+# (e.g. RG_DLQ_SYNC=FULL for deployments that want an fsync per commit)
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNC_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+DEFAULT_JOURNAL_MODE = "WAL"
+DEFAULT_SYNC_LEVEL = "NORMAL"
+BUSY_TIMEOUT_MS = 5000
+MMAP_SIZE = 256 * 1024 * 1024
+MMAP_MIN_DB_BYTES = 4 * 1024 * 1024  # Below this, mmap isn't worth the address space
+AUTO_VACUUM_INCREMENTAL = 2  # PRAGMA auto_vacuum value for INCREMENTAL
+
+# Payloads are stored as JSON bytes; big ones (embeddings, long findings) are
+# zlib-compressed behind a prefix no JSON document can start with
+PAYLOAD_COMPRESS_MIN_BYTES = 4096
+PAYLOAD_COMPRESS_LEVEL = 3
+COMPRESSED_PREFIX = b"\x00z"
+
+DEFAULT_RETRY_CONCURRENCY = 16  # Handlers in flight per retry_failed_writes call
+
+# Adaptive back-off: per-target EWMA of retry failures (1.0 = every retry
+# fails). The exponent of the back-off scales with it, so a target that has
+# recovered drops to ~base delay while a persistent outage keeps 2^n growth.
+RETRY_FAILURE_EWMA_ALPHA = 0.2
+
+# enqueue_failed_write buffers entries in memory; a background task writes
+# them with add_failed_writes_bulk. When the buffer is full the caller falls
+# back to a direct write.
+WRITE_BUFFER_SIZE = 10_000
+FLUSH_BATCH_SIZE = 500
+FLUSH_MAX_ATTEMPTS = 3  # Per entry, before a failing buffered write is given up
+FLUSH_RETRY_DELAY_SECONDS = 1.0
+
+DEFAULT_HANDLER_TIMEOUT_SECONDS = 30.0  # A retry handler running longer counts as failed
+
+# Per-target circuit breaker: after this many consecutive failed retries the
+# target is skipped for the cool-down, then probed again (half-open)
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 300
+
+# Timestamps are INTEGER microseconds since the Unix epoch (UTC)
+US_PER_SECOND = 1_000_000
+US_PER_DAY = 86_400 * US_PER_SECOND
+EPOCH = datetime(1970, 1, 1)
+
+DLQ_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letter_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    operation TEXT NOT NULL,
+    target TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    error TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    max_retries INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    last_retry_at INTEGER,
+    next_retry_at INTEGER
+)
+"""
+
+# Hot statements, kept as constants so every call passes the identical SQL
+# text and hits the connection's prepared-statement cache (sized explicitly
+# so a change in the driver default can't silently shrink it)
+STATEMENT_CACHE_SIZE = 128
+
+INSERT_ENTRY_SQL = """
+    INSERT INTO dead_letter_queue
+    (operation, target, payload, error, status, retry_count,
+     max_retries, created_at, next_retry_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# status is inlined as a literal: SQLite only uses the partial
+# idx_dlq_pending_ready index when the query provably matches it
+SELECT_PENDING_SQL = """
+    SELECT * FROM dead_letter_queue INDEXED BY idx_dlq_pending_ready
+    WHERE status = 'pending' AND next_retry_at <= ?
+    ORDER BY created_at ASC
+    LIMIT ?
+"""
+
+SELECT_PENDING_FOR_TARGET_SQL = """
+    SELECT * FROM dead_letter_queue INDEXED BY idx_dlq_pending_ready
+    WHERE status = 'pending' AND target = ? AND next_retry_at <= ?
+    ORDER BY created_at ASC
+    LIMIT ?
+"""
+
+# Atomic claim: flip ready rows to retrying and read them back in one
+# statement, so two workers can never pick up the same entry
+CLAIM_SUPPORTED = sqlite3.sqlite_version_info >= (3, 35, 0)  # RETURNING
+
+CLAIM_PENDING_SQL = """
+    UPDATE dead_letter_queue
+    SET status = 'retrying', last_retry_at = ?, retry_count = retry_count + 1
+    WHERE id IN (
+        SELECT id FROM dead_letter_queue INDEXED BY idx_dlq_pending_ready
+        WHERE status = 'pending' AND next_retry_at <= ?
+        ORDER BY created_at ASC
+        LIMIT ?
+    )
+    RETURNING *
+"""
+
+CLAIM_PENDING_FOR_TARGET_SQL = """
+    UPDATE dead_letter_queue
+    SET status = 'retrying', last_retry_at = ?, retry_count = retry_count + 1
+    WHERE id IN (
+        SELECT id FROM dead_letter_queue INDEXED BY idx_dlq_pending_ready
+        WHERE status = 'pending' AND target = ? AND next_retry_at <= ?
+        ORDER BY created_at ASC
+        LIMIT ?
+    )
+    RETURNING *
+"""
+
+RELEASE_CLAIM_SQL = """
+    UPDATE dead_letter_queue
+    SET status = 'pending',
+        retry_count = retry_count - 1,
+        next_retry_at = COALESCE(?, next_retry_at)
+    WHERE id = ?
+"""
+
+# Claims left behind by a crashed or cancelled retry run. The attempt stays
+# counted, so an entry whose handler keeps crashing still runs out of retries.
+RECOVER_STALE_CLAIMS_SQL = """
+    UPDATE dead_letter_queue
+    SET status = 'pending'
+    WHERE status = 'retrying' AND last_retry_at < ?
+"""
+
+MARK_RETRYING_SQL = """
+    UPDATE dead_letter_queue
+    SET status = ?, last_retry_at = ?, retry_count = retry_count + 1
+    WHERE id = ?
+"""
+
+APPLY_OUTCOME_SQL = """
+    UPDATE dead_letter_queue
+    SET status = ?,
+        error = COALESCE(?, error),
+        next_retry_at = COALESCE(?, next_retry_at)
+    WHERE id = ?
+"""
+
+# ISO-8601 TEXT -> epoch micros, for tables created before the INTEGER schema.
+# Whole seconds via strftime('%s') plus the fraction parsed as text, so the
+# conversion is exact (a julianday() float round-trip loses microseconds).
+_ISO_TO_US = (
+    "(CAST(strftime('%s', {col}) AS INTEGER) * 1000000"
+    " + CASE WHEN instr({col}, '.') > 0"
+    " THEN CAST(substr(substr({col}, instr({col}, '.') + 1) || '000000', 1, 6) AS INTEGER)"
+    " ELSE 0 END)"
+)
+
+
+def now_us() -> int:
+    """Current UTC time in epoch microseconds."""
+    return time.time_ns() // 1000
+
+
+def iso_from_us(us: Optional[int]) -> Optional[str]:
+    """Format epoch microseconds as a naive-UTC ISO string."""
+    if us is None:
+        return None
+    return (EPOCH + timedelta(microseconds=us)).isoformat()
+
+
+def _pragma_setting(env_var: str, allowed: set, default: str) -> str:
+    """Read a PRAGMA value from the environment, falling back on bad input."""
+    value = os.environ.get(env_var, default).strip().upper()
+    if value not in allowed:
+        logger.warning(f"Ignoring {env_var}={value!r}; using {default}")
+        return default
+    return value
+
+
+def dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload for the BLOB column, compressing large ones."""
+    if ORJSON_AVAILABLE:
+        raw = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        raw = json.dumps(payload).encode()
+    if len(raw) > PAYLOAD_COMPRESS_MIN_BYTES:
+        return COMPRESSED_PREFIX + zlib.compress(raw, PAYLOAD_COMPRESS_LEVEL)
+    return raw
+
+
+def loads_payload(raw: Union[bytes, str]) -> Dict[str, Any]:
+    """Parse a stored payload (BLOB, compressed BLOB, or legacy TEXT JSON)."""
+    if isinstance(raw, bytes) and raw.startswith(COMPRESSED_PREFIX):
+        raw = zlib.decompress(raw[len(COMPRESSED_PREFIX):])
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class DLQStatus(Enum):
     """Status of a dead-letter queue entry."""
@@ -59,12 +267,26 @@ class DLQEntry:
     status: str              # DLQStatus value
     retry_count: int
     max_retries: int
-    created_at: str
-    last_retry_at: Optional[str]
-    next_retry_at: Optional[str]
+    created_at: int                # Epoch microseconds (UTC)
+    last_retry_at: Optional[int]
+    next_retry_at: Optional[int]
+
+    @property
+    def created_at_iso(self) -> str:
+        return iso_from_us(self.created_at)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        data = asdict(self)
+        for key in ("created_at", "last_retry_at", "next_retry_at"):
+            data[key] = iso_from_us(data[key])
+        return data
+
+
+@dataclass
+class BreakerState:
+    """Circuit-breaker state for one retry target."""
+    consecutive_failures: int = 0
+    open_until: int = 0      # Epoch micros; retries are skipped before this
 
 
 class DeadLetterQueue:
@@ -73,7 +295,8 @@ class DeadLetterQueue:
 
     Features:
     - Persistent SQLite storage
-    - Exponential backoff retry
+    - Exponential backoff retry, relaxed per target as retries recover
+    - Handler timeouts and a per-target circuit breaker
     - Metrics and monitoring
     - Automatic cleanup of old entries
     """
@@ -83,7 +306,9 @@ class DeadLetterQueue:
         db_path: Optional[Path] = None,
         max_retries: int = 5,
         base_delay_seconds: int = 60,
-        retention_days: int = 7
+        retention_days: int = 7,
+        expire_before_delete: bool = False,
+        handler_timeout_seconds: float = DEFAULT_HANDLER_TIMEOUT_SECONDS
     ):
         """
         Initialize the dead-letter queue.
@@ -93,58 +318,150 @@ class DeadLetterQueue:
             max_retries: Maximum retry attempts per entry
             base_delay_seconds: Base delay for exponential backoff
             retention_days: How long to keep entries
+            expire_before_delete: Keep old entries as EXPIRED for another
+                retention period before deleting them
+            handler_timeout_seconds: Give up on a retry handler after this long
         """
         self.db_path = db_path or Path.home() / ".agent-core" / "storage" / "dlq.db"
         self.max_retries = max_retries
         self.base_delay_seconds = base_delay_seconds
         self.retention_days = retention_days
+        self.expire_before_delete = expire_before_delete
         self._initialized = False
+        self._db: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
         self._retry_handlers: Dict[str, Callable[..., Awaitable[bool]]] = {}
+        self._retry_failure_ewma: Dict[str, float] = {}
+        self.handler_timeout_seconds = handler_timeout_seconds
+        self._breakers: Dict[str, BreakerState] = {}
+        self._write_buffer: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
 
     async def initialize(self):
         """Initialize the DLQ database."""
         if self._initialized:
             return
 
-        # Ensure directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        async with self._write_lock:
+            if self._initialized:
+                return
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS dead_letter_queue (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    operation TEXT NOT NULL,
-                    target TEXT NOT NULL,
-                    payload TEXT NOT NULL,
-                    error TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'pending',
-                    retry_count INTEGER NOT NULL DEFAULT 0,
-                    max_retries INTEGER NOT NULL,
-                    created_at TEXT NOT NULL,
-                    last_retry_at TEXT,
-                    next_retry_at TEXT
-                )
-            """)
+            # Ensure directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Create indexes
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_dlq_status
-                ON dead_letter_queue(status)
-            """)
+            # One connection is kept open for the lifetime of the queue
+            db = await aiosqlite.connect(
+                self.db_path, cached_statements=STATEMENT_CACHE_SIZE
+            )
+            db.row_factory = aiosqlite.Row
+            await self._apply_pragmas(db)
+
+            await self._create_table(db)
+
+            # Create indexes. Only pending rows are ever scanned for retry,
+            # so the ready index is partial: succeeded/failed/expired rows
+            # never enter it. Older broad status indexes are dropped.
+            for stale_index in ("idx_dlq_status", "idx_dlq_next_retry", "idx_dlq_ready"):
+                await db.execute(f"DROP INDEX IF EXISTS {stale_index}")
             await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_dlq_next_retry
-                ON dead_letter_queue(next_retry_at)
+                CREATE INDEX IF NOT EXISTS idx_dlq_pending_ready
+                ON dead_letter_queue(next_retry_at, target)
+                WHERE status = 'pending'
             """)
             await db.execute("""
                 CREATE INDEX IF NOT EXISTS idx_dlq_target
                 ON dead_letter_queue(target, operation)
             """)
 
+            # Anything still retrying past the handler timeout was orphaned
+            cursor = await db.execute(RECOVER_STALE_CLAIMS_SQL, (
+                now_us() - int(self.handler_timeout_seconds * US_PER_SECOND),
+            ))
+            if cursor.rowcount:
+                logger.warning(f"DLQ recovered {cursor.rowcount} stale retrying entries")
+
             await db.commit()
+            await db.execute("PRAGMA optimize")
 
-        self._initialized = True
+            self._db = db
+            self._initialized = True
         logger.info(f"DLQ initialized at {self.db_path}")
 
+    async def _create_table(self, db: aiosqlite.Connection):
+        """Create the table, rebuilding it if it predates INTEGER timestamps."""
+        columns = {
+            row[1]: (row[2] or "").upper()
+            for row in await db.execute_fetchall("PRAGMA table_info(dead_letter_queue)")
+        }
+        if columns.get("created_at") != "TEXT":
+            await db.execute(DLQ_TABLE_SCHEMA)
+            return
+
+        # TEXT affinity would coerce integer timestamps back into strings,
+        # so copy the rows into a table with the current schema
+        logger.info("Migrating DLQ timestamps to epoch microseconds")
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            await db.execute("ALTER TABLE dead_letter_queue RENAME TO dead_letter_queue_legacy")
+            await db.execute(DLQ_TABLE_SCHEMA)
+            await db.execute(f"""
+                INSERT INTO dead_letter_queue
+                (id, operation, target, payload, error, status, retry_count,
+                 max_retries, created_at, last_retry_at, next_retry_at)
+                SELECT id, operation, target, payload, error, status, retry_count,
+                       max_retries, {_ISO_TO_US.format(col="created_at")},
+                       {_ISO_TO_US.format(col="last_retry_at")},
+                       {_ISO_TO_US.format(col="next_retry_at")}
+                FROM dead_letter_queue_legacy
+            """)
+            await db.execute("DROP TABLE dead_letter_queue_legacy")
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def _apply_pragmas(self, db: aiosqlite.Connection):
+        """Configure journal mode, sync level and timeouts on the connection."""
+        journal = _pragma_setting("RG_DLQ_JOURNAL", JOURNAL_MODES, DEFAULT_JOURNAL_MODE)
+        sync = _pragma_setting("RG_DLQ_SYNC", SYNC_LEVELS, DEFAULT_SYNC_LEVEL)
+
+        # Lets cleanup hand pages back. Setting it only sticks on a new
+        # database, so convert an existing one with a one-time VACUUM.
+        rows = await db.execute_fetchall("PRAGMA auto_vacuum")
+        if rows and rows[0][0] != AUTO_VACUUM_INCREMENTAL:
+            await db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            await db.execute("VACUUM")
+        await db.execute(f"PRAGMA journal_mode={journal}")
+        await db.execute(f"PRAGMA synchronous={sync}")
+        await db.execute("PRAGMA temp_store=MEMORY")
+        await db.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+
+        try:
+            db_size = self.db_path.stat().st_size
+        except OSError:
+            db_size = 0
+        if db_size >= MMAP_MIN_DB_BYTES:
+            await db.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+
+    async def close(self):
+        """Flush buffered writes and close the connection; it reopens on next use."""
+        if self._flusher_task is not None:
+            await self.flush()
+            self._flusher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher_task
+            self._flusher_task = None
+            self._write_buffer = None
+
+        async with self._write_lock:
+            if self._db is not None:
+                try:
+                    await self._db.close()
+                except Exception:
+                    pass  # Ignore close errors during shutdown
+                self._db = None
+            self._initialized = False
+
     def register_retry_handler(
         self,
         operation: str,
@@ -187,27 +504,22 @@ class DeadLetterQueue:
         if not self._initialized:
             await self.initialize()
 
-        now = datetime.utcnow()
-        next_retry = now + timedelta(seconds=self.base_delay_seconds)
+        now = now_us()
+        next_retry = now + self.base_delay_seconds * US_PER_SECOND
 
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("""
-                INSERT INTO dead_letter_queue
-                (operation, target, payload, error, status, retry_count,
-                 max_retries, created_at, next_retry_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        async with self._write_lock:
+            cursor = await self._db.execute(INSERT_ENTRY_SQL, (
                 operation,
                 target,
-                json.dumps(payload),
+                dumps_payload(payload),
                 error,
                 DLQStatus.PENDING.value,
                 0,
                 max_retries or self.max_retries,
-                now.isoformat(),
-                next_retry.isoformat()
+                now,
+                next_retry
             ))
-            await db.commit()
+            await self._db.commit()
             entry_id = cursor.lastrowid
 
         logger.warning(
@@ -215,6 +527,147 @@ class DeadLetterQueue:
         )
         return entry_id
 
+    async def add_failed_writes_bulk(self, entries: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add a batch of failed writes in a single transaction.
+
+        Args:
+            entries: Dicts with "operation", "target", "payload", "error" and
+                optionally "max_retries" (same meaning as add_failed_write).
+                A payload may already be serialized (bytes from dumps_payload).
+
+        Returns:
+            Entry IDs, in the order of ``entries``
+        """
+        if not entries:
+            return []
+
+        if not self._initialized:
+            await self.initialize()
+
+        created_at = now_us()
+        next_retry_at = created_at + self.base_delay_seconds * US_PER_SECOND
+
+        rows = [
+            (
+                entry["operation"],
+                entry["target"],
+                (entry["payload"] if isinstance(entry["payload"], bytes)
+                 else dumps_payload(entry["payload"])),
+                entry["error"],
+                DLQStatus.PENDING.value,
+                0,
+                entry.get("max_retries") or self.max_retries,
+                created_at,
+                next_retry_at
+            )
+            for entry in entries
+        ]
+
+        entry_ids = []
+        async with self._write_lock:
+            try:
+                # executemany() can't report per-row ids, so insert row by row
+                # and commit once; the commit is what dominates the cost
+                for row in rows:
+                    cursor = await self._db.execute(INSERT_ENTRY_SQL, row)
+                    entry_ids.append(cursor.lastrowid)
+                await self._db.commit()
+            except Exception:
+                await self._db.rollback()
+                raise
+
+        logger.warning(f"Added {len(entry_ids)} entries to DLQ in bulk")
+        return entry_ids
+
+    async def enqueue_failed_write(
+        self,
+        operation: str,
+        target: str,
+        payload: Dict[str, Any],
+        error: str,
+        max_retries: Optional[int] = None
+    ):
+        """
+        Buffer a failed write and return without waiting for SQLite.
+
+        Same arguments as add_failed_write. Entries are persisted in
+        batches by a background task; use flush() (or close()) to wait for
+        them. If the buffer is full the entry is written directly instead.
+        The payload is serialized here, so an unserializable one raises for
+        this caller rather than failing a whole batch later.
+        """
+        entry = {
+            "operation": operation,
+            "target": target,
+            "payload": dumps_payload(payload),
+            "error": error,
+            "max_retries": max_retries,
+        }
+
+        if self._write_buffer is None:
+            self._write_buffer = asyncio.Queue(maxsize=WRITE_BUFFER_SIZE)
+            self._flusher_task = asyncio.create_task(self._flush_buffered_writes())
+
+        try:
+            self._write_buffer.put_nowait(entry)
+        except asyncio.QueueFull:
+            await self.add_failed_writes_bulk([entry])
+            return
+
+        logger.warning(f"Queued for DLQ: {operation}@{target}: {error[:100]}")
+
+    async def flush(self):
+        """Wait until every buffered write has been persisted."""
+        if self._write_buffer is not None:
+            await self._write_buffer.join()
+
+    async def _flush_buffered_writes(self):
+        """Background task: drain the write buffer into bulk inserts."""
+        buffer = self._write_buffer
+        while True:
+            # Block for the first entry, then take whatever else piled up
+            # while the previous batch was being written
+            batch = [await buffer.get()]
+            while len(batch) < FLUSH_BATCH_SIZE and not buffer.empty():
+                batch.append(buffer.get_nowait())
+
+            try:
+                await self.add_failed_writes_bulk(batch)
+            except Exception as e:
+                logger.warning(f"DLQ bulk flush of {len(batch)} entries failed: {e}")
+                await self._flush_entries_individually(buffer, batch)
+            finally:
+                for _ in batch:
+                    buffer.task_done()
+
+    async def _flush_entries_individually(self, buffer: asyncio.Queue, batch: List[Dict[str, Any]]):
+        """Write a failed batch entry by entry, re-queueing the ones that still fail."""
+        retry = []
+        for entry in batch:
+            try:
+                await self.add_failed_writes_bulk([entry])
+            except Exception as e:
+                entry["flush_attempts"] = entry.get("flush_attempts", 1) + 1
+                if entry["flush_attempts"] > FLUSH_MAX_ATTEMPTS:
+                    logger.error(
+                        f"DLQ gave up on {entry['operation']}@{entry['target']} "
+                        f"after {FLUSH_MAX_ATTEMPTS} flush attempts: {e}"
+                    )
+                else:
+                    retry.append(entry)
+
+        if retry:
+            # Usually a transient error (e.g. database is locked); back off first
+            await asyncio.sleep(FLUSH_RETRY_DELAY_SECONDS)
+            for entry in retry:
+                try:
+                    buffer.put_nowait(entry)
+                except asyncio.QueueFull:
+                    logger.error(
+                        f"DLQ buffer full, dropped {entry['operation']}@{entry['target']}"
+                    )
+
     async def get_pending_entries(
         self,
         limit: int = 100,
@@ -224,143 +677,315 @@ class DeadLetterQueue:
         if not self._initialized:
             await self.initialize()
 
-        now = datetime.utcnow().isoformat()
+        now = now_us()
+
+        rows = await self._db.execute_fetchall(*self._pending_query(limit, target, now))
+
+        return [self._entry_from_row(row) for row in rows]
+
+    @staticmethod
+    def _pending_query(limit: int, target: Optional[str], now: int) -> Tuple[str, tuple]:
+        if target:
+            return SELECT_PENDING_FOR_TARGET_SQL, (target, now, limit)
+        return SELECT_PENDING_SQL, (now, limit)
+
+    @staticmethod
+    def _entry_from_row(row) -> DLQEntry:
+        return DLQEntry(
+            id=row["id"],
+            operation=row["operation"],
+            target=row["target"],
+            payload=loads_payload(row["payload"]),
+            error=row["error"],
+            status=row["status"],
+            retry_count=row["retry_count"],
+            max_retries=row["max_retries"],
+            created_at=row["created_at"],
+            last_retry_at=row["last_retry_at"],
+            next_retry_at=row["next_retry_at"]
+        )
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+    async def _claim_pending(
+        self,
+        limit: int,
+        target: Optional[str],
+        now: int
+    ) -> List[DLQEntry]:
+        """
+        Mark up to ``limit`` ready entries as retrying and return them.
+
+        Returned entries reflect the claimed state (status retrying,
+        retry_count already incremented), oldest first.
+        """
+        if not self._initialized:
+            await self.initialize()
 
+        if not CLAIM_SUPPORTED:
+            # SQLite < 3.35: select, then mark, under the same lock
+            async with self._write_lock:
+                entries = [
+                    self._entry_from_row(row) for row in await self._db.execute_fetchall(
+                        *self._pending_query(limit, target, now)
+                    )
+                ]
+                await self._db.executemany(MARK_RETRYING_SQL, [
+                    (DLQStatus.RETRYING.value, now, entry.id) for entry in entries
+                ])
+                await self._db.commit()
+            for entry in entries:
+                entry.status = DLQStatus.RETRYING.value
+                entry.retry_count += 1
+                entry.last_retry_at = now
+            return entries
+
+        async with self._write_lock:
             if target:
-                rows = await db.execute_fetchall("""
-                    SELECT * FROM dead_letter_queue
-                    WHERE status = ? AND target = ? AND next_retry_at <= ?
-                    ORDER BY created_at ASC
-                    LIMIT ?
-                """, (DLQStatus.PENDING.value, target, now, limit))
+                rows = await self._db.execute_fetchall(
+                    CLAIM_PENDING_FOR_TARGET_SQL, (now, target, now, limit)
+                )
             else:
-                rows = await db.execute_fetchall("""
-                    SELECT * FROM dead_letter_queue
-                    WHERE status = ? AND next_retry_at <= ?
-                    ORDER BY created_at ASC
-                    LIMIT ?
-                """, (DLQStatus.PENDING.value, now, limit))
-
-        return [
-            DLQEntry(
-                id=row["id"],
-                operation=row["operation"],
-                target=row["target"],
-                payload=json.loads(row["payload"]),
-                error=row["error"],
-                status=row["status"],
-                retry_count=row["retry_count"],
-                max_retries=row["max_retries"],
-                created_at=row["created_at"],
-                last_retry_at=row["last_retry_at"],
-                next_retry_at=row["next_retry_at"]
-            )
-            for row in rows
-        ]
+                rows = await self._db.execute_fetchall(CLAIM_PENDING_SQL, (now, now, limit))
+            await self._db.commit()
 
-    async def retry_entry(self, entry: DLQEntry) -> bool:
-        """
-        Retry a single DLQ entry.
+        # RETURNING doesn't preserve the subquery's ORDER BY
+        entries = [self._entry_from_row(row) for row in rows]
+        entries.sort(key=lambda entry: (entry.created_at, entry.id))
+        return entries
 
-        Returns True if retry succeeded.
-        """
-        handler_key = f"{entry.target}:{entry.operation}"
-        handler = self._retry_handlers.get(handler_key)
-
-        if not handler:
-            logger.error(f"No retry handler for {handler_key}")
-            return False
+    async def _release_claims(
+        self,
+        entries: List[DLQEntry],
+        next_retry_at: Optional[int] = None
+    ):
+        """Return claimed entries to pending without counting an attempt."""
+        if not entries:
+            return
+        async with self._write_lock:
+            await self._db.executemany(
+                RELEASE_CLAIM_SQL, [(next_retry_at, entry.id) for entry in entries]
+            )
+            await self._db.commit()
 
-        now = datetime.utcnow()
+    async def _mark_retrying(self, entries: List[DLQEntry], now: int):
+        """Flag entries as in-flight and bump their retry counters in one commit."""
+        if not entries:
+            return
+        async with self._write_lock:
+            await self._db.executemany(MARK_RETRYING_SQL, [
+                (DLQStatus.RETRYING.value, now, entry.id)
+                for entry in entries
+            ])
+            await self._db.commit()
+
+    async def _apply_outcomes(self, outcomes: List[Tuple[str, Optional[str], Optional[int], int]]):
+        """Write (status, error, next_retry_at, id) outcomes in one commit."""
+        if not outcomes:
+            return
+        async with self._write_lock:
+            await self._db.executemany(APPLY_OUTCOME_SQL, outcomes)
+            await self._db.commit()
 
-        # Mark as retrying
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                UPDATE dead_letter_queue
-                SET status = ?, last_retry_at = ?, retry_count = retry_count + 1
-                WHERE id = ?
-            """, (DLQStatus.RETRYING.value, now.isoformat(), entry.id))
-            await db.commit()
+    async def _run_handler(
+        self,
+        entry: DLQEntry,
+        handler: Callable[..., Awaitable[bool]],
+        now: int,
+        attempt: int
+    ) -> Tuple[bool, Tuple[str, Optional[str], Optional[int], int]]:
+        """
+        Run the retry handler for an entry without touching the database.
 
+        ``attempt`` is the entry's retry count including this try.
+        Returns (succeeded, outcome row for _apply_outcomes).
+        """
         try:
-            success = await handler(entry.payload)
+            success = await asyncio.wait_for(
+                handler(entry.payload), timeout=self.handler_timeout_seconds
+            )
 
             if success:
-                # Mark as succeeded
-                async with aiosqlite.connect(self.db_path) as db:
-                    await db.execute("""
-                        UPDATE dead_letter_queue
-                        SET status = ?
-                        WHERE id = ?
-                    """, (DLQStatus.SUCCEEDED.value, entry.id))
-                    await db.commit()
+                self._record_retry_result(entry.target, failed=False)
                 logger.info(f"DLQ entry {entry.id} succeeded on retry")
-                return True
+                return True, (DLQStatus.SUCCEEDED.value, None, None, entry.id)
             else:
                 raise Exception("Handler returned False")
 
         except Exception as e:
-            new_retry_count = entry.retry_count + 1
-            error_msg = str(e)
+            self._record_retry_result(entry.target, failed=True)
+            if isinstance(e, asyncio.TimeoutError):
+                error_msg = f"Handler timed out after {self.handler_timeout_seconds}s"
+            else:
+                error_msg = str(e)
 
-            if new_retry_count >= entry.max_retries:
+            if attempt >= entry.max_retries:
                 # Mark as permanently failed
-                async with aiosqlite.connect(self.db_path) as db:
-                    await db.execute("""
-                        UPDATE dead_letter_queue
-                        SET status = ?, error = ?
-                        WHERE id = ?
-                    """, (DLQStatus.FAILED.value, error_msg, entry.id))
-                    await db.commit()
                 logger.error(f"DLQ entry {entry.id} permanently failed: {error_msg}")
-            else:
-                # Calculate next retry with exponential backoff
-                delay = self.base_delay_seconds * (2 ** new_retry_count)
-                next_retry = now + timedelta(seconds=delay)
-
-                async with aiosqlite.connect(self.db_path) as db:
-                    await db.execute("""
-                        UPDATE dead_letter_queue
-                        SET status = ?, error = ?, next_retry_at = ?
-                        WHERE id = ?
-                    """, (
-                        DLQStatus.PENDING.value,
-                        error_msg,
-                        next_retry.isoformat(),
-                        entry.id
-                    ))
-                    await db.commit()
-                logger.warning(
-                    f"DLQ entry {entry.id} retry failed, next attempt at {next_retry}"
-                )
+                return False, (DLQStatus.FAILED.value, error_msg, None, entry.id)
+
+            delay = self.backoff_delay(entry.target, attempt)
+            next_retry = now + int(delay * US_PER_SECOND)
+            logger.warning(
+                f"DLQ entry {entry.id} retry failed, next attempt at {iso_from_us(next_retry)}"
+            )
+            return False, (DLQStatus.PENDING.value, error_msg, next_retry, entry.id)
+
+    def _record_retry_result(self, target: str, failed: bool):
+        """Fold one retry outcome into the target's failure EWMA and breaker."""
+        previous = self._retry_failure_ewma.get(target, 1.0)
+        sample = 1.0 if failed else 0.0
+        self._retry_failure_ewma[target] = (
+            RETRY_FAILURE_EWMA_ALPHA * sample + (1 - RETRY_FAILURE_EWMA_ALPHA) * previous
+        )
+
+        breaker = self._breakers.setdefault(target, BreakerState())
+        if not failed:
+            breaker.consecutive_failures = 0
+            breaker.open_until = 0
+            return
+        breaker.consecutive_failures += 1
+        if breaker.consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+            breaker.open_until = now_us() + BREAKER_COOLDOWN_SECONDS * US_PER_SECOND
+            logger.warning(
+                f"DLQ circuit open for {target} after "
+                f"{breaker.consecutive_failures} consecutive failures"
+            )
+
+    def breaker_open_until(self, target: str, now: Optional[int] = None) -> Optional[int]:
+        """When the target's circuit breaker closes again, or None if it is closed."""
+        breaker = self._breakers.get(target)
+        if breaker is None:
+            return None
+        if breaker.open_until > (now if now is not None else now_us()):
+            return breaker.open_until
+        return None
+
+    def backoff_delay(self, target: str, retry_count: int) -> float:
+        """
+        Seconds to wait before the next retry of an entry for ``target``.
+
+        base * 2^(retry_count * failure_rate): with no history the failure
+        rate is 1.0, i.e. plain exponential back-off.
+        """
+        failure_rate = self._retry_failure_ewma.get(target, 1.0)
+        return max(
+            self.base_delay_seconds,
+            self.base_delay_seconds * 2 ** (retry_count * failure_rate)
+        )
+
+    def _handler_for(self, entry: DLQEntry) -> Optional[Callable[..., Awaitable[bool]]]:
+        """Look up the retry handler for an entry, logging when none is registered."""
+        handler_key = f"{entry.target}:{entry.operation}"
+        handler = self._retry_handlers.get(handler_key)
+        if not handler:
+            logger.error(f"No retry handler for {handler_key}")
+        return handler
+
+    async def retry_entry(self, entry: DLQEntry) -> bool:
+        """
+        Retry a single DLQ entry.
+
+        Returns True if retry succeeded.
+        """
+        handler = self._handler_for(entry)
+        if not handler:
+            return False
 
+        now = now_us()
+        if self.breaker_open_until(entry.target, now):
+            logger.debug(f"DLQ circuit open for {entry.target}, skipping entry {entry.id}")
             return False
 
+        if not self._initialized:
+            await self.initialize()
+
+        await self._mark_retrying([entry], now)
+        success, outcome = await self._run_handler(
+            entry, handler, now, entry.retry_count + 1
+        )
+        await self._apply_outcomes([outcome])
+        return success
+
     async def retry_failed_writes(
         self,
         target: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        concurrency: int = DEFAULT_RETRY_CONCURRENCY
     ) -> Dict[str, int]:
         """
         Retry pending entries.
 
+        Handlers run concurrently (bounded by ``concurrency``). Ready
+        entries are claimed (marked retrying) atomically in one statement,
+        and all outcomes land in a second commit.
+
         Args:
             target: Only retry entries for this target
             limit: Maximum entries to retry
+            concurrency: Maximum handlers in flight at once
+
+        Entries whose target's circuit breaker is open are not run; they go
+        back to pending until the breaker's cool-down ends.
 
         Returns:
-            Dict with counts: {"attempted": N, "succeeded": M, "failed": K}
+            Dict with counts: {"attempted": N, "succeeded": M, "failed": K,
+            "skipped": S}
         """
-        entries = await self.get_pending_entries(limit=limit, target=target)
+        now = now_us()
+        entries = await self._claim_pending(limit, target, now)
 
-        results = {"attempted": 0, "succeeded": 0, "failed": 0}
+        results = {"attempted": len(entries), "succeeded": 0, "failed": 0, "skipped": 0}
 
+        runnable = []
+        unhandled = []
         for entry in entries:
-            results["attempted"] += 1
-            if await self.retry_entry(entry):
+            handler = self._handler_for(entry)
+            if handler:
+                runnable.append((entry, handler))
+            else:
+                unhandled.append(entry)
+                results["failed"] += 1
+        await self._release_claims(unhandled)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        outcomes = []
+        deferred: Dict[int, List[DLQEntry]] = {}  # breaker reopen time -> entries
+
+        async def run(entry: DLQEntry, handler: Callable[..., Awaitable[bool]]) -> Optional[bool]:
+            async with semaphore:
+                # Checked once a slot is free, so a breaker tripped by
+                # earlier handlers in this batch stops the rest
+                open_until = self.breaker_open_until(entry.target)
+                if open_until:
+                    deferred.setdefault(open_until, []).append(entry)
+                    return None
+                success, outcome = await self._run_handler(
+                    entry, handler, now, entry.retry_count
+                )
+            outcomes.append(outcome)
+            return success
+
+        try:
+            attempts = await asyncio.gather(
+                *(run(entry, handler) for entry, handler in runnable),
+                return_exceptions=True
+            )
+        finally:
+            # Persist whatever finished, even if the batch was cancelled,
+            # and hand back claims whose handler never completed
+            await self._apply_outcomes(outcomes)
+            for open_until, skipped in deferred.items():
+                await self._release_claims(skipped, next_retry_at=open_until)
+            settled = {outcome[3] for outcome in outcomes}
+            settled.update(entry.id for skipped in deferred.values() for entry in skipped)
+            await self._release_claims(
+                [entry for entry, _handler in runnable if entry.id not in settled]
+            )
+
+        for success in attempts:
+            if success is None:
+                results["skipped"] += 1
+                results["attempted"] -= 1
+            elif success is True:
                 results["succeeded"] += 1
             else:
                 results["failed"] += 1
@@ -371,37 +996,55 @@ class DeadLetterQueue:
         return results
 
     async def cleanup_old_entries(self) -> int:
-        """Remove entries older than retention period."""
+        """
+        Remove entries older than retention period.
+
+        Succeeded/failed (and legacy expired) entries past retention are
+        deleted in one statement. With ``expire_before_delete`` set, they are
+        first kept as EXPIRED for a second retention period instead.
+        """
         if not self._initialized:
             await self.initialize()
 
-        cutoff = (datetime.utcnow() - timedelta(days=self.retention_days)).isoformat()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            # Mark old entries as expired
-            cursor = await db.execute("""
-                UPDATE dead_letter_queue
-                SET status = ?
-                WHERE created_at < ? AND status IN (?, ?)
-            """, (
-                DLQStatus.EXPIRED.value,
-                cutoff,
-                DLQStatus.SUCCEEDED.value,
-                DLQStatus.FAILED.value
-            ))
-            await db.commit()
-            expired_count = cursor.rowcount
-
-            # Delete very old expired entries (2x retention)
-            very_old = (
-                datetime.utcnow() - timedelta(days=self.retention_days * 2)
-            ).isoformat()
-            cursor = await db.execute("""
-                DELETE FROM dead_letter_queue
-                WHERE created_at < ? AND status = ?
-            """, (very_old, DLQStatus.EXPIRED.value))
-            await db.commit()
+        now = now_us()
+        cutoff = now - self.retention_days * US_PER_DAY
+
+        async with self._write_lock:
+            expired_count = 0
+            if self.expire_before_delete:
+                # Mark old entries as expired; delete them at 2x retention
+                cursor = await self._db.execute("""
+                    UPDATE dead_letter_queue
+                    SET status = ?
+                    WHERE created_at < ? AND status IN (?, ?)
+                """, (
+                    DLQStatus.EXPIRED.value,
+                    cutoff,
+                    DLQStatus.SUCCEEDED.value,
+                    DLQStatus.FAILED.value
+                ))
+                expired_count = cursor.rowcount
+                cursor = await self._db.execute("""
+                    DELETE FROM dead_letter_queue
+                    WHERE created_at < ? AND status = ?
+                """, (now - self.retention_days * 2 * US_PER_DAY, DLQStatus.EXPIRED.value))
+            else:
+                cursor = await self._db.execute("""
+                    DELETE FROM dead_letter_queue
+                    WHERE created_at < ? AND status IN (?, ?, ?)
+                """, (
+                    cutoff,
+                    DLQStatus.SUCCEEDED.value,
+                    DLQStatus.FAILED.value,
+                    DLQStatus.EXPIRED.value
+                ))
             deleted_count = cursor.rowcount
+            await self._db.commit()
+
+            if deleted_count:
+                # Return freed pages. The pragma frees one page per step and
+                # execute() steps once; executescript() runs it to completion.
+                await self._db.executescript("PRAGMA incremental_vacuum")
 
         logger.info(f"DLQ cleanup: {expired_count} expired, {deleted_count} deleted")
         return expired_count + deleted_count
@@ -411,38 +1054,38 @@ class DeadLetterQueue:
         if not self._initialized:
             await self.initialize()
 
-        async with aiosqlite.connect(self.db_path) as db:
-            # Count by status
-            rows = await db.execute_fetchall("""
-                SELECT status, COUNT(*) as count
-                FROM dead_letter_queue
-                GROUP BY status
-            """)
-            status_counts = {row[0]: row[1] for row in rows}
-
-            # Count by target
-            rows = await db.execute_fetchall("""
-                SELECT target, COUNT(*) as count
-                FROM dead_letter_queue
-                WHERE status = 'pending'
-                GROUP BY target
-            """)
-            pending_by_target = {row[0]: row[1] for row in rows}
-
-            # Recent failures (last 24h)
-            cutoff = (datetime.utcnow() - timedelta(hours=24)).isoformat()
-            rows = await db.execute_fetchall("""
-                SELECT operation, target, COUNT(*) as count
+        # One round trip: per-(status, target) counts, tagged 'status', plus
+        # the top recent (operation, target) failures, tagged 'recent'
+        cutoff = now_us() - US_PER_DAY
+        rows = await self._db.execute_fetchall("""
+            SELECT 'status' AS kind, status, target, NULL AS operation, COUNT(*) AS count
+            FROM dead_letter_queue
+            GROUP BY status, target
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'recent', NULL, target, operation, COUNT(*) AS count
                 FROM dead_letter_queue
                 WHERE created_at > ?
                 GROUP BY operation, target
                 ORDER BY count DESC
                 LIMIT 10
-            """, (cutoff,))
-            recent_failures = [
-                {"operation": r[0], "target": r[1], "count": r[2]}
-                for r in rows
-            ]
+            )
+        """, (cutoff,))
+
+        status_counts: Dict[str, int] = {}
+        pending_by_target: Dict[str, int] = {}
+        recent_failures = []
+        for kind, status, target, operation, count in rows:
+            if kind == "status":
+                status_counts[status] = status_counts.get(status, 0) + count
+                if status == DLQStatus.PENDING.value:
+                    pending_by_target[target] = count
+            else:
+                recent_failures.append(
+                    {"operation": operation, "target": target, "count": count}
+                )
+        # UNION ALL doesn't promise to keep the subquery's ordering
+        recent_failures.sort(key=lambda r: r["count"], reverse=True)
 
         return {
             "status_counts": status_counts,
@@ -453,14 +1096,25 @@ class DeadLetterQueue:
         }
 
 
-# Singleton instance
+# Singleton instance, shared by every StorageEngine in the process
 _dlq_instance: Optional[DeadLetterQueue] = None
+_dlq_refs = 0
 
 
 async def get_dlq() -> DeadLetterQueue:
-    """Get the singleton DLQ instance."""
-    global _dlq_instance
+    """Get the singleton DLQ instance. Pair each call with close_dlq()."""
+    global _dlq_instance, _dlq_refs
     if _dlq_instance is None:
         _dlq_instance = DeadLetterQueue()
         await _dlq_instance.initialize()
+    _dlq_refs += 1
     return _dlq_instance
+
+
+async def close_dlq():
+    """Release a get_dlq() reference; the last release closes the connection."""
+    global _dlq_instance, _dlq_refs
+    _dlq_refs = max(_dlq_refs - 1, 0)
+    if _dlq_instance is not None and _dlq_refs == 0:
+        await _dlq_instance.close()
+        _dlq_instance = None
@@ -18,13 +18,14 @@ V2.1 Features:
 - Automatic retry with exponential backoff
 """
 
+import asyncio
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import uuid
 
 from .sqlite_db import SQLiteDB, get_db
 from .qdrant_db import QdrantDB, get_qdrant, QDRANT_AVAILABLE
-from .dead_letter_queue import DeadLetterQueue, get_dlq
+from .dead_letter_queue import DeadLetterQueue, close_dlq, get_dlq
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -56,6 +57,9 @@ class StorageEngine:
         # UCW pack import
         await engine.ingest_packs(packs, source="ucw_trade", source_id="wallet_xyz")
 
+        # Always close: it flushes failed writes buffered for the DLQ
+        await engine.close()
+
     V2 Features:
         - Dual-write to both Qdrant and sqlite-vec
         - Automatic fallback if one backend is unavailable
@@ -125,6 +129,10 @@ class StorageEngine:
             await self.qdrant.close()
         if self.sqlite_vec:
             await self.sqlite_vec.close()
+        if self.dlq:
+            # The DLQ is shared process-wide; this only drops our reference
+            self.dlq = None
+            await close_dlq()
 
     def _register_dlq_handlers(self):
         """Register retry handlers for the dead-letter queue."""
@@ -176,9 +184,14 @@ class StorageEngine:
         payload: Dict[str, Any],
         error: Exception
     ):
-        """Add a failed write operation to the dead-letter queue."""
+        """
+        Add a failed write operation to the dead-letter queue.
+
+        The entry is buffered and persisted in the background, so it is only
+        guaranteed to be on disk once close() has run.
+        """
         if self.dlq:
-            await self.dlq.add_failed_write(
+            await self.dlq.enqueue_failed_write(
                 operation=operation,
                 target=target,
                 payload=payload,
@@ -204,6 +217,17 @@ class StorageEngine:
             return {"error": "DLQ not available"}
         return await self.dlq.get_stats()
 
+    # --- Corpus Versions ---
+
+    async def corpus_versions(self) -> Dict[str, int]:
+        """
+        Write counters per collection ("findings", "outcomes", ...).
+
+        Maintained by SQLite triggers, so they move on writes from any engine
+        instance or process; missing collections have never been written.
+        """
+        return await self.sqlite.get_corpus_versions()
+
     # --- Session Operations ---
 
     async def store_session(
@@ -523,6 +547,35 @@ class StorageEngine:
 
     # --- Search Operations ---
 
+    async def embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embed a search query, sharing embeddings across processes via SQLite.
+
+        Returns None when Qdrant (and with it the embedder) is disabled.
+        """
+        if not self._qdrant_enabled or not query:
+            return None
+
+        cached = self.qdrant.get_cached_query_embedding(query)
+        if cached is not None:
+            return cached
+
+        try:
+            embedding = await self.sqlite.get_query_embedding(self.qdrant.query_embedding_key(query))
+        except Exception as e:
+            logger.debug(f"Query embedding lookup failed: {e}")
+            embedding = None
+        if embedding is not None:
+            self.qdrant.cache_query_embedding(query, embedding)
+            return embedding
+
+        embedding = await self.qdrant.embed_query_async(query)
+        try:
+            await self.sqlite.store_query_embedding(self.qdrant.query_embedding_key(query), embedding)
+        except Exception as e:
+            logger.debug(f"Failed to persist query embedding: {e}")
+        return embedding
+
     async def semantic_search(
         self,
         query: str,
@@ -651,6 +704,34 @@ class StorageEngine:
                 limit=limit
             )
 
+    async def multi_search(
+        self,
+        query: str,
+        specs: List[Dict[str, Any]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Run several collection searches for one query, embedding it once.
+
+        Each spec names a ``collection`` ("findings", "outcomes",
+        "cognitive_states", "error_patterns") plus that search's keyword
+        arguments. Results are returned in spec order.
+        """
+        if self._qdrant_enabled and query:
+            try:
+                # Warm the query-embedding cache so every search below reuses it
+                await self.embed_query(query)
+            except Exception:
+                pass
+
+        searches = []
+        for spec in specs:
+            params = dict(spec)
+            collection = params.pop("collection")
+            searches.append(getattr(self, f"search_{collection}")(query=query, **params))
+
+        return await asyncio.gather(*searches, return_exceptions=return_exceptions)
+
     # --- Lineage Operations ---
 
     async def add_lineage(
@@ -824,6 +905,17 @@ class StorageEngine:
         else:
             return await self.sqlite.get_cognitive_states(limit=limit)
 
+    async def join_outcomes_cognitive(
+        self,
+        window_minutes: float = 60,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Pair outcomes with their nearest cognitive state (single SQLite join)."""
+        return await self.sqlite.join_outcomes_cognitive(
+            window_minutes=window_minutes,
+            limit=limit
+        )
+
     # --- Error Pattern Operations ---
 
     async def store_error_pattern(self, error: Dict[str, Any]) -> str:
@@ -873,7 +965,8 @@ class StorageEngine:
         query: str,
         limit: int = 10,
         min_score: float = 0.5,
-        min_success_rate: Optional[float] = None
+        min_success_rate: Optional[float] = None,
+        filter_error_type: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Semantic search for error patterns."""
         if self._qdrant_enabled:
@@ -881,12 +974,14 @@ class StorageEngine:
                 query=query,
                 limit=limit,
                 min_score=min_score,
-                min_success_rate=min_success_rate
+                min_success_rate=min_success_rate,
+                filter_error_type=filter_error_type
             )
         else:
             return await self.sqlite.get_error_patterns(
                 limit=limit,
-                min_success_rate=min_success_rate
+                min_success_rate=min_success_rate,
+                error_type=filter_error_type
             )
 
     # --- Prediction Tracking (Phase 4: Calibration Loop) ---
@@ -895,6 +990,10 @@ class StorageEngine:
         """Store a prediction for later calibration."""
         return await self.sqlite.store_prediction(prediction)
 
+    async def store_predictions_batch(self, predictions: List[Dict[str, Any]]) -> int:
+        """Store multiple predictions in one write."""
+        return await self.sqlite.store_predictions_batch(predictions)
+
     async def update_prediction_outcome(
         self,
         prediction_id: str,
@@ -914,6 +1013,10 @@ class StorageEngine:
         """Get prediction accuracy metrics."""
         return await self.sqlite.get_prediction_accuracy(days=days)
 
+    async def get_prediction_signals(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Get signals and actual quality of resolved predictions."""
+        return await self.sqlite.get_prediction_signals(days=days)
+
     # --- Statistics ---
 
     async def get_stats(self) -> Dict[str, Any]:
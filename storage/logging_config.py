@@ -18,10 +18,23 @@ import logging
 import json
 import sys
 import os
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any
 from contextvars import ContextVar
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Naive UTC datetimes rendered as "...Z", matching isoformat() + "Z"; non-str
+# keys (e.g. ints in an ``extra`` dict) are stringified as json.dumps does
+ORJSON_LOG_OPTIONS = (
+    orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+) if ORJSON_AVAILABLE else 0
+
 # Context variables for request tracking
 request_id_ctx: ContextVar[str] = ContextVar('request_id', default='')
 session_id_ctx: ContextVar[str] = ContextVar('session_id', default='')
@@ -31,8 +44,10 @@ class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
+        # orjson serializes the datetime itself; stdlib json needs a string
+        now = datetime.utcnow()
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": now if ORJSON_AVAILABLE else now.isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -45,8 +60,9 @@ class StructuredFormatter(logging.Formatter):
             log_data["session_id"] = session_id
 
         # Add extra fields
-        if hasattr(record, 'extra_fields'):
-            log_data.update(record.extra_fields)
+        extra_fields = getattr(record, 'extra_fields', None)
+        if extra_fields:
+            log_data.update(extra_fields)
 
         # Add exception info
         if record.exc_info:
@@ -56,6 +72,8 @@ class StructuredFormatter(logging.Formatter):
         if record.levelno >= logging.ERROR:
             log_data["location"] = f"{record.pathname}:{record.lineno}"
 
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_data, option=ORJSON_LOG_OPTIONS).decode()
         return json.dumps(log_data)
 
 
@@ -71,10 +89,38 @@ class ConsoleFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
 
+    def __init__(self, *args, colors: Optional[bool] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Decide once whether to emit ANSI colors (only when stdout is a TTY)
+        if colors is None:
+            isatty = getattr(sys.stdout, 'isatty', None)
+            colors = bool(isatty and isatty())
+        self._colors_enabled = colors
+        # Padded (and colored) level labels, built once per level name
+        self._level_labels: Dict[str, str] = {
+            name: self._level_label(name) for name in self.COLORS
+        }
+        # (second, "HH:MM:SS") of the last record; strftime runs once a second
+        self._clock = (-1, "")
+
+    def _level_label(self, levelname: str) -> str:
+        if self._colors_enabled:
+            return f"{self.COLORS.get(levelname, '')}{levelname:8}{self.RESET}"
+        return f"{levelname:8}"
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        cached_second, hms = self._clock
+        if second != cached_second:
+            hms = time.strftime("%H:%M:%S", time.localtime(second))
+            self._clock = (second, hms)
+        return hms
+
     def format(self, record: logging.LogRecord) -> str:
         # Color the level name
-        color = self.COLORS.get(record.levelname, '')
-        level = f"{color}{record.levelname:8}{self.RESET}"
+        level = self._level_labels.get(record.levelname)
+        if level is None:
+            level = self._level_label(record.levelname)
 
         # Build prefix with context
         prefix_parts = []
@@ -95,7 +141,7 @@ class ConsoleFormatter(logging.Formatter):
         extra_str = f" ({', '.join(extras)})" if extras else ""
 
         # Build final message
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._timestamp(record.created)
         name = record.name.split('.')[-1][:15]  # Short module name
 
         return f"{timestamp} {level} {name:15} {prefix} {msg}{extra_str}"
@@ -105,7 +151,8 @@ class ContextLogger(logging.LoggerAdapter):
     """Logger adapter that adds context and extra fields."""
 
     def process(self, msg, kwargs):
-        extra = kwargs.get('extra', {})
+        # No default dict: most calls pass no extra and return untouched
+        extra = kwargs.get('extra')
 
         # Store extra fields for formatters
         if extra:
@@ -18,11 +18,212 @@ Usage:
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
+import contextlib
+import copy
+import functools
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime
 import math
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from .engine import get_engine
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Known peak hours, best first (fallback when there is no historical data)
+PEAK_HOURS = (20, 12, 2)
+
+# Typical energy level by cognitive mode
+MODE_ENERGY_MAP = {
+    "deep_night": 0.9, "peak": 0.8, "evening": 0.7,
+    "morning": 0.6, "dip": 0.5, "unknown": 0.5
+}
+
+# Mode preference used to recommend an optimal mode
+MODE_RANKING = {
+    "deep_night": 0.9, "peak": 0.8, "flow": 0.8,
+    "evening": 0.7, "focused": 0.7, "morning": 0.6,
+    "neutral": 0.5, "dip": 0.5, "distracted": 0.3
+}
+OPTIMAL_MODE = max(MODE_RANKING, key=MODE_RANKING.get)
+
+# Error patterns count as preventable when their solution works this often
+PREVENTABLE_SUCCESS_RATE = 0.7
+
+# Shared search for preventable errors; identical specs share cache entries
+PREVENTABLE_ERRORS_SEARCH = {
+    "collection": "error_patterns",
+    "limit": 10,
+    "min_score": 0.5,
+    "min_success_rate": PREVENTABLE_SUCCESS_RATE
+}
+
+# Signal weights used by _correlate (and reported by calibrate_weights)
+CORRELATION_WEIGHTS = {
+    "outcome_weight": 0.5,
+    "cognitive_weight": 0.3,
+    "research_weight": 0.15,
+    "error_weight": 0.05
+}
+
+# Signal names behind each weight; the error signal is a penalty
+WEIGHT_SIGNALS = (
+    ("outcome_weight", "outcome_score", 1.0),
+    ("cognitive_weight", "cognitive_alignment", 1.0),
+    ("research_weight", "research_availability", 1.0),
+    ("error_weight", "error_probability", -1.0),
+)
+
+# Resolved predictions needed before weights are fitted to them
+CALIBRATION_MIN_SAMPLES = 10
+
+# Tracking predictions are buffered and written in batches
+PREDICTION_FLUSH_SIZE = 64
+PREDICTION_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Semantic cache defaults (MeanCache-style: reuse results for near-identical intents)
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_TTL_SECONDS = 300.0
+
+# Whole-prediction cache for intent-only predictions (stricter threshold)
+PREDICTION_CACHE_MAX_ENTRIES = 1024
+PREDICTION_CACHE_THRESHOLD = 0.97
+
+# Memoized method results (invalidated by corpus writes or TTL)
+RESULT_CACHE_MAX_ENTRIES = 512
+RESULT_CACHE_TTL_SECONDS = 300.0
+
+
+class SemanticCache:
+    """
+    Bounded LRU of search results, matched by query-embedding similarity.
+
+    Entries are grouped by a cache key (search kind plus its filters) so a hit
+    is only possible between calls that asked the same question. Within a
+    group the query embedding is compared by cosine similarity; anything at or
+    above ``threshold`` reuses the stored result.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl_seconds: float = SEMANTIC_CACHE_TTL_SECONDS
+    ):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        # (cache_key, query) -> (unit embedding or None, result, stored_at)
+        self._entries: "OrderedDict[Tuple[Tuple, str], Tuple[Any, Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(embedding: Optional[Sequence[float]]) -> Any:
+        """Scale an embedding to unit length so a dot product is the cosine."""
+        if embedding is None:
+            return None
+        if NUMPY_AVAILABLE:
+            vec = np.asarray(embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(vec))
+            return vec / norm if norm else None
+        norm = math.sqrt(sum(x * x for x in embedding))
+        return [x / norm for x in embedding] if norm else None
+
+    def get(
+        self,
+        cache_key: Tuple,
+        query: str,
+        embedding: Optional[Sequence[float]] = None
+    ) -> Optional[Any]:
+        """Return a cached result for this query (or a near-identical one)."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        self._evict_expired(cutoff)
+
+        # Hits are moved to the back, so the front trim alone can miss stale
+        # entries; check each candidate's own age before returning it.
+        exact = self._entries.get((cache_key, query))
+        if exact is not None:
+            if exact[2] >= cutoff:
+                self._entries.move_to_end((cache_key, query))
+                self.hits += 1
+                return exact[1]
+            del self._entries[(cache_key, query)]
+
+        unit = self._normalize(embedding)
+        if unit is not None:
+            keys = []
+            vectors = []
+            for key, (vec, _result, stored_at) in self._entries.items():
+                if (key[0] == cache_key and stored_at >= cutoff
+                        and vec is not None and len(vec) == len(unit)):
+                    keys.append(key)
+                    vectors.append(vec)
+
+            if vectors:
+                if NUMPY_AVAILABLE:
+                    sims = np.dot(np.stack(vectors), unit)
+                    best = int(sims.argmax())
+                    best_sim = float(sims[best])
+                else:
+                    sims = [sum(a * b for a, b in zip(vec, unit)) for vec in vectors]
+                    best = max(range(len(sims)), key=sims.__getitem__)
+                    best_sim = sims[best]
+
+                if best_sim >= self.threshold:
+                    self._entries.move_to_end(keys[best])
+                    self.hits += 1
+                    return self._entries[keys[best]][1]
+
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        cache_key: Tuple,
+        query: str,
+        result: Any,
+        embedding: Optional[Sequence[float]] = None
+    ):
+        """Store a result, evicting the least recently used entry when full."""
+        key = (cache_key, query)
+        self._entries[key] = (self._normalize(embedding), result, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _evict_expired(self, cutoff: float):
+        """Trim expired entries from the front (least recently used first)."""
+        while self._entries:
+            key, (_vec, _result, stored_at) = next(iter(self._entries.items()))
+            if stored_at >= cutoff:
+                break
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every cached result."""
+        self._entries.clear()
+
+
+def ensure_initialized(method):
+    """Initialize the engine on first use of a public coroutine method."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if not self._initialized:
+            await self.initialize()
+        return await method(self, *args, **kwargs)
+    return wrapper
 
 
 class MetaLearningEngine:
@@ -42,23 +243,134 @@ class MetaLearningEngine:
     - Potential errors
     """
 
-    def __init__(self):
+    def __init__(self, semantic_cache: Optional[SemanticCache] = None):
         self.engine = None
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self.semantic_cache = semantic_cache or SemanticCache()
+        # Correlation weights; calibrate_weights() may refit them
+        self.weights: Dict[str, float] = dict(CORRELATION_WEIGHTS)
+        # Tracking predictions waiting for the next batched write
+        self._pending_predictions: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Finished intent-only predictions, matched by intent embedding
+        self._prediction_cache = SemanticCache(
+            max_entries=PREDICTION_CACHE_MAX_ENTRIES,
+            threshold=PREDICTION_CACHE_THRESHOLD
+        )
+        # Exact-key memo for whole method results (no embeddings involved)
+        self._result_cache = SemanticCache(
+            max_entries=RESULT_CACHE_MAX_ENTRIES,
+            ttl_seconds=RESULT_CACHE_TTL_SECONDS
+        )
 
     async def initialize(self):
-        """Initialize storage engine."""
+        """Initialize storage engine (safe to call concurrently)."""
         if self._initialized:
             return
 
-        self.engine = await get_engine()
-        self._initialized = True
+        async with self._init_lock:
+            if self._initialized:
+                return
+            self.engine = await get_engine()
+            self._initialized = True
 
     async def close(self):
-        """Close connections."""
+        """Flush buffered predictions and close connections."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
         if self.engine:
+            await self.flush_predictions()
             await self.engine.close()
 
+    async def flush_predictions(self) -> int:
+        """Write buffered tracking predictions now; returns how many were written."""
+        if not self._pending_predictions:
+            return 0
+
+        pending, self._pending_predictions = self._pending_predictions, []
+        try:
+            return await self.engine.store_predictions_batch(pending)
+        except Exception:
+            # Keep them for the next flush rather than dropping them
+            self._pending_predictions[:0] = pending
+            raise
+
+    async def _flush_predictions_later(self):
+        """Background flush once the buffer has aged PREDICTION_FLUSH_INTERVAL_SECONDS."""
+        await asyncio.sleep(PREDICTION_FLUSH_INTERVAL_SECONDS)
+        self._flush_task = None
+        try:
+            await self.flush_predictions()
+        except Exception as e:
+            logger.warning(f"Failed to flush tracked predictions: {e}")
+
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """Embed a query for cache matching (None when no embedder is available)."""
+        try:
+            return await self.engine.embed_query(query)
+        except Exception:
+            return None
+
+    async def _cached_search(self, kind: str, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Run ``engine.search_<kind>`` through the semantic cache.
+
+        Results are keyed by kind plus every filter argument, so e.g. a
+        ``limit=5`` lookup never answers a ``limit=10`` one.
+        """
+        results = await self._cached_multi_search(query, [{"collection": kind, **kwargs}])
+        return results[0]
+
+    async def _cached_multi_search(
+        self,
+        query: str,
+        specs: List[Dict[str, Any]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Run several searches for one query, serving what we can from the cache.
+
+        The query is embedded once; cache misses go to the engine together as
+        a single ``multi_search``. With ``return_exceptions`` a failed search
+        comes back as its exception instead of raising.
+        """
+        embedding = await self._embed_query(query)
+        versions = await self.engine.corpus_versions()
+
+        cache_keys = []
+        results: List[Any] = []
+        misses = []
+        for i, spec in enumerate(specs):
+            params = dict(spec)
+            kind = params.pop("collection")
+            # Include the write counter so new data invalidates old results
+            cache_key = (kind, versions.get(kind, 0)) + tuple(sorted(params.items()))
+            cache_keys.append(cache_key)
+            results.append(self.semantic_cache.get(cache_key, query, embedding))
+            if results[i] is None:
+                misses.append(i)
+
+        if misses:
+            fetched = await self.engine.multi_search(
+                query, [specs[i] for i in misses], return_exceptions=return_exceptions
+            )
+            for i, result in zip(misses, fetched):
+                if not isinstance(result, Exception):
+                    self.semantic_cache.put(cache_keys[i], query, result, embedding)
+                results[i] = result
+
+        # Callers annotate result dicts in place; keep the cached copies clean
+        return [
+            r if isinstance(r, Exception) else [dict(item) for item in r]
+            for r in results
+        ]
+
+    @ensure_initialized
     async def predict_session_outcome(
         self,
         intent: str,
@@ -84,44 +396,46 @@ class MetaLearningEngine:
                 "confidence": float (0-1)
             }
         """
-        if not self._initialized:
-            await self.initialize()
-
-        # 1. Find similar past sessions
-        outcome_matches = await self.engine.search_outcomes(
-            query=intent,
-            limit=10,
-            min_score=0.5
+        # With only an intent, the prediction depends on nothing but the intent
+        # and the corpus, so a near-identical earlier prediction can be reused
+        intent_only = not cognitive_state and not available_research
+        if intent_only:
+            versions = await self.engine.corpus_versions()
+            prediction_key = (
+                "prediction",
+                versions.get("outcomes", 0),
+                versions.get("error_patterns", 0),
+                versions.get("findings", 0),
+            )
+            intent_embedding = await self._embed_query(intent)
+            cached = self._prediction_cache.get(prediction_key, intent, intent_embedding)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        # Fan out the independent searches so latency is the slowest one,
+        # not the sum of all four; the intent searches share one embedding
+        specs = [
+            # 1. Find similar past sessions
+            {"collection": "outcomes", "limit": 10, "min_score": 0.5},
+            # 2. Predict potential errors (context-aware, preventable only)
+            PREVENTABLE_ERRORS_SEARCH,
+        ]
+        if not available_research:
+            # 3. Find relevant research
+            specs.append({"collection": "findings", "limit": 5, "min_score": 0.5})
+
+        intent_results, similar_states = await asyncio.gather(
+            self._cached_multi_search(intent, specs),
+            # 4. Similar cognitive states (only needed with a current state)
+            self._search_cognitive_states(cognitive_state)
         )
+        outcome_matches, potential_errors = intent_results[:2]
+        research_matches = intent_results[2] if not available_research else []
 
-        # 2. Analyze cognitive patterns
-        cognitive_score = await self._analyze_cognitive_match(
-            cognitive_state, outcome_matches
-        )
-
-        # 3. Find relevant research
-        research_matches = await self.engine.search_findings(
-            query=intent,
-            limit=5,
-            min_score=0.5
-        ) if not available_research else []
-
-        # 4. Predict potential errors (context-aware)
-        # Search for errors relevant to the intent
-        potential_errors = await self.engine.search_error_patterns(
-            query=intent,
-            limit=10,
-            min_score=0.5,
-            min_success_rate=0.7
-        )
+        cognitive_score = self._score_cognitive_match(cognitive_state, similar_states)
 
-        # Enhance with preventable errors (high success rate solutions)
-        if potential_errors:
-            # Filter to most relevant and preventable
-            potential_errors = [
-                e for e in potential_errors
-                if e.get("success_rate", 0) >= 0.7  # Only include if solution works
-            ][:5]  # Top 5
+        # The backend already applied min_success_rate; keep the top 5
+        potential_errors = potential_errors[:5]
 
         # 5. Compute composite prediction
         prediction = self._correlate(
@@ -133,6 +447,11 @@ class MetaLearningEngine:
             current_state=cognitive_state
         )
 
+        if intent_only:
+            self._prediction_cache.put(
+                prediction_key, intent, copy.deepcopy(prediction), intent_embedding
+            )
+
         return prediction
 
     async def _analyze_cognitive_match(
@@ -151,6 +470,34 @@ class MetaLearningEngine:
                 "energy_recommendation": str
             }
         """
+        similar_states = await self._search_cognitive_states(current_state)
+        return self._score_cognitive_match(current_state, similar_states)
+
+    async def _search_cognitive_states(
+        self,
+        current_state: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Find cognitive states similar to the current one (empty without a state)."""
+        if not current_state:
+            return []
+
+        # Build context string for semantic search
+        current_hour = current_state.get("hour", 12)
+        current_mode = current_state.get("mode", "unknown")
+        context = f"{current_mode} hour_{current_hour}"
+
+        return await self._cached_search(
+            "cognitive_states", context,
+            limit=20,
+            min_score=0.4
+        )
+
+    def _score_cognitive_match(
+        self,
+        current_state: Optional[Dict[str, Any]],
+        similar_states: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Score cognitive alignment against already-fetched similar states."""
         if not current_state:
             return {
                 "alignment_score": 0.5,
@@ -163,23 +510,11 @@ class MetaLearningEngine:
         current_mode = current_state.get("mode", "unknown")
         current_energy = current_state.get("energy_level", 0.5)
 
-        # Query cognitive states database for similar successful patterns
-        # Build context string for semantic search
-        context = f"{current_mode} hour_{current_hour}"
-
-        # Search for similar cognitive states
-        similar_states = await self.engine.search_cognitive_states(
-            query=context,
-            limit=20,
-            min_score=0.4
-        )
-
         if not similar_states:
             # Fall back to heuristics if no data
-            peak_hours = [20, 12, 2]
-            optimal_hour = min(peak_hours, key=lambda h: abs(h - current_hour))
+            optimal_hour = min(PEAK_HOURS, key=lambda h: abs(h - current_hour))
 
-            hour_distance = min(abs(current_hour - optimal_hour), 24 - abs(current_hour - optimal_hour))
+            hour_distance = _hour_distance(current_hour, optimal_hour)
             hour_alignment = 1.0 - (hour_distance / 12.0)
             mode_alignment = 1.0 if current_mode in ["peak", "deep_night"] else 0.5
 
@@ -190,35 +525,16 @@ class MetaLearningEngine:
                 "energy_recommendation": "Using heuristics (no historical data)"
             }
 
-        # Analyze energy levels at different hours for this mode
-        hour_energy_map = {}
-        for state in similar_states:
-            h = state.get("hour", 0)
-            energy = state.get("energy_level", 0.5)
-            if h not in hour_energy_map:
-                hour_energy_map[h] = []
-            hour_energy_map[h].append(energy)
-
         # Find optimal hour (highest average energy)
-        optimal_hour = current_hour
-        max_energy = 0
-        for h, energies in hour_energy_map.items():
-            avg_energy = sum(energies) / len(energies)
-            if avg_energy > max_energy:
-                max_energy = avg_energy
-                optimal_hour = h
+        optimal_hour = _peak_energy_hour(similar_states, default=current_hour)
 
         # Calculate alignment score
         # 1. Hour alignment (40%)
-        hour_distance = min(abs(current_hour - optimal_hour), 24 - abs(current_hour - optimal_hour))
+        hour_distance = _hour_distance(current_hour, optimal_hour)
         hour_alignment = 1.0 - (hour_distance / 12.0)
 
         # 2. Mode alignment (30%)
-        mode_energy_map = {
-            "deep_night": 0.9, "peak": 0.8, "evening": 0.7,
-            "morning": 0.6, "dip": 0.5, "unknown": 0.5
-        }
-        optimal_energy = mode_energy_map.get(current_mode, 0.5)
+        optimal_energy = MODE_ENERGY_MAP.get(current_mode, 0.5)
         mode_alignment = min(optimal_energy, 1.0)
 
         # 3. Energy level (30%)
@@ -231,14 +547,6 @@ class MetaLearningEngine:
             energy_alignment * 0.3
         )
 
-        # Determine optimal mode
-        mode_ranking = {
-            "deep_night": 0.9, "peak": 0.8, "flow": 0.8,
-            "evening": 0.7, "focused": 0.7, "morning": 0.6,
-            "neutral": 0.5, "dip": 0.5, "distracted": 0.3
-        }
-        optimal_mode = max(mode_ranking.keys(), key=lambda m: mode_ranking.get(m, 0.5))
-
         # Generate recommendation
         if alignment_score > 0.75:
             recommendation = "Excellent timing - high cognitive alignment"
@@ -252,7 +560,7 @@ class MetaLearningEngine:
         return {
             "alignment_score": alignment_score,
             "optimal_hour": optimal_hour,
-            "optimal_mode": optimal_mode,
+            "optimal_mode": OPTIMAL_MODE,
             "energy_recommendation": recommendation,
             "similar_states_found": len(similar_states)
         }
@@ -275,14 +583,23 @@ class MetaLearningEngine:
         - Research availability: 15%
         - Error probability: 5% (penalty)
         """
-        # 1. Outcome signal
+        # 1. Outcome signal (quality, similarity and successes in one pass)
         if outcome_matches:
-            avg_quality = sum(o.get("quality", 3) for o in outcome_matches) / len(outcome_matches)
-            avg_similarity = sum(o.get("score", 0.5) for o in outcome_matches) / len(outcome_matches)
+            n = len(outcome_matches)
+            quality_total = 0
+            similarity_total = 0
+            successes = 0
+            for o in outcome_matches:
+                quality_total += o.get("quality", 3)
+                similarity_total += o.get("score", 0.5)
+                if o.get("outcome") == "success":
+                    successes += 1
+            avg_quality = quality_total / n
+            avg_similarity = similarity_total / n
 
             # Weight by similarity
             weighted_quality = avg_quality * avg_similarity
-            success_rate = len([o for o in outcome_matches if o.get("outcome") == "success"]) / len(outcome_matches)
+            success_rate = successes / n
 
             outcome_score = (weighted_quality / 5.0) * 0.5 + success_rate * 0.5
         else:
@@ -291,22 +608,20 @@ class MetaLearningEngine:
 
         # 2. Cognitive signal
         alignment = cognitive_score.get("alignment_score", 0.5)
-        cognitive_weight = 0.3
 
         # 3. Research signal
         research_score = min(len(research_matches) / 5.0, 1.0) if research_matches else 0.5
-        research_weight = 0.15
 
         # 4. Error penalty
         error_probability = min(len(potential_errors) * 0.1, 0.3)  # Max 30% penalty
-        error_weight = 0.05
 
         # Composite score
+        weights = self.weights
         composite = (
-            outcome_score * 0.5 +
-            alignment * cognitive_weight +
-            research_score * research_weight -
-            error_probability * error_weight
+            outcome_score * weights["outcome_weight"] +
+            alignment * weights["cognitive_weight"] +
+            research_score * weights["research_weight"] -
+            error_probability * weights["error_weight"]
         )
 
         # Convert to quality prediction (1-5)
@@ -336,6 +651,7 @@ class MetaLearningEngine:
             }
         }
 
+    @ensure_initialized
     async def predict_optimal_time(
         self,
         intent: str,
@@ -360,8 +676,8 @@ class MetaLearningEngine:
             current_hour = datetime.now().hour
 
         # Find similar successful sessions
-        outcome_matches = await self.engine.search_outcomes(
-            query=intent,
+        outcome_matches = await self._cached_search(
+            "outcomes", intent,
             limit=20,
             min_score=0.4,
             filter_outcome="success",
@@ -370,8 +686,7 @@ class MetaLearningEngine:
 
         if not outcome_matches:
             # Default to peak hours
-            peak_hours = [20, 12, 2]
-            optimal = min(peak_hours, key=lambda h: abs(h - current_hour))
+            optimal = min(PEAK_HOURS, key=lambda h: abs(h - current_hour))
             return {
                 "optimal_hour": optimal,
                 "is_optimal_now": abs(current_hour - optimal) <= 1,
@@ -381,8 +696,7 @@ class MetaLearningEngine:
 
         # Analyze patterns (simplified - would use cognitive_states join in production)
         # For now, use known peak hours weighted by success
-        peak_hours = [20, 12, 2]
-        optimal = peak_hours[0]  # Default to 20:00 (your top peak)
+        optimal = PEAK_HOURS[0]  # Default to 20:00 (your top peak)
 
         is_optimal = abs(current_hour - optimal) <= 1
         wait_hours = (optimal - current_hour) % 24 if not is_optimal else 0
@@ -394,6 +708,7 @@ class MetaLearningEngine:
             "reasoning": f"Based on {len(outcome_matches)} similar successful sessions"
         }
 
+    @ensure_initialized
     async def predict_errors(
         self,
         intent: str,
@@ -409,30 +724,47 @@ class MetaLearningEngine:
         Returns:
             List of error patterns with prevention strategies
         """
-        if not self._initialized:
-            await self.initialize()
-
-        # Semantic search for relevant errors
-        errors = await self.engine.search_error_patterns(
-            query=intent,
-            limit=10,
-            min_score=0.5
+        # Same intent + same error corpus -> same answer
+        versions = await self.engine.corpus_versions()
+        memo_key = (
+            "predict_errors",
+            include_preventable_only,
+            versions.get("error_patterns", 0),
         )
+        cached = self._result_cache.get(memo_key, intent)
+        if cached is not None:
+            return [dict(e) for e in cached]
 
+        # Semantic search for relevant errors
         if include_preventable_only:
-            # Filter to errors with effective solutions
-            errors = [
-                e for e in errors
-                if e.get("success_rate", 0) >= 0.7
-            ]
+            # Only errors with effective solutions (filtered by the backend)
+            errors = await self._fetch_preventable_errors(intent)
+        else:
+            errors = await self._cached_search(
+                "error_patterns", intent,
+                limit=10,
+                min_score=0.5
+            )
 
         # Enrich with prevention guidance
         for error in errors:
-            error["prevention_available"] = error.get("success_rate", 0) >= 0.7
+            error["prevention_available"] = error.get("success_rate", 0) >= PREVENTABLE_SUCCESS_RATE
             error["severity"] = "high" if error.get("occurrences", 0) > 1000 else "medium"
 
-        return errors[:5]  # Top 5
+        errors = errors[:5]  # Top 5
+        self._result_cache.put(memo_key, intent, errors)
+        return [dict(e) for e in errors]
+
+    async def _fetch_preventable_errors(
+        self,
+        intent: str,
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Errors relevant to the intent whose known solution usually works."""
+        results = await self._cached_multi_search(intent, [PREVENTABLE_ERRORS_SEARCH])
+        return results[0][:limit]
 
+    @ensure_initialized
     async def get_prevention_strategies(
         self,
         error_type: str
@@ -451,44 +783,51 @@ class MetaLearningEngine:
                 "examples": List[str]
             }
         """
-        if not self._initialized:
-            await self.initialize()
+        versions = await self.engine.corpus_versions()
+        memo_key = ("prevention_strategies", versions.get("error_patterns", 0))
+        cached = self._result_cache.get(memo_key, error_type)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
-        # Search for all patterns of this type
+        # Search for patterns of this type (the backend filters on error_type)
         query = f"{error_type} error prevention"
-        patterns = await self.engine.search_error_patterns(
-            query=query,
+        patterns = await self._cached_search(
+            "error_patterns", query,
             limit=10,
-            min_score=0.3
+            min_score=0.3,
+            filter_error_type=error_type
         )
 
-        # Group by error type
         strategies = []
+        seen_solutions = set()
         examples = []
         success_rates = []
 
         for pattern in patterns:
-            if pattern.get("error_type") == error_type:
-                solution = pattern.get("solution", "")
-                if solution and solution not in strategies:
-                    strategies.append(solution)
+            solution = pattern.get("solution", "")
+            if solution and solution not in seen_solutions and len(strategies) < 5:
+                seen_solutions.add(solution)
+                strategies.append(solution)
 
-                context = pattern.get("context", "")
-                if context and len(examples) < 3:
-                    examples.append(context[:200])
+            context = pattern.get("context", "")
+            if context and len(examples) < 3:
+                examples.append(context[:200])
 
-                success_rates.append(pattern.get("success_rate", 0.0))
+            success_rates.append(pattern.get("success_rate", 0.0))
 
         avg_success_rate = sum(success_rates) / len(success_rates) if success_rates else 0.0
 
-        return {
+        result = {
             "error_type": error_type,
-            "strategies": strategies[:5],
+            "strategies": strategies,
             "success_rate": avg_success_rate,
             "examples": examples,
             "pattern_count": len(patterns)
         }
+        self._result_cache.put(memo_key, error_type, result)
+        return copy.deepcopy(result)
 
+    @ensure_initialized
     async def get_prediction_accuracy(self, days: int = 30) -> Dict[str, Any]:
         """
         Calculate prediction accuracy by comparing predictions to actual outcomes.
@@ -508,11 +847,10 @@ class MetaLearningEngine:
                 "period_days": int
             }
         """
-        if not self._initialized:
-            await self.initialize()
-
+        await self.flush_predictions()
         return await self.engine.get_prediction_accuracy(days=days)
 
+    @ensure_initialized
     async def store_prediction_for_tracking(
         self,
         intent: str,
@@ -527,23 +865,32 @@ class MetaLearningEngine:
             prediction: Prediction dictionary from predict_session_outcome()
             cognitive_state: Cognitive state at prediction time
 
+        The record is buffered and written in a batch with others (at most
+        PREDICTION_FLUSH_INTERVAL_SECONDS later, or on close()).
+
         Returns:
             Prediction ID for later outcome update
         """
-        if not self._initialized:
-            await self.initialize()
-
         prediction_record = {
+            "id": str(uuid.uuid4()),
             "intent": intent,
             "predicted_quality": prediction.get("predicted_quality"),
             "success_probability": prediction.get("success_probability"),
             "optimal_time": prediction.get("optimal_time"),
             "cognitive_state": cognitive_state or {},
+            "signals": prediction.get("signals"),
             "timestamp": datetime.now().isoformat()
         }
 
-        return await self.engine.store_prediction(prediction_record)
+        self._pending_predictions.append(prediction_record)
+        if len(self._pending_predictions) >= PREDICTION_FLUSH_SIZE:
+            await self.flush_predictions()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_predictions_later())
+
+        return prediction_record["id"]
 
+    @ensure_initialized
     async def update_prediction_with_outcome(
         self,
         prediction_id: str,
@@ -560,8 +907,8 @@ class MetaLearningEngine:
             actual_outcome: Actual outcome ('success', 'partial', 'failed')
             session_id: Session ID for reference
         """
-        if not self._initialized:
-            await self.initialize()
+        # The prediction may still be sitting in the write buffer
+        await self.flush_predictions()
 
         await self.engine.update_prediction_outcome(
             prediction_id=prediction_id,
@@ -570,6 +917,7 @@ class MetaLearningEngine:
             session_id=session_id
         )
 
+    @ensure_initialized
     async def temporal_join_cognitive_outcomes(
         self,
         window_hours: int = 1
@@ -578,6 +926,7 @@ class MetaLearningEngine:
         Join cognitive states with session outcomes based on temporal proximity.
 
         Finds session outcomes and their nearest cognitive states within a time window.
+        Outcomes without a state inside the window are left out.
 
         Args:
             window_hours: Time window in hours for matching (default: 1)
@@ -585,60 +934,25 @@ class MetaLearningEngine:
         Returns:
             List of {outcome, cognitive_state, time_diff_minutes} dictionaries
         """
-        if not self._initialized:
-            await self.initialize()
-
-        # Get all outcomes with timestamps
-        outcomes = await self.engine.search_outcomes(query="", limit=1000)
-
-        # Get all cognitive states
-        # Note: This is a simplified implementation
-        # In production, we'd use SQL JOIN with temporal constraints
-        joined = []
-
-        for outcome in outcomes:
-            outcome_time = outcome.get("timestamp", "")
-            if not outcome_time:
-                continue
-
-            try:
-                outcome_dt = datetime.fromisoformat(outcome_time.replace("Z", "+00:00"))
-
-                # Search for cognitive states near this time
-                # (In production, we'd use a proper temporal index query)
-                # For now, we'll search by hour and filter
-                hour = outcome_dt.hour
-                context = f"hour_{hour}"
-
-                nearby_states = await self.engine.search_cognitive_states(
-                    query=context,
-                    limit=20
-                )
-
-                # Find closest state within window
-                for state in nearby_states:
-                    state_time = state.get("timestamp", "")
-                    if not state_time:
-                        continue
-
-                    try:
-                        state_dt = datetime.fromisoformat(state_time.replace("Z", "+00:00"))
-                        time_diff = abs((outcome_dt - state_dt).total_seconds() / 60)  # minutes
-
-                        if time_diff <= (window_hours * 60):
-                            joined.append({
-                                "outcome": outcome,
-                                "cognitive_state": state,
-                                "time_diff_minutes": time_diff
-                            })
-                            break  # Take first match
-                    except:
-                        continue
-            except:
-                continue
-
-        return joined
-
+        # Reuse the last join until outcomes or cognitive states change
+        versions = await self.engine.corpus_versions()
+        memo_key = (
+            "temporal_join",
+            versions.get("outcomes", 0),
+            versions.get("cognitive_states", 0),
+        )
+        joined = self._result_cache.get(memo_key, str(window_hours))
+        if joined is None:
+            # One temporal range join in SQLite instead of a search per outcome
+            joined = await self.engine.join_outcomes_cognitive(
+                window_minutes=window_hours * 60,
+                limit=1000
+            )
+            self._result_cache.put(memo_key, str(window_hours), joined)
+
+        return [dict(row) for row in joined]
+
+    @ensure_initialized
     async def multi_vector_search(
         self,
         query: str,
@@ -662,14 +976,20 @@ class MetaLearningEngine:
                 "errors": [...]
             }
         """
-        if not self._initialized:
-            await self.initialize()
-
         # Parallel search across all dimensions
-        outcomes = await self.engine.search_outcomes(query=query, limit=limit)
-        cognitive = await self.engine.search_cognitive_states(query=query, limit=limit)
-        research = await self.engine.search_findings(query=query, limit=limit)
-        errors = await self.engine.search_error_patterns(query=query, limit=limit)
+        kinds = ("outcomes", "cognitive_states", "findings", "error_patterns")
+        results = await self._cached_multi_search(
+            query,
+            [{"collection": kind, "limit": limit} for kind in kinds],
+            return_exceptions=True
+        )
+
+        # One failing backend shouldn't sink the other dimensions
+        for i, (kind, result) in enumerate(zip(kinds, results)):
+            if isinstance(result, Exception):
+                logger.warning(f"multi_vector_search: {kind} search failed: {result}")
+                results[i] = []
+        outcomes, cognitive, research, errors = results
 
         return {
             "outcomes": outcomes,
@@ -679,12 +999,15 @@ class MetaLearningEngine:
             "total_results": len(outcomes) + len(cognitive) + len(research) + len(errors)
         }
 
+    @ensure_initialized
     async def calibrate_weights(self) -> Dict[str, float]:
         """
         Adjust correlation weights based on prediction accuracy.
 
-        Analyzes recent prediction performance and suggests optimal weights
-        for the correlation algorithm.
+        With NumPy and enough tracked predictions, fits the weights to actual
+        quality by least squares (clipped to >= 0, normalized to sum to 1) and
+        applies them to this engine. Otherwise suggests weights from recent
+        prediction accuracy.
 
         Returns:
             {
@@ -695,15 +1018,26 @@ class MetaLearningEngine:
                 "recommended_update": bool
             }
         """
-        accuracy = await self.get_prediction_accuracy(days=30)
-
         # Current weights (from _correlate method)
-        current_weights = {
-            "outcome_weight": 0.5,
-            "cognitive_weight": 0.3,
-            "research_weight": 0.15,
-            "error_weight": 0.05
-        }
+        current_weights = dict(self.weights)
+
+        # Fit the weights to observed quality when there is enough signal data
+        if NUMPY_AVAILABLE:
+            await self.flush_predictions()
+            samples = await self.engine.get_prediction_signals(days=30)
+            if len(samples) >= CALIBRATION_MIN_SAMPLES:
+                fitted = _fit_correlation_weights(samples)
+                if fitted is not None:
+                    changed = any(
+                        abs(fitted[name] - current_weights[name]) > 0.01
+                        for name in fitted
+                    )
+                    if changed:
+                        self.weights = fitted
+                    return {**fitted, "recommended_update": changed}
+
+        # Otherwise fall back to accuracy thresholds
+        accuracy = await self.get_prediction_accuracy(days=30)
 
         # If we have enough data and accuracy is poor, suggest adjustments
         if accuracy["total_predictions"] >= 10:
@@ -724,6 +1058,87 @@ class MetaLearningEngine:
         return {**current_weights, "recommended_update": False}
 
 
+def _fit_correlation_weights(samples: List[Dict[str, Any]]) -> Optional[Dict[str, float]]:
+    """
+    Least-squares fit of correlation weights to tracked predictions.
+
+    Solves ``signals @ w ~= (actual_quality - 1) / 4``, the composite score that
+    would have produced the actual quality. Returns None if no usable fit.
+    """
+    X = np.array(
+        [[sign * float(sample["signals"].get(key, 0.0)) for _, key, sign in WEIGHT_SIGNALS]
+         for sample in samples],
+        dtype=np.float64
+    )
+    y = (np.array([s["actual_quality"] for s in samples], dtype=np.float64) - 1.0) / 4.0
+
+    w, *_ = np.linalg.lstsq(X, y, rcond=None)
+    w = np.clip(w, 0.0, None)
+    total = float(w.sum())
+    if not total > 0:
+        return None
+    w /= total
+
+    return {name: round(float(v), 4) for (name, _, _), v in zip(WEIGHT_SIGNALS, w)}
+
+
+# Circular distance between clock hours, precomputed for the valid 0-23 range
+HOUR_DISTANCE = tuple(
+    tuple(min(abs(a - b), 24 - abs(a - b)) for b in range(24))
+    for a in range(24)
+)
+
+
+def _hour_distance(a: int, b: int) -> int:
+    """Hours between two clock hours going the short way round (0-12)."""
+    try:
+        if a >= 0 and b >= 0:
+            return HOUR_DISTANCE[a][b]
+    except (IndexError, TypeError):
+        pass
+    # Out-of-range or non-integer hours from caller-supplied state
+    diff = abs(a - b)
+    return min(diff, 24 - diff)
+
+
+def _peak_energy_hour(states: List[Dict[str, Any]], default: int) -> int:
+    """
+    Hour with the highest average energy across states.
+
+    Ties go to the hour seen first; ``default`` is returned when no hour has
+    positive average energy.
+    """
+    hours = [s.get("hour", 0) for s in states]
+    energies = [s.get("energy_level", 0.5) for s in states]
+
+    if NUMPY_AVAILABLE and all(type(h) is int and 0 <= h < 24 for h in hours):
+        hour_arr = np.fromiter(hours, dtype=np.int64, count=len(hours))
+        energy_arr = np.fromiter(energies, dtype=np.float64, count=len(energies))
+        counts = np.bincount(hour_arr, minlength=24)
+        sums = np.bincount(hour_arr, weights=energy_arr, minlength=24)
+        avg = np.where(counts > 0, sums / np.maximum(counts, 1), 0.0)
+        best = float(avg.max())
+        if best <= 0:
+            return default
+        # First state whose hour reaches the maximum, matching dict order
+        first = int(np.isin(hour_arr, np.flatnonzero(avg == best)).argmax())
+        return hours[first]
+
+    # Group energy by hour, then pick the best average
+    hour_energy_map: Dict[Any, List[float]] = {}
+    for h, energy in zip(hours, energies):
+        hour_energy_map.setdefault(h, []).append(energy)
+
+    optimal_hour = default
+    max_energy = 0
+    for h, hour_energies in hour_energy_map.items():
+        avg_energy = sum(hour_energies) / len(hour_energies)
+        if avg_energy > max_energy:
+            max_energy = avg_energy
+            optimal_hour = h
+    return optimal_hour
+
+
 # Convenience function
 async def get_meta_engine() -> MetaLearningEngine:
     """Get initialized meta-learning engine."""
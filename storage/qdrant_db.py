@@ -18,6 +18,7 @@ import asyncio
 import hashlib
 import json
 import os
+import threading
 import uuid
 from typing import Optional, List, Dict, Any
 from pathlib import Path
@@ -140,6 +141,9 @@ class QdrantDB:
         self._sbert_model: Optional[Any] = None
         self._use_sbert_fallback = False
         self._initialized = False
+        self._query_embed_cache: Dict[str, List[float]] = {}
+        # embed_query() runs on to_thread workers alongside the event loop
+        self._query_embed_lock = threading.Lock()
 
     def _check_dependencies(self):
         """Check if required dependencies are available."""
@@ -356,6 +360,35 @@ class QdrantDB:
             query: Search query text
             dimension: Output dimension (256, 512, 1024, or 1536 for Matryoshka)
         """
+        # Queries repeat far more often than documents, so remember them
+        cached = self.get_cached_query_embedding(query, dimension)
+        if cached is not None:
+            return cached
+
+        embedding = self._embed_query_uncached(query, dimension)
+        self.cache_query_embedding(query, embedding, dimension)
+        return embedding
+
+    def get_cached_query_embedding(self, query: str, dimension: int = EMBEDDING_DIM) -> Optional[List[float]]:
+        """Return the in-process embedding for a query, if one is cached."""
+        return self._query_embed_cache.get(f"{query}:{dimension}")
+
+    def cache_query_embedding(self, query: str, embedding: List[float], dimension: int = EMBEDDING_DIM):
+        """Remember a query embedding in-process (e.g. one loaded from disk)."""
+        with self._query_embed_lock:
+            if len(self._query_embed_cache) >= 1000:
+                # Drop the oldest entry so recent queries keep hitting
+                oldest = next(iter(self._query_embed_cache), None)
+                self._query_embed_cache.pop(oldest, None)
+            self._query_embed_cache[f"{query}:{dimension}"] = embedding
+
+    def query_embedding_key(self, query: str, dimension: int = EMBEDDING_DIM) -> str:
+        """Stable cache key for a query embedding under the active provider."""
+        model = SBERT_MODEL if self._use_sbert_fallback else EMBEDDING_MODEL
+        return f"{model}:{dimension}:{query}"
+
+    def _embed_query_uncached(self, query: str, dimension: int) -> List[float]:
+        """Embed a search query without consulting the query cache."""
         # Try Cohere first (if not in fallback mode)
         if not self._use_sbert_fallback and COHERE_AVAILABLE:
             try:
@@ -1160,12 +1193,17 @@ class QdrantDB:
         query: str,
         limit: int = 10,
         min_score: float = 0.5,
-        min_success_rate: Optional[float] = None
+        min_success_rate: Optional[float] = None,
+        filter_error_type: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Semantic search for error patterns."""
         embedding = await self.embed_query_async(query)
 
         conditions = []
+        if filter_error_type:
+            conditions.append(
+                FieldCondition(key="error_type", match=MatchValue(value=filter_error_type))
+            )
         if min_success_rate:
             conditions.append(
                 FieldCondition(key="success_rate", range=models.Range(gte=min_success_rate))
@@ -14,6 +14,7 @@ Uses aiosqlite for async operations and connection pooling.
 import aiosqlite
 import json
 import asyncio
+import struct
 import uuid
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -192,11 +193,19 @@ CREATE TABLE IF NOT EXISTS prediction_tracking (
     prediction_timestamp TEXT NOT NULL,
     outcome_timestamp TEXT,
     cognitive_state TEXT,  -- JSON snapshot of state at prediction time
+    signals TEXT,  -- JSON correlation signals behind the prediction
     error_magnitude REAL,  -- |predicted - actual| for quality
     success_match INTEGER,  -- 1 if prediction matched outcome, 0 otherwise
     created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Query embeddings shared across processes (key is model:dimension:query)
+CREATE TABLE IF NOT EXISTS query_embeddings (
+    key TEXT PRIMARY KEY,
+    embedding BLOB NOT NULL,  -- packed float32 vector
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_sessions_project ON sessions(project);
 CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status);
@@ -228,10 +237,12 @@ CREATE INDEX IF NOT EXISTS idx_outcomes_session ON session_outcomes(session_id);
 CREATE INDEX IF NOT EXISTS idx_outcomes_outcome ON session_outcomes(outcome);
 CREATE INDEX IF NOT EXISTS idx_outcomes_quality ON session_outcomes(quality);
 CREATE INDEX IF NOT EXISTS idx_outcomes_date ON session_outcomes(date);
+CREATE INDEX IF NOT EXISTS idx_outcomes_timestamp ON session_outcomes(timestamp);
 
 CREATE INDEX IF NOT EXISTS idx_cognitive_mode ON cognitive_states(mode);
 CREATE INDEX IF NOT EXISTS idx_cognitive_hour ON cognitive_states(hour);
 CREATE INDEX IF NOT EXISTS idx_cognitive_day ON cognitive_states(day);
+CREATE INDEX IF NOT EXISTS idx_cognitive_time ON cognitive_states(julianday(timestamp));
 
 CREATE INDEX IF NOT EXISTS idx_errors_type ON error_patterns(error_type);
 CREATE INDEX IF NOT EXISTS idx_errors_success ON error_patterns(success_rate);
@@ -283,6 +294,74 @@ CREATE TRIGGER IF NOT EXISTS sessions_au AFTER UPDATE ON sessions BEGIN
     INSERT INTO sessions_fts(sessions_fts, id, topic) VALUES('delete', old.id, old.topic);
     INSERT INTO sessions_fts(id, topic) VALUES (new.id, new.topic);
 END;
+
+-- Write counters per searchable collection. Triggers bump them on every
+-- insert/update/delete, so writes from any engine or process invalidate
+-- caches keyed on them.
+CREATE TABLE IF NOT EXISTS corpus_versions (
+    collection TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS findings_version_ai AFTER INSERT ON findings BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('findings', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS findings_version_au AFTER UPDATE ON findings BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('findings', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS findings_version_ad AFTER DELETE ON findings BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('findings', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS session_outcomes_version_ai AFTER INSERT ON session_outcomes BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('outcomes', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS session_outcomes_version_au AFTER UPDATE ON session_outcomes BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('outcomes', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS session_outcomes_version_ad AFTER DELETE ON session_outcomes BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('outcomes', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cognitive_states_version_ai AFTER INSERT ON cognitive_states BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('cognitive_states', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cognitive_states_version_au AFTER UPDATE ON cognitive_states BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('cognitive_states', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cognitive_states_version_ad AFTER DELETE ON cognitive_states BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('cognitive_states', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS error_patterns_version_ai AFTER INSERT ON error_patterns BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('error_patterns', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS error_patterns_version_au AFTER UPDATE ON error_patterns BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('error_patterns', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS error_patterns_version_ad AFTER DELETE ON error_patterns BEGIN
+    INSERT INTO corpus_versions (collection, version) VALUES ('error_patterns', 1)
+    ON CONFLICT(collection) DO UPDATE SET version = version + 1;
+END;
 """
 
 
@@ -316,6 +395,12 @@ class SQLiteDB:
         async with aiosqlite.connect(self.db_path) as db:
             await db.executescript(SCHEMA)
 
+            # Columns added after a table may already exist
+            cursor = await db.execute("PRAGMA table_info(prediction_tracking)")
+            columns = {row[1] for row in await cursor.fetchall()}
+            if "signals" not in columns:
+                await db.execute("ALTER TABLE prediction_tracking ADD COLUMN signals TEXT")
+
             # Check/update schema version
             cursor = await db.execute(
                 "SELECT version FROM schema_version ORDER BY version DESC LIMIT 1"
@@ -910,6 +995,58 @@ class SQLiteDB:
                 results.append(d)
             return results
 
+    async def join_outcomes_cognitive(
+        self,
+        window_minutes: float = 60,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Pair recent outcomes with their nearest cognitive state in one query.
+
+        Each outcome (newest first) is matched to the cognitive state whose
+        timestamp is closest to it, provided it falls within the window.
+        Outcomes with no state in range are omitted.
+        """
+        window_days = window_minutes / 1440.0
+        # Only (id, timestamp) of the recent outcomes is scanned and joined;
+        # full rows are looked up by primary key for the matched ones.
+        # MIN() with bare columns: SQLite fills c.* from the closest state row
+        query = """
+            SELECT o.*,
+                   c.id AS c__id, c.mode AS c__mode, c.energy_level AS c__energy_level,
+                   c.flow_score AS c__flow_score, c.hour AS c__hour, c.day AS c__day,
+                   c.predictions AS c__predictions, c.timestamp AS c__timestamp,
+                   MIN(ABS(julianday(r.timestamp) - julianday(c.timestamp))) * 1440 AS time_diff_minutes
+            FROM (SELECT id, timestamp FROM session_outcomes ORDER BY timestamp DESC LIMIT ?) r
+            JOIN cognitive_states c
+              ON julianday(c.timestamp)
+                 BETWEEN julianday(r.timestamp) - ? AND julianday(r.timestamp) + ?
+            JOIN session_outcomes o ON o.id = r.id
+            GROUP BY r.id
+            ORDER BY r.timestamp DESC
+        """
+
+        async with self.connection() as db:
+            cursor = await db.execute(query, (limit, window_days, window_days))
+            rows = await cursor.fetchall()
+            results = []
+            for row in rows:
+                outcome = {}
+                state = {}
+                for key in row.keys():
+                    if key.startswith("c__"):
+                        state[key[3:]] = row[key]
+                    elif key != "time_diff_minutes":
+                        outcome[key] = row[key]
+                outcome['models_used'] = json.loads(outcome['models_used']) if outcome['models_used'] else {}
+                state['predictions'] = json.loads(state['predictions']) if state['predictions'] else {}
+                results.append({
+                    "outcome": outcome,
+                    "cognitive_state": state,
+                    "time_diff_minutes": row["time_diff_minutes"]
+                })
+            return results
+
     # --- Cognitive State Operations ---
 
     async def store_cognitive_state(self, state: Dict[str, Any]) -> str:
@@ -1034,12 +1171,17 @@ class SQLiteDB:
     async def get_error_patterns(
         self,
         limit: int = 100,
-        min_success_rate: Optional[float] = None
+        min_success_rate: Optional[float] = None,
+        error_type: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get error patterns with filtering."""
         query = "SELECT * FROM error_patterns WHERE 1=1"
         params = []
 
+        if error_type:
+            query += " AND error_type = ?"
+            params.append(error_type)
+
         if min_success_rate:
             query += " AND success_rate >= ?"
             params.append(min_success_rate)
@@ -1052,33 +1194,81 @@ class SQLiteDB:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
+    # --- Corpus Versions ---
+
+    async def get_corpus_versions(self) -> Dict[str, int]:
+        """Trigger-maintained write counters per collection ("findings", "outcomes", ...)."""
+        async with self.connection() as db:
+            cursor = await db.execute("SELECT collection, version FROM corpus_versions")
+            return {row[0]: row[1] for row in await cursor.fetchall()}
+
+    # --- Query Embedding Cache ---
+
+    async def get_query_embedding(self, key: str, max_age_days: int = 30) -> Optional[List[float]]:
+        """Get a stored query embedding, ignoring entries older than max_age_days."""
+        async with self.connection() as db:
+            # created_at is UTC CURRENT_TIMESTAMP, so compare in SQL
+            cursor = await db.execute(
+                "SELECT embedding FROM query_embeddings WHERE key = ? AND created_at > datetime('now', ?)",
+                (key, f"-{max_age_days} days")
+            )
+            row = await cursor.fetchone()
+            if not row:
+                return None
+            blob = row[0]
+            return list(struct.unpack(f'{len(blob) // 4}f', blob))
+
+    async def store_query_embedding(self, key: str, embedding: List[float]):
+        """Store (or refresh) a query embedding."""
+        blob = struct.pack(f'{len(embedding)}f', *embedding)
+
+        async with self.connection() as db:
+            await db.execute(
+                """
+                INSERT OR REPLACE INTO query_embeddings (key, embedding, created_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                """,
+                (key, blob)
+            )
+            await db.commit()
+
     # --- Prediction Tracking (Phase 4: Calibration Loop) ---
 
     async def store_prediction(self, prediction: Dict[str, Any]) -> str:
         """Store a prediction for later calibration."""
         prediction_id = prediction.get("id", str(uuid.uuid4()))
+        await self.store_predictions_batch([{**prediction, "id": prediction_id}])
+        return prediction_id
+
+    async def store_predictions_batch(self, predictions: List[Dict[str, Any]]) -> int:
+        """Store multiple predictions in a single transaction."""
+        if not predictions:
+            return 0
 
         async with self.connection() as db:
-            await db.execute(
+            await db.executemany(
                 """
                 INSERT OR REPLACE INTO prediction_tracking
                 (id, intent, predicted_quality, predicted_success_probability,
-                 predicted_optimal_hour, cognitive_state, prediction_timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                 predicted_optimal_hour, cognitive_state, signals, prediction_timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    prediction_id,
-                    prediction.get("intent", ""),
-                    prediction.get("predicted_quality"),
-                    prediction.get("success_probability"),
-                    prediction.get("optimal_time"),
-                    json.dumps(prediction.get("cognitive_state", {})),
-                    prediction.get("timestamp", datetime.now().isoformat())
-                )
+                [
+                    (
+                        p.get("id", str(uuid.uuid4())),
+                        p.get("intent", ""),
+                        p.get("predicted_quality"),
+                        p.get("success_probability"),
+                        p.get("optimal_time"),
+                        json.dumps(p.get("cognitive_state", {})),
+                        json.dumps(p["signals"]) if p.get("signals") else None,
+                        p.get("timestamp", datetime.now().isoformat())
+                    )
+                    for p in predictions
+                ]
             )
             await db.commit()
-
-        return prediction_id
+            return len(predictions)
 
     async def update_prediction_outcome(
         self,
@@ -1131,6 +1321,26 @@ class SQLiteDB:
                 )
                 await db.commit()
 
+    async def get_prediction_signals(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Get signals and actual quality of resolved predictions (calibration input)."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+
+        async with self.connection() as db:
+            cursor = await db.execute(
+                """
+                SELECT signals, actual_quality FROM prediction_tracking
+                WHERE signals IS NOT NULL
+                AND actual_quality IS NOT NULL
+                AND prediction_timestamp >= ?
+                """,
+                (cutoff,)
+            )
+            rows = await cursor.fetchall()
+            return [
+                {"signals": json.loads(row[0]), "actual_quality": row[1]}
+                for row in rows
+            ]
+
     async def get_prediction_accuracy(self, days: int = 30) -> Dict[str, Any]:
         """Calculate prediction accuracy metrics."""
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()